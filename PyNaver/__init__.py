@@ -1,7 +1,23 @@
 from .api import *
+from .transport import Transport
+from .ratelimit import RateLimiter
+from .cache import ResponseCache, LRUCache, CoordinateCache, TranslationMemory
+from .retry import RetryPolicy, CircuitBreaker, CircuitOpenError
+from .metrics import Metrics
+from .cassette import Cassette, AsyncCassette, CassetteMissError
+from .sinks import JSONLSink, CSVSink, ParquetSink
+from .records import SearchRecord, SearchColumns
+from .aio import AsyncTransport, AsyncNaver, AsyncNaverCloudPlatform, AsyncMap
 from .config.info import __version__, __author__, __contact__, __github__
 
 __all__ = [
     "__version__", "__author__", "__contact__", "__github__",
     "Naver", "NaverCloudPlatform", "Map",
+    "Transport", "RateLimiter",
+    "RetryPolicy", "CircuitBreaker", "CircuitOpenError", "Metrics",
+    "Cassette", "AsyncCassette", "CassetteMissError",
+    "ResponseCache", "LRUCache", "CoordinateCache", "TranslationMemory",
+    "JSONLSink", "CSVSink", "ParquetSink",
+    "SearchRecord", "SearchColumns",
+    "AsyncTransport", "AsyncNaver", "AsyncNaverCloudPlatform", "AsyncMap",
 ]
@@ -0,0 +1,21 @@
+import importlib
+
+
+class LazyModule:
+    """
+    처음 속성에 접근할 때 import하는 모듈 대리 객체
+
+    Parameters
+    ----------
+    name : string
+        모듈 이름
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
@@ -0,0 +1,1002 @@
+import asyncio
+import time
+from collections import deque
+from urllib.parse import urlsplit
+import requests
+from .api import (Naver, NaverCloudPlatform, Map, _Checkpoint, _Enrichment, _address_queries,
+                  _anchor_chunks, _crawl_frame, _crawl_tiles, _datalab_records, _ensure_ok,
+                  _error_status, _geocode_frame, _geocode_record, _group_texts, _isochrone_grid,
+                  _isochrone_result, _pack_texts, _parse_json_ok, _rescale_on_anchor,
+                  _reverse_geocode_frame, _reverse_geocode_record, _route_chains, _route_legs,
+                  _route_matrices, _route_params, _search_columns, _search_key, _search_pages,
+                  _search_params, _split_period, _split_sentences, _split_tile, _stitch_windows,
+                  _store_geocode, _store_translations, _tile_params, _transit_duration,
+                  _transit_matrix, _transit_pairs, _translation_result, _translation_todo,
+                  _unique_coords, pd)
+from .records import RECORD_TYPES
+
+
+class AsyncTransport:
+    """
+    비동기 HTTP 전송 계층 클래스
+
+    httpx.AsyncClient의 커넥션 풀을 사용하여 하나의 이벤트 루프에서
+    많은 요청을 동시에 처리합니다.
+
+    Parameters
+    ----------
+    client : httpx.AsyncClient, optional
+        사용할 클라이언트 (미지정 시 새 클라이언트 생성)
+    max_connections : int, optional
+        최대 동시 연결 수 (미지정 시 기본 값: 100)
+    max_keepalive_connections : int, optional
+        유지할 keep-alive 연결 수 (미지정 시 기본 값: 20)
+    timeout : float, optional
+        요청 타임아웃(초)
+    rate_limiter : RateLimiter, optional
+        요청 전에 적용할 요청 제한
+    retry : RetryPolicy, optional
+        일시적 오류에 대한 재시도 정책
+    circuit_breaker : CircuitBreaker, optional
+        호스트별 회로 차단기
+    metrics : Metrics, optional
+        요청 계측
+    """
+
+    def __init__(self,
+                 client=None,
+                 max_connections=100,
+                 max_keepalive_connections=20,
+                 timeout=None,
+                 rate_limiter=None,
+                 retry=None,
+                 circuit_breaker=None,
+                 metrics=None,
+                 ):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "비동기 클라이언트를 사용하려면 httpx를 설치해야 합니다: pip install httpx")
+        if client is None:
+            limits = httpx.Limits(max_connections=max_connections,
+                                  max_keepalive_connections=max_keepalive_connections)
+            client = httpx.AsyncClient(limits=limits, timeout=timeout)
+        self.client = client
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.metrics = metrics
+        self._errors = (httpx.TransportError,)
+        self._failures = (httpx.HTTPError,)
+
+    async def request(self, method, url, **kwargs):
+        """
+        비동기 HTTP 요청
+
+        Parameters
+        ----------
+        method : string
+            HTTP 메서드
+        url : string
+            요청 URL
+        kwargs : dict
+            requests 형식의 요청 파라미터 (params, data, json, headers, timeout)
+
+        Returns
+        -------
+        Response
+            응답 객체
+        """
+        if isinstance(kwargs.get("data"), bytes):
+            kwargs["content"] = kwargs.pop("data")
+        if kwargs.get("params") is not None:
+            kwargs["params"] = {k: v for k, v in kwargs["params"].items()
+                                if v is not None}
+        host = urlsplit(url).hostname
+        attempt = 0
+        while True:
+            probe = self._before_request(host)
+            try:
+                if self.rate_limiter is not None:
+                    delay = self.rate_limiter.reserve(url)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                start = time.perf_counter()
+                res = await self.client.request(method, url, **kwargs)
+            except self._errors:
+                self._record(host, False)
+                self._observe(url, None, start)
+                if self.retry is None or not self.retry.should_retry(attempt):
+                    raise
+                delay = self.retry.backoff(attempt)
+            except self._failures:
+                self._record(host, False)
+                self._observe(url, None, start)
+                raise
+            except BaseException:
+                if probe:
+                    self.circuit_breaker.release(host)
+                raise
+            else:
+                self._record(host, res.status_code < 500)
+                self._observe(url, res, start)
+                if self.retry is None or not self.retry.should_retry(attempt, res):
+                    return res
+                delay = self.retry.backoff(attempt, res)
+            if self.metrics is not None:
+                self.metrics.retry(url)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _before_request(self, host):
+        if self.circuit_breaker is None:
+            return False
+        return self.circuit_breaker.before_request(host)
+
+    def _record(self, host, success):
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(host, success)
+
+    def _observe(self, url, res, start):
+        if self.metrics is not None:
+            self.metrics.observe(url, res, time.perf_counter() - start)
+
+    async def aclose(self):
+        """
+        클라이언트 종료
+        """
+        await self.client.aclose()
+
+
+async def _gather_limited(func, items, max_workers):
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+
+    async def run(item):
+        async with semaphore:
+            return await func(item)
+
+    return await asyncio.gather(*[run(item) for item in items])
+
+
+async def _imap_unordered(func, items, max_workers):
+    items = iter(items)
+    pending = {}
+
+    def submit():
+        for item in items:
+            pending[asyncio.ensure_future(func(item))] = item
+            return True
+        return False
+
+    for _ in range(max(1, max_workers)):
+        if not submit():
+            break
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = pending.pop(task)
+                yield item, task.result()
+                submit()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _request_errors():
+    # 요청 단위로 기록할 예외 (httpx 전송 오류, 응답 상태 오류)
+    import httpx
+    return httpx.HTTPError, requests.RequestException
+
+
+class _AsyncClient:
+    """
+    비동기 API 클라이언트 공통 클래스
+    """
+
+    async def _call(self, method, url, parse, cache=None, endpoint=None, **kwargs):
+        parse = self._parser(parse)
+        cache = cache or self.cache
+        key, hit = self._cache_lookup(cache, method, url, parse, kwargs)
+        if hit is not None:
+            return hit[0]
+        res = await self.transport.request(method, url, **kwargs)
+        result = parse(res)
+        self._cache_store(cache, key, url, kwargs, res, result, endpoint)
+        return result
+
+    async def batch(self, endpoint, params, max_workers=8):
+        """
+        엔드포인트 일괄 호출
+
+        같은 엔드포인트를 파라미터 목록으로 동시에 호출하고 결과를 입력 순서대로 반환합니다.
+
+        Parameters
+        ----------
+        endpoint : string
+            엔드포인트 이름 (메서드 이름과 같음, 예: search_blog, geocoding, sites_summary)
+        params : list
+            호출별 파라미터 목록 (dict, 또는 첫 번째 필수 파라미터 값)
+        max_workers : int, optional
+            동시 요청 수 (미지정 시 기본 값: 8)
+
+        Returns
+        -------
+        list
+            호출별 결과 (입력과 같은 순서)
+        """
+        self._endpoint(endpoint)
+        return await _gather_limited(lambda p: self._request(endpoint, p), list(params), max_workers)
+
+    async def aclose(self):
+        """
+        Transport 종료
+        """
+        await self.transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+
+class AsyncNaver(_AsyncClient, Naver):
+    """
+    네이버 OPEN API 비동기 클래스
+
+    Naver와 같은 단일 요청 메서드와 batch를 제공하며 각 메서드는 awaitable을 반환합니다.
+    iter_search는 async for로 순회하는 비동기 생성기이고, 여러 요청을 조합하는 다른
+    메서드(datalab_search_many, datalab_windowed, export_datalab, papago_n2mt_many,
+    collect_search, export_search)는 동기 클래스와 같은 결과를 반환하는 코루틴입니다.
+
+    Parameters
+    ----------
+    client_id : string
+        네이버 개발자 센터에서 발급받은 클라이언트 ID
+    client_secret : string
+        네이버 개발자 센터에서 발급받은 클라이언트 SECRET
+    transport : AsyncTransport, optional
+        비동기 HTTP 전송 계층 (미지정 시 새로 생성)
+    client : httpx.AsyncClient, optional
+        사용할 클라이언트 (transport 미지정 시 적용)
+    cache : ResponseCache, optional
+        응답 캐시
+    raw : bool, optional
+        DataFrame 대신 파싱한 JSON(list, dict)을 반환할지 여부 (pandas를 import하지 않음)
+    """
+
+    def __init__(self, client_id, client_secret, transport=None, client=None, cache=None, raw=False):
+        if transport is None:
+            transport = AsyncTransport(client=client)
+        super().__init__(client_id, client_secret, transport=transport, cache=cache, raw=raw)
+
+    async def datalab_search_many(self, startDate, endDate, timeUnit, keywordGroups, anchor=None, chunk_size=5, max_workers=4, **kwargs):
+        """
+        네이버 통합 검색어 트렌드 대량 비동기 조회
+
+        Parameters
+        ----------
+        startDate : string
+            조회 시작일
+        endDate : string
+            조회 종료일
+        timeUnit : string
+            조회 기간
+        keywordGroups : list
+            키워드 그룹 (개수 제한 없음)
+        anchor : string or dict, OPTIONAL
+            기준 그룹의 groupName 또는 키워드 그룹 (미지정 시 첫 번째 그룹)
+        chunk_size : int, OPTIONAL
+            요청당 키워드 그룹 수 (기준 그룹 포함, 최대 5) (미지정 시 기본 값: 5)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 4)
+        kwargs : dict
+            그 외 파라미터
+
+        Returns
+        -------
+        DataFrame
+            키워드 그룹별 트렌드 (날짜 인덱스, 전체 최댓값 100 기준)
+        """
+        name, chunks = _anchor_chunks(keywordGroups, anchor, chunk_size)
+        client = self.as_raw(False)
+
+        async def fetch(groups):
+            return _ensure_ok(await client.datalab_search(startDate, endDate, timeUnit, groups, **kwargs))
+
+        frames = await _gather_limited(fetch, chunks, max_workers)
+        merged = _rescale_on_anchor(frames, name)
+        return merged[[g["groupName"] for g in keywordGroups]]
+
+    async def datalab_windowed(self, name, startDate, endDate, timeUnit, *args, window_days=365, overlap_days=28, max_workers=4, **kwargs):
+        """
+        데이터랩 장기간 비동기 조회
+
+        Parameters
+        ----------
+        name : string
+            데이터랩 메서드 이름에서 datalab_ 이후 부분 (예: search, shopping_categories)
+        startDate : string
+            조회 시작일
+        endDate : string
+            조회 종료일
+        timeUnit : string
+            구간 단위 (date만 지원)
+        args : list
+            메서드의 나머지 위치 인자 (keywordGroups 또는 category, keyword)
+        window_days : int, OPTIONAL
+            요청당 조회 기간(일) (미지정 시 기본 값: 365)
+        overlap_days : int, OPTIONAL
+            인접 구간이 겹치는 기간(일, 1 이상) (미지정 시 기본 값: 28)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 4)
+        kwargs : dict
+            그 외 파라미터
+
+        Returns
+        -------
+        DataFrame
+            트렌드 (날짜 인덱스, 전체 최댓값 100 기준)
+        """
+        if timeUnit != "date":
+            raise ValueError(f"datalab_windowed는 timeUnit='date'만 지원합니다: {timeUnit}")
+        method = getattr(self.as_raw(False), f"datalab_{name}")
+        windows = _split_period(startDate, endDate, window_days, overlap_days)
+
+        async def fetch(window):
+            return _ensure_ok(await method(window[0], window[1], timeUnit, *args, **kwargs))
+
+        return _stitch_windows(await _gather_limited(fetch, windows, max_workers))
+
+    async def export_datalab(self, name, jobs, sink, max_workers=4):
+        """
+        데이터랩 결과 비동기 스트리밍 내보내기
+
+        Parameters
+        ----------
+        name : string
+            데이터랩 메서드 이름에서 datalab_ 이후 부분 (예: search, shopping_categories)
+        jobs : dict
+            요청 키별 메서드 파라미터 (dict)
+        sink : JSONLSink or CSVSink or ParquetSink
+            내보내기 대상
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 4)
+
+        Returns
+        -------
+        int
+            이번 실행에서 기록한 행 수
+        """
+        method = getattr(self.as_raw(False), f"datalab_{name}")
+        todo = [key for key in jobs if f"datalab:{name}:{key}" not in sink.done]
+
+        async def fetch(key):
+            return _ensure_ok(await method(output="numpy", **jobs[key]))
+
+        rows = 0
+        async for key, result in _imap_unordered(fetch, todo, max_workers):
+            records = _datalab_records(key, *result)
+            sink.write(f"datalab:{name}:{key}", records)
+            rows += len(records)
+        return rows
+
+    async def papago_n2mt_many(self, source, target, texts, max_chars=5000, memory=None, max_workers=4, **kwargs):
+        """
+        Papago 대량 비동기 번역
+
+        Parameters
+        ----------
+        source : string
+            번역할 언어
+        target : string
+            번역될 언어
+        texts : list or Series
+            번역할 텍스트 목록
+        max_chars : int, OPTIONAL
+            요청당 최대 글자 수 (미지정 시 기본 값: 5000)
+        memory : TranslationMemory, OPTIONAL
+            번역 메모리 (지정 시 이미 번역한 텍스트는 요청하지 않고, 묶음이 번역될 때마다 저장)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 4)
+        kwargs : dict
+            그 외 파라미터
+
+        Returns
+        -------
+        list or Series
+            번역된 텍스트 (입력과 같은 순서)
+        """
+        series, texts, done, todo = _translation_todo(source, target, texts, memory)
+        errors = _request_errors()
+
+        async def translate(batch):
+            try:
+                text = _ensure_ok(await self.papago_n2mt(source, target, "\n".join(batch), **kwargs))
+                parts = text.split("\n")
+                if len(parts) == len(batch):
+                    return dict(zip(batch, parts))
+                return {t: _ensure_ok(await self.papago_n2mt(source, target, t, **kwargs)) for t in batch}
+            except errors as e:
+                return e
+
+        error = None
+        async for _, translated in _imap_unordered(translate, _pack_texts(todo, max_chars), max_workers):
+            error = _store_translations(source, target, done, memory, translated, error)
+        if error is not None:
+            raise error
+        return _translation_result(series, texts, done)
+
+    async def iter_search(self, kind, query, display=100, limit=1000, prefetch=2, output="frame", **kwargs):
+        """
+        검색 결과 페이지 비동기 순회
+
+        다음 페이지를 task로 미리 요청하면서 페이지별 검색 결과를 반환합니다.
+        async for로 순회합니다.
+
+        Parameters
+        ----------
+        kind : string
+            검색 종류 (blog, news, book, encyc, movie, cafearticle, kin, webkr, image, local, shop, doc)
+        query : string
+            검색어
+        display : int, OPTIONAL
+            페이지당 결과 수 (미지정 시 기본 값: 100)
+        limit : int, OPTIONAL
+            최대 결과 수 (미지정 시 기본 값: 1000)
+        prefetch : int, OPTIONAL
+            미리 요청할 페이지 수 (미지정 시 기본 값: 2)
+        output : string, OPTIONAL
+            반환 형식 (frame: DataFrame, records: 검색 종류별 SearchRecord 목록) (미지정 시 기본 값: frame)
+        kwargs : dict
+            그 외 파라미터
+
+        Yields
+        ------
+        DataFrame
+            페이지별 검색 결과 (raw 모드에서는 list, output="records"이면 SearchRecord 목록)
+        """
+        if output not in ("frame", "records"):
+            raise ValueError(f"지원하지 않는 반환 형식입니다: {output}")
+        async for items in self._iter_search_pages(kind, query, display, limit, prefetch, **kwargs):
+            if output == "records":
+                yield [RECORD_TYPES[kind].from_dict(item) for item in items]
+            else:
+                yield items if self.raw else pd.DataFrame(items)
+
+    async def collect_search(self, kind, query, display=100, limit=1000, prefetch=2, output="frame", **kwargs):
+        """
+        검색 결과 전체 비동기 수집
+
+        Parameters
+        ----------
+        kind : string
+            검색 종류 (blog, news, book, encyc, movie, cafearticle, kin, webkr, image, local, shop, doc)
+        query : string
+            검색어
+        display : int, OPTIONAL
+            페이지당 결과 수 (미지정 시 기본 값: 100)
+        limit : int, OPTIONAL
+            최대 결과 수 (미지정 시 기본 값: 1000)
+        prefetch : int, OPTIONAL
+            미리 요청할 페이지 수 (미지정 시 기본 값: 2)
+        output : string or SearchColumns, OPTIONAL
+            반환 형식 (frame: DataFrame, records: SearchRecord 목록, columns: SearchColumns,
+            SearchColumns 객체: 해당 객체에 이어 담음) (미지정 시 기본 값: frame)
+        kwargs : dict
+            그 외 파라미터
+
+        Returns
+        -------
+        DataFrame
+            검색 결과 (raw 모드에서는 list, output에 따라 SearchRecord 목록 또는 SearchColumns)
+        """
+        columns = _search_columns(kind, output)
+        if columns is not None:
+            async for page in self._iter_search_pages(kind, query, display, limit, prefetch, **kwargs):
+                columns.extend(page)
+            return list(columns.records()) if output == "records" else columns
+        items = []
+        async for page in self._iter_search_pages(kind, query, display, limit, prefetch, **kwargs):
+            items.extend(page)
+        return items if self.raw else pd.DataFrame(items)
+
+    async def export_search(self, kind, query, sink, display=100, limit=1000, prefetch=2, **kwargs):
+        """
+        검색 결과 비동기 스트리밍 내보내기
+
+        Parameters
+        ----------
+        kind : string
+            검색 종류 (blog, news, book, encyc, movie, cafearticle, kin, webkr, image, local, shop, doc)
+        query : string
+            검색어
+        sink : JSONLSink or CSVSink or ParquetSink
+            내보내기 대상
+        display : int, OPTIONAL
+            페이지당 결과 수 (미지정 시 기본 값: 100)
+        limit : int, OPTIONAL
+            최대 결과 수 (미지정 시 기본 값: 1000)
+        prefetch : int, OPTIONAL
+            미리 요청할 페이지 수 (미지정 시 기본 값: 2)
+        kwargs : dict
+            그 외 파라미터
+
+        Returns
+        -------
+        int
+            이번 실행에서 기록한 행 수
+        """
+        start = 1
+        while _search_key(kind, query, display, start, kwargs) in sink.done:
+            start += display
+        rows = 0
+        async for items in self._iter_search_pages(kind, query, display, limit, prefetch, first=start, **kwargs):
+            sink.write(_search_key(kind, query, display, start, kwargs), items)
+            rows += len(items)
+            start += display
+        return rows
+
+    async def _iter_search_pages(self, kind, query, display, limit, prefetch, first=1, **kwargs):
+        url, pages = _search_pages(kind, display, limit, first)
+
+        async def fetch(start, count):
+            params = _search_params(query, start, count, kwargs)
+            return await self._call("GET", url, _parse_json_ok, endpoint=f"search_{kind}",
+                                    headers=self.headers, params=params)
+
+        pending = deque()
+        remaining = iter(pages)
+        total = None
+
+        def submit():
+            page = next(remaining, None)
+            if page is not None and (total is None or page[0] <= total):
+                pending.append((page[1], asyncio.ensure_future(fetch(*page))))
+
+        try:
+            for _ in range(max(1, prefetch)):
+                submit()
+            while pending:
+                count, task = pending.popleft()
+                data = await task
+                total = data.get("total", total)
+                items = data["items"]
+                yield items
+                if len(items) < count:
+                    break
+                submit()
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+
+class AsyncNaverCloudPlatform(_AsyncClient, NaverCloudPlatform):
+    """
+    네이버 클라우드 플랫폼 OPEN API 비동기 클래스
+
+    NaverCloudPlatform과 같은 단일 요청 메서드와 batch를 제공하며 각 메서드는 awaitable을 반환합니다.
+    여러 요청을 조합하는 메서드(geocode_many, reverse_geocode_many, route_matrix, clova_summary_long,
+    clova_summary_many)도 동기 클래스와 같은 결과를 반환하는 코루틴입니다.
+
+    Parameters
+    ----------
+    client_id : string
+        네이버 클라우드 플랫폼에서 발급받은 클라이언트 ID
+    client_secret : string
+        네이버 클라우드 플랫폼에서 발급받은 클라이언트 SECRET
+    transport : AsyncTransport, optional
+        비동기 HTTP 전송 계층 (미지정 시 새로 생성)
+    client : httpx.AsyncClient, optional
+        사용할 클라이언트 (transport 미지정 시 적용)
+    cache : ResponseCache, optional
+        응답 캐시
+    coords_cache : CoordinateCache, optional
+        reverse_geocoding 전용 좌표 양자화 LRU 캐시
+    raw : bool, optional
+        DataFrame 대신 파싱한 JSON(list, dict)을 반환할지 여부 (pandas를 import하지 않음)
+    """
+
+    def __init__(self, client_id, client_secret, transport=None, client=None, cache=None, coords_cache=None, raw=False):
+        if transport is None:
+            transport = AsyncTransport(client=client)
+        super().__init__(client_id, client_secret, transport=transport, cache=cache,
+                         coords_cache=coords_cache, raw=raw)
+
+    async def geocode_many(self, addresses, max_workers=8, checkpoint=None, progress=None, **kwargs):
+        """
+        지오코딩 대량 비동기 실행
+
+        Parameters
+        ----------
+        addresses : list or Series
+            주소 목록
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+        checkpoint : string, OPTIONAL
+            진행 상황을 기록할 JSONL 파일 경로 (다시 실행하면 완료된 주소는 건너뜀)
+        progress : callable, OPTIONAL
+            주소 하나를 처리할 때마다 (완료 수, 전체 수)로 호출되는 함수
+        kwargs : dict
+            그 외 파라미터
+
+        Returns
+        -------
+        DataFrame
+            주소별 결과 (query, x, y, address, status)
+        """
+        index, queries, normalized = _address_queries(addresses)
+        state = _Checkpoint(checkpoint)
+        todo = [q for q in dict.fromkeys(normalized) if q and q not in state.done]
+        total = len(todo)
+        errors = _request_errors()
+
+        async def geocode(query):
+            try:
+                return _geocode_record(await self.geocoding(query, **kwargs))
+            except errors as e:
+                return {"status": f"ERROR: {type(e).__name__}"}
+
+        count = 0
+        async for query, record in _imap_unordered(geocode, todo, max_workers):
+            _store_geocode(state, query, record)
+            count += 1
+            if progress is not None:
+                progress(count, total)
+        return _geocode_frame(index, queries, normalized, state.done)
+
+    async def reverse_geocode_many(self, lon, lat, orders="legalcode,admcode,addr,roadaddr", max_workers=8, precision=7, **kwargs):
+        """
+        리버스 지오코딩 대량 비동기 실행
+
+        Parameters
+        ----------
+        lon : array-like
+            경도 배열
+        lat : array-like
+            위도 배열
+        orders : string, OPTIONAL
+            변환 작업 이름 (미지정 시 기본 값: legalcode,admcode,addr,roadaddr)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+        precision : int, OPTIONAL
+            좌표 소수점 자릿수 (미지정 시 기본 값: 7)
+        kwargs : dict
+            그 외 파라미터
+
+        Returns
+        -------
+        DataFrame
+            좌표별 결과 (lon, lat, status, {order}_code, {order}_area1~4 등)
+        """
+        lon, lat, unique, inverse = _unique_coords(lon, lat, precision)
+        errors = _request_errors()
+
+        async def reverse(c):
+            try:
+                return _reverse_geocode_record(await self.reverse_geocoding(c, orders=orders, **kwargs))
+            except errors as e:
+                return {"status": f"ERROR: {type(e).__name__}"}
+
+        records = await _gather_limited(reverse, unique, max_workers)
+        return _reverse_geocode_frame(records, inverse, lon, lat)
+
+
+    async def route_matrix(self, origins, destinations, api="directions5", option="trafast", pack=False, max_workers=8, **kwargs):
+        """
+        출발지-도착지 행렬 비동기 조회
+
+        Parameters
+        ----------
+        origins : list
+            출발지 좌표 목록 ("경도,위도" 또는 (경도, 위도))
+        destinations : list
+            도착지 좌표 목록 ("경도,위도" 또는 (경도, 위도))
+        api : string, OPTIONAL
+            사용할 API (directions5, directions15) (미지정 시 기본 값: directions5)
+        option : string, OPTIONAL
+            경로 조회 옵션 (미지정 시 기본 값: trafast)
+        pack : bool, OPTIONAL
+            필요한 쌍을 경유지로 이어 한 번의 요청으로 여러 구간을 조회할지 여부 (미지정 시 기본 값: False)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+        kwargs : dict
+            그 외 파라미터
+
+        Returns
+        -------
+        tuple
+            (소요 시간 행렬(초), 거리 행렬(m), 실패 여부 행렬)
+        """
+        origins, destinations, chains = _route_chains(origins, destinations, api, pack)
+        method = getattr(self, api)
+        errors = _request_errors()
+
+        async def route(chain):
+            try:
+                res = await method(chain[0], chain[-1], **_route_params(chain, option, kwargs))
+            except errors:
+                return None
+            return _route_legs(res, option, len(chain) - 1)
+
+        return _route_matrices(origins, destinations, chains, await _gather_limited(route, chains, max_workers))
+
+    async def clova_summary_long(self, content, title=None, max_chars=2000, fanout=5, max_depth=3, max_workers=4, **kwargs):
+        """
+        Clova Summary 긴 문서 비동기 요약
+
+        Parameters
+        ----------
+        content : string
+            요약할 내용
+        title : string, OPTIONAL
+            요약할 제목
+        max_chars : int, OPTIONAL
+            요청당 최대 글자 수 (미지정 시 기본 값: 2000)
+        fanout : int, OPTIONAL
+            한 번에 다시 요약할 부분 요약 수 (미지정 시 기본 값: 5)
+        max_depth : int, OPTIONAL
+            최대 요약 단계 수 (초과 시 남은 부분 요약을 이어 붙여 반환) (미지정 시 기본 값: 3)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 4)
+        kwargs : dict
+            clova_summary 파라미터 (language, model, tone, summaryCount)
+
+        Returns
+        -------
+        dict
+            요약 결과 ({"summary": 요약문})
+        """
+        async def summarize(text):
+            return _ensure_ok(await self.clova_summary(text, title=title, **kwargs))["summary"]
+
+        if len(content) <= max_chars:
+            return {"summary": await summarize(content)}
+        parts = _split_sentences(content, max_chars)
+        for _ in range(max_depth):
+            parts = await _gather_limited(summarize, parts, max_workers)
+            if len(parts) == 1:
+                return {"summary": parts[0]}
+            parts = ["\n".join(group) for group in _group_texts(parts, fanout, max_chars)]
+        return {"summary": "\n".join(parts)}
+
+    async def clova_summary_many(self, contents, max_workers=4, **kwargs):
+        """
+        Clova Summary 대량 비동기 요약
+
+        Parameters
+        ----------
+        contents : list
+            요약할 문서 목록
+        max_workers : int, OPTIONAL
+            동시에 요약할 문서 수 (미지정 시 기본 값: 4)
+        kwargs : dict
+            clova_summary_long 파라미터
+
+        Returns
+        -------
+        list
+            문서별 요약 결과 ({"summary": 요약문})
+        """
+        kwargs["max_workers"] = 1
+        return await _gather_limited(lambda c: self.clova_summary_long(c, **kwargs), list(contents), max_workers)
+
+class AsyncMap(_AsyncClient, Map):
+    """
+    네이버 지도 API 비동기 클래스
+
+    Map과 같은 단일 요청 메서드와 batch를 제공하며 각 메서드는 awaitable을 반환합니다.
+    iter_enriched_places는 async for로 순회하는 비동기 생성기이고, 여러 요청을 조합하는
+    다른 메서드(enrich_places, crawl_places, transit_matrix, transit_isochrone)는 동기 클래스와
+    같은 결과를 반환하는 코루틴입니다.
+
+    Parameters
+    ----------
+    transport : AsyncTransport, optional
+        비동기 HTTP 전송 계층 (미지정 시 새로 생성)
+    client : httpx.AsyncClient, optional
+        사용할 클라이언트 (transport 미지정 시 적용)
+    cache : ResponseCache, optional
+        응답 캐시
+    transit_cache : ResponseCache or LRUCache, optional
+        대중교통 길찾기 전용 캐시 (미지정 시 cache, cache도 없으면 캐시하지 않음)
+        (실시간 운행 정보가 바뀌므로 LRUCache(ttl=600)처럼 보관 시간을 지정)
+    raw : bool, optional
+        DataFrame 대신 파싱한 JSON(list, dict)을 반환할지 여부 (pandas를 import하지 않음)
+    """
+
+    def __init__(self, transport=None, client=None, cache=None, transit_cache=None, raw=False):
+        if transport is None:
+            transport = AsyncTransport(client=client)
+        super().__init__(transport=transport, cache=cache, transit_cache=transit_cache, raw=raw)
+
+    async def iter_enriched_places(self, queries, max_workers=8, **kwargs):
+        """
+        장소 검색 결과 요약 정보 비동기 순회
+
+        async for로 순회합니다.
+
+        Parameters
+        ----------
+        queries : list
+            검색어 목록
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+        kwargs : dict
+            search 파라미터
+
+        Yields
+        ------
+        dict
+            검색 결과와 장소 요약(summary)을 합친 장소 정보
+        """
+        errors = _request_errors()
+
+        async def search(query):
+            try:
+                return await self._request("search", dict(kwargs, query=query), _parse_json_ok), "OK"
+            except errors as e:
+                return None, _error_status(e)
+
+        async def summarize(place):
+            try:
+                return await self._request("sites_summary", {"site_id": place["id"]}, _parse_json_ok), "OK"
+            except errors as e:
+                return None, _error_status(e)
+
+        calls = {"search": search, "summary": summarize}
+        enrichment = _Enrichment(queries, self.enriched_ids)
+        pending = {}
+
+        def submit():
+            while len(pending) < max(1, max_workers):
+                job = enrichment.next_job()
+                if job is None:
+                    return
+                pending[asyncio.ensure_future(calls[job[0]](job[1]))] = job
+
+        try:
+            submit()
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    kind, item = pending.pop(task)
+                    for record in enrichment.records(kind, item, *task.result()):
+                        yield record
+                submit()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def enrich_places(self, queries, max_workers=8, **kwargs):
+        """
+        장소 검색 결과 요약 정보 비동기 수집
+
+        Parameters
+        ----------
+        queries : list
+            검색어 목록
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+        kwargs : dict
+            search 파라미터
+
+        Returns
+        -------
+        DataFrame
+            장소 정보 (요약 정보는 summary_ 접두사 열)
+        """
+        records = [record async for record in self.iter_enriched_places(queries, max_workers, **kwargs)]
+        return pd.json_normalize(records, sep="_")
+
+    async def crawl_places(self, query, bbox, cap=None, max_depth=6, max_workers=8, retries=2, **kwargs):
+        """
+        영역 분할 장소 비동기 수집
+
+        Parameters
+        ----------
+        query : string
+            검색어
+        bbox : tuple
+            검색 영역 (최소 경도, 최소 위도, 최대 경도, 최대 위도)
+        cap : int, OPTIONAL
+            검색 1회의 최대 결과 수 (미지정 시 응답의 totalCount로 판단)
+        max_depth : int, OPTIONAL
+            최대 분할 깊이 (미지정 시 기본 값: 6)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+        retries : int, OPTIONAL
+            실패한 타일을 다시 검색할 횟수 (미지정 시 기본 값: 2)
+        kwargs : dict
+            search 파라미터
+
+        Returns
+        -------
+        DataFrame
+            장소 목록 (attrs에 failed_tiles, saturated_tiles)
+        """
+        errors = _request_errors() + (ValueError,)
+
+        async def search(tile):
+            try:
+                return await self._request("search", _tile_params(query, tile, kwargs), _parse_json_ok)
+            except errors:
+                return None
+
+        places, failed = {}, []
+        tiles = [tuple(bbox)]
+        for depth in range(max_depth + 1):
+            saturated = []
+            for _ in range(retries + 1):
+                results = await _gather_limited(search, tiles, max_workers)
+                tiles = _crawl_tiles(places, tiles, results, cap, saturated)
+                if not tiles:
+                    break
+            failed.extend(tiles)
+            if depth == max_depth or not saturated:
+                break
+            tiles = [t for tile in saturated for t in _split_tile(tile)]
+        return _crawl_frame(places, failed, saturated, max_depth)
+
+    async def transit_matrix(self, origins, destinations, max_workers=8, **kwargs):
+        """
+        대중교통 소요 시간 행렬 비동기 조회
+
+        Parameters
+        ----------
+        origins : list
+            출발지 좌표 목록 ("경도,위도" 또는 (경도, 위도))
+        destinations : list
+            도착지 좌표 목록 ("경도,위도" 또는 (경도, 위도))
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+        kwargs : dict
+            transit_directions_point_to_point 파라미터
+
+        Returns
+        -------
+        ndarray
+            최단 경로 소요 시간 행렬(분) (실패한 쌍은 NaN)
+        """
+        origins, destinations, pairs = _transit_pairs(origins, destinations)
+        errors = _request_errors() + (ValueError,)
+
+        async def route(pair):
+            try:
+                return _transit_duration(await self.transit_directions_point_to_point(*pair, **kwargs))
+            except errors:
+                return float("nan")
+
+        return _transit_matrix(origins, destinations, pairs, await _gather_limited(route, pairs, max_workers))
+
+    async def transit_isochrone(self, origin, minutes=(15, 30, 45, 60), radius_km=5, size=11, max_workers=8, **kwargs):
+        """
+        대중교통 도달권 표본 비동기 조회
+
+        Parameters
+        ----------
+        origin : string or tuple
+            출발지 좌표 ("경도,위도" 또는 (경도, 위도))
+        minutes : tuple, OPTIONAL
+            도달 시간 기준(분) (미지정 시 기본 값: 15, 30, 45, 60)
+        radius_km : float, OPTIONAL
+            격자 반경(km) (미지정 시 기본 값: 5)
+        size : int, OPTIONAL
+            격자 한 변의 점 개수 (미지정 시 기본 값: 11)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+        kwargs : dict
+            transit_directions_point_to_point 파라미터
+
+        Returns
+        -------
+        dict
+            lon, lat (격자 좌표), duration (소요 시간(분)), masks (기준 시간별 도달 가능 여부)
+        """
+        center, lon, lat = _isochrone_grid(origin, radius_km, size)
+        points = list(zip(lon.ravel(), lat.ravel()))
+        duration = await self.transit_matrix([center], points, max_workers, **kwargs)
+        return _isochrone_result(lon, lat, duration, minutes)
+
@@ -1,9 +1,977 @@
+import copy
 import json
+import os
+import re
+import sys
+import threading
+import warnings
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, timedelta
+from functools import partial
+from urllib.parse import urlencode
 import requests
-import pandas as pd
+from ._lazy import LazyModule
+from .records import RECORD_TYPES, SearchColumns
+from .transport import resolve_transport
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+
+
+_SEARCH_URLS = {
+    "blog": "https://openapi.naver.com/v1/search/blog.json",
+    "news": "https://openapi.naver.com/v1/search/news.json",
+    "book": "https://openapi.naver.com/v1/search/book.json",
+    "encyc": "https://openapi.naver.com/v1/search/encyc.json",
+    "movie": "https://openapi.naver.com/v1/search/movie.json",
+    "cafearticle": "https://openapi.naver.com/v1/search/cafearticle.json",
+    "kin": "https://openapi.naver.com/v1/search/kin.json",
+    "webkr": "https://openapi.naver.com/v1/search/webkr.json",
+    "image": "https://openapi.naver.com/v1/search/image",
+    "local": "https://openapi.naver.com/v1/search/local.json",
+    "shop": "https://openapi.naver.com/v1/search/shop.json",
+    "doc": "https://openapi.naver.com/v1/search/doc.json",
+}
+
+
+def _is_response(result):
+    if isinstance(result, requests.Response):
+        return True
+    return "httpx" in sys.modules and isinstance(result, sys.modules["httpx"].Response)
+
+
+def _ensure_ok(result):
+    if _is_response(result):
+        result.raise_for_status()
+        raise requests.HTTPError(f"{result.status_code} 응답: {result.url}", response=result)
+    return result
+
+
+def _is_series(obj):
+    return "pandas" in sys.modules and isinstance(obj, sys.modules["pandas"].Series)
+
+
+def _map_concurrent(func, items, max_workers):
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        return list(executor.map(func, items))
+
+
+def _imap_unordered(func, items, max_workers):
+    max_workers = max(1, max_workers)
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}
+        for item in items:
+            pending[executor.submit(func, item)] = item
+            if len(pending) >= max_workers * 2:
+                break
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                yield item, future.result()
+                nxt = next(items, None)
+                if nxt is not None:
+                    pending[executor.submit(func, nxt)] = nxt
+
+
+class _Checkpoint:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.done = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self.done[record["key"]] = record["value"]
+
+    def add(self, key, value):
+        self.done[key] = value
+        if not self.path:
+            return
+        line = json.dumps({"key": key, "value": value}, ensure_ascii=False)
+        with self.lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+def _parse_json(res):
+    if res.status_code == 200:
+        return res.json()
+    else:
+        return res
+
+
+def _parse_json_any(res):
+    return res.json()
+
+
+def _parse_items(res):
+    if res.status_code == 200:
+        return pd.DataFrame(res.json()['items'])
+    else:
+        return res
+
+
+def _parse_json_ok(res):
+    res.raise_for_status()
+    return res.json()
+
+
+def _search_pages(kind, display, limit, first=1):
+    if kind not in _SEARCH_URLS:
+        raise ValueError(f"지원하지 않는 검색 종류입니다: {kind}")
+    # 검색 API의 start 파라미터는 최대 1000까지 허용
+    pages = [(start, min(display, limit - start + 1))
+             for start in range(first, min(limit, 1000) + 1, display)]
+    return _SEARCH_URLS[kind], pages
+
+
+def _search_params(query, start, count, kwargs):
+    params = {
+        "query": query,
+        "start": start,
+        "display": count,
+    }
+    params.update(kwargs)
+    return params
+
+
+def _search_key(kind, query, display, start, kwargs):
+    # 페이지 범위와 결과를 바꾸는 display, kwargs(sort 등)를 모두 키에 포함
+    options = urlencode(sorted(dict(kwargs, display=display).items()))
+    return f"search:{kind}:{query}:{options}:{start}"
+
+
+def _search_columns(kind, output):
+    if isinstance(output, SearchColumns):
+        return output
+    if output in ("records", "columns"):
+        return SearchColumns(kind)
+    if output == "frame":
+        return None
+    raise ValueError(f"지원하지 않는 반환 형식입니다: {output}")
+
+
+def _parse_items_raw(res):
+    if res.status_code == 200:
+        return res.json()['items']
+    else:
+        return res
+
+
+def _parse_papago(res):
+    if res.status_code == 200:
+        return res.json()['message']['result']['translatedText']
+    else:
+        return res
+
+
+def _parse_romanization(res):
+    if res.status_code == 200:
+        return pd.DataFrame(res.json()['aResult'][0]['aItems'])
+    else:
+        return res
+
+
+def _parse_romanization_raw(res):
+    if res.status_code == 200:
+        return res.json()['aResult'][0]['aItems']
+    else:
+        return res
+
+
+def _parse_datalab_raw(res, column=None, output=None):
+    if res.status_code == 200:
+        return res.json()['results']
+    else:
+        return res
+
+
+def _parse_datalab(res, column, output="frame"):
+    if res.status_code == 200:
+        return _datalab_result(res.json()['results'], column, output)
+    else:
+        return res
+
+
+def _datalab_result(results, column, output="frame"):
+    periods = {}
+    labels = {}
+    cells = []
+    if column == "title":
+        records = ((r['title'], d) for r in results for d in r['data'])
+    else:
+        records = ((d['group'], d) for d in results[0]['data'])
+    for label, d in records:
+        i = periods.setdefault(d['period'], len(periods))
+        j = labels.setdefault(label, len(labels))
+        cells.append((i, j, d['ratio']))
+    values = np.full((len(periods), len(labels)), np.nan)
+    if cells:
+        rows, cols, ratios = zip(*cells)
+        values[list(rows), list(cols)] = ratios
+    keys = np.array(list(periods), dtype=object)
+    order = np.argsort(keys, kind="stable")
+    values = values[order]
+    index = pd.DatetimeIndex(pd.to_datetime(keys[order]), name="날짜")
+    columns = list(labels)
+    if output == "numpy":
+        return values, index.values, columns
+    return pd.DataFrame(values, index=index, columns=columns)
+
+
+def _datalab_records(key, values, dates, labels):
+    days = np.datetime_as_string(dates, unit="D")
+    return [{"job": key, "날짜": day, "label": label, "ratio": float(v)}
+            for day, row in zip(days, values)
+            for label, v in zip(labels, row) if not np.isnan(v)]
+
+
+def _anchor_chunks(keywordGroups, anchor, chunk_size):
+    if not 2 <= chunk_size <= 5:
+        raise ValueError("chunk_size는 2 이상 5 이하여야 합니다.")
+    if anchor is None:
+        anchor = keywordGroups[0]
+    elif not isinstance(anchor, dict):
+        matches = [g for g in keywordGroups if g["groupName"] == anchor]
+        if not matches:
+            raise ValueError(f"keywordGroups에 기준 그룹 '{anchor}'이 없습니다.")
+        anchor = matches[0]
+    name = anchor["groupName"]
+    others = [g for g in keywordGroups if g["groupName"] != name]
+    step = chunk_size - 1
+    chunks = [[anchor] + others[i:i + step] for i in range(0, len(others), step)] or [[anchor]]
+    return name, chunks
+
+
+def _rescale_on_anchor(frames, anchor):
+    reference = frames[0][anchor]
+    scaled = [frames[0]]
+    for frame in frames[1:]:
+        common = reference.index.intersection(frame.index)
+        base = frame.loc[common, anchor].sum()
+        if base == 0:
+            raise ValueError(f"기준 그룹 '{anchor}'의 값이 모두 0이라 보정할 수 없습니다.")
+        factor = reference.loc[common].sum() / base
+        scaled.append(frame.drop(columns=anchor) * factor)
+    merged = pd.concat(scaled, axis=1)
+    peak = np.nanmax(merged.values) if merged.size else 0
+    if peak > 0:
+        merged = merged * (100.0 / peak)
+    return merged
+
+
+def _split_period(startDate, endDate, window_days, overlap_days):
+    if not 1 <= overlap_days < window_days:
+        raise ValueError("overlap_days는 1 이상 window_days 미만이어야 합니다.")
+    start = date.fromisoformat(startDate)
+    end = date.fromisoformat(endDate)
+    windows = []
+    while True:
+        stop = min(start + timedelta(days=window_days - 1), end)
+        windows.append((start.isoformat(), stop.isoformat()))
+        if stop >= end:
+            return windows
+        start = stop - timedelta(days=overlap_days - 1)
+
+
+def _stitch_windows(frames):
+    stitched = frames[0]
+    for frame in frames[1:]:
+        common = stitched.index.intersection(frame.index)
+        if common.empty:
+            raise ValueError("겹치는 구간에 데이터가 없어 기간을 이어 붙일 수 없습니다.")
+        reference = np.nansum(stitched.loc[common].values)
+        base = np.nansum(frame.loc[common].values)
+        if base > 0:
+            factor = reference / base
+        elif reference == 0:
+            factor = 1.0
+        else:
+            raise ValueError("겹치는 구간의 값이 모두 0이라 기간을 이어 붙일 수 없습니다.")
+        stitched = stitched.combine_first(frame * factor)
+    peak = np.nanmax(stitched.values) if stitched.size else 0
+    if peak > 0:
+        stitched = stitched * (100.0 / peak)
+    return stitched[frames[0].columns.union(stitched.columns, sort=False)]
+
+
+def _normalize_address(query):
+    if not isinstance(query, str):
+        return None
+    return re.sub(r"\s+", " ", query).strip() or None
+
+
+def _address_queries(addresses):
+    if isinstance(addresses, pd.Series):
+        index, queries = addresses.index, addresses.tolist()
+    else:
+        queries = list(addresses)
+        index = pd.RangeIndex(len(queries))
+    return index, queries, [_normalize_address(q) for q in queries]
+
+
+def _geocode_record(result):
+    if _is_response(result):
+        return {"status": f"HTTP {result.status_code}"}
+    items = result.get("addresses") or []
+    if not items:
+        return {"status": "NO_RESULT"}
+    best = items[0]
+    return {
+        "x": float(best["x"]),
+        "y": float(best["y"]),
+        "address": best.get("roadAddress") or best.get("jibunAddress"),
+        "status": "OK",
+    }
+
+
+def _store_geocode(state, query, record):
+    if record["status"] in ("OK", "NO_RESULT"):
+        state.add(query, record)
+    else:
+        state.done[query] = record
+
+
+def _geocode_frame(index, queries, normalized, done):
+    rows = [done.get(q, {"status": "EMPTY"}) if q else {"status": "EMPTY"}
+            for q in normalized]
+    df = pd.DataFrame(rows, index=index, columns=["x", "y", "address", "status"])
+    df.insert(0, "query", queries)
+    df[["x", "y"]] = df[["x", "y"]].astype(float)
+    return df
+
+
+def _unique_coords(lon, lat, precision):
+    lon = np.asarray(lon, dtype=float)
+    lat = np.asarray(lat, dtype=float)
+    coords = np.char.add(np.char.add(np.char.mod(f"%.{precision}f", lon), ","),
+                         np.char.mod(f"%.{precision}f", lat))
+    unique, inverse = np.unique(coords, return_inverse=True)
+    return lon, lat, unique.tolist(), inverse.ravel()
+
+
+def _reverse_geocode_frame(records, inverse, lon, lat):
+    df = pd.DataFrame.from_records(records).iloc[inverse].reset_index(drop=True)
+    df.insert(0, "lon", lon)
+    df.insert(1, "lat", lat)
+    return df
+
+
+def _reverse_geocode_record(result):
+    if _is_response(result):
+        return {"status": f"HTTP {result.status_code}"}
+    items = result.get("results") or []
+    record = {"status": "OK" if items else "NO_RESULT"}
+    for item in items:
+        name = item["name"]
+        region = item.get("region", {})
+        land = item.get("land") or {}
+        record[f"{name}_code"] = item.get("code", {}).get("id")
+        for area in ("area1", "area2", "area3", "area4"):
+            record[f"{name}_{area}"] = region.get(area, {}).get("name")
+        if name in ("addr", "roadaddr"):
+            record[f"{name}_name"] = land.get("name")
+            record[f"{name}_number1"] = land.get("number1")
+            record[f"{name}_number2"] = land.get("number2")
+        if name == "roadaddr":
+            record[f"{name}_building"] = land.get("addition0", {}).get("value")
+    return record
+
+
+_ROUTE_WAYPOINTS = {
+    "directions5": 5,
+    "directions15": 15,
+}
+
+
+def _format_point(point):
+    if isinstance(point, str):
+        return point.replace(" ", "")
+    return f"{float(point[0])},{float(point[1])}"
+
+
+def _pack_routes(pairs, max_legs):
+    outgoing = defaultdict(deque)
+    for a, b in pairs:
+        outgoing[a].append(b)
+    chains = []
+    for start in list(outgoing):
+        while outgoing[start]:
+            chain = [start]
+            while len(chain) - 1 < max_legs and outgoing[chain[-1]]:
+                chain.append(outgoing[chain[-1]].popleft())
+            chains.append(chain)
+    return chains
+
+
+def _route_legs(result, option, count):
+    if not isinstance(result, dict) or result.get("code") != 0:
+        return None
+    summary = result["route"][option][0]["summary"]
+    # summary.waypoints의 duration(ms), distance(m)는 직전 지점부터 해당 경유지까지의 값
+    legs = [(w["duration"] / 1000, w["distance"]) for w in summary.get("waypoints", [])]
+    legs.append((summary["duration"] / 1000 - sum(d for d, _ in legs),
+                 summary["distance"] - sum(m for _, m in legs)))
+    return legs if len(legs) == count else None
+
+
+def _route_chains(origins, destinations, api, pack):
+    origins = [_format_point(p) for p in origins]
+    destinations = [_format_point(p) for p in destinations]
+    pairs = list(dict.fromkeys((o, d) for o in origins for d in destinations if o != d))
+    if pack:
+        chains = _pack_routes(pairs, _ROUTE_WAYPOINTS[api] + 1)
+    else:
+        chains = [list(pair) for pair in pairs]
+    return origins, destinations, chains
+
+
+def _route_params(chain, option, kwargs):
+    params = {"option": option}
+    params.update(kwargs)
+    if len(chain) > 2:
+        params["waypoints"] = "|".join(chain[1:-1])
+    return params
+
+
+def _route_matrices(origins, destinations, chains, results):
+    legs = {}
+    for chain, values in zip(chains, results):
+        if values is not None:
+            legs.update(zip(zip(chain, chain[1:]), values))
+
+    duration = np.full((len(origins), len(destinations)), np.nan)
+    distance = np.full((len(origins), len(destinations)), np.nan)
+    failed = np.zeros((len(origins), len(destinations)), dtype=bool)
+    for i, o in enumerate(origins):
+        for j, d in enumerate(destinations):
+            if o == d:
+                duration[i, j] = distance[i, j] = 0.0
+            elif (o, d) in legs:
+                duration[i, j], distance[i, j] = legs[(o, d)]
+            else:
+                failed[i, j] = True
+    return duration, distance, failed
+
+
+def _pack_texts(texts, max_chars):
+    batches = []
+    batch, size = [], 0
+    for text in texts:
+        if "\n" in text or len(text) >= max_chars:
+            batches.append([text])
+            continue
+        if batch and size + 1 + len(text) > max_chars:
+            batches.append(batch)
+            batch, size = [], 0
+        size += len(text) + (1 if batch else 0)
+        batch.append(text)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _translation_todo(source, target, texts, memory):
+    series = texts if _is_series(texts) else None
+    texts = list(texts)
+    unique = list(dict.fromkeys(t for t in texts if t))
+    done = memory.get_many(source, target, unique) if memory is not None else {}
+    return series, texts, done, [t for t in unique if t not in done]
+
+
+def _store_translations(source, target, done, memory, translated, error):
+    # 실패한 묶음은 첫 번째 오류만 남기고 나머지 묶음은 계속 저장
+    if isinstance(translated, Exception):
+        return error or translated
+    done.update(translated)
+    if memory is not None:
+        memory.set_many(source, target, translated)
+    return error
+
+
+def _translation_result(series, texts, done):
+    result = [done.get(t, t) for t in texts]
+    if series is not None:
+        return pd.Series(result, index=series.index, name=series.name)
+    return result
+
+
+def _split_sentences(text, max_chars):
+    sentences = [t for t in re.split(r"(?<=[.!?。])\s+|\n+", text) if t.strip()]
+    chunks = []
+    chunk = ""
+    for sentence in sentences:
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            head, sentence = sentence[:cut], sentence[cut:].lstrip()
+            if chunk:
+                chunks.append(chunk)
+                chunk = ""
+            chunks.append(head)
+        if chunk and len(chunk) + 1 + len(sentence) > max_chars:
+            chunks.append(chunk)
+            chunk = ""
+        chunk = f"{chunk} {sentence}" if chunk else sentence
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _group_texts(texts, size, max_chars):
+    groups = []
+    group, length = [], 0
+    for text in texts:
+        if group and (len(group) >= size or length + 1 + len(text) > max_chars):
+            groups.append(group)
+            group, length = [], 0
+        length += len(text) + (1 if group else 0)
+        group.append(text)
+    if group:
+        groups.append(group)
+    return groups
+
+
+def _search_places(result):
+    place = (result.get("result") or {}).get("place") or {}
+    return [item for item in place.get("list") or [] if item.get("id")]
+
+
+def _tile_saturated(result, items, cap):
+    if cap is not None:
+        return len(items) >= cap
+    place = (result.get("result") or {}).get("place") or {}
+    return int(place.get("totalCount") or 0) > len(items)
+
+
+def _error_status(error):
+    res = getattr(error, "response", None)
+    if res is not None:
+        return f"HTTP {res.status_code}"
+    return f"ERROR: {type(error).__name__}"
+
+
+class _Enrichment:
+    def __init__(self, queries, enriched_ids):
+        self.queries = iter(queries)
+        self.enriched_ids = enriched_ids
+        self.places = deque()
+        self.seen = set()
+
+    def next_job(self):
+        # 찾은 장소의 요약을 새 검색보다 먼저 요청
+        if self.places:
+            return "summary", self.places.popleft()
+        for query in self.queries:
+            return "search", query
+        return None
+
+    def records(self, kind, item, result, status):
+        if kind == "summary":
+            if status == "OK":
+                self.enriched_ids.add(item["id"])
+            return [dict(item, summary=result, status=status)]
+        if status != "OK":
+            return [{"query": item, "summary": None, "status": status}]
+        for place in _search_places(result):
+            if place["id"] not in self.seen and place["id"] not in self.enriched_ids:
+                self.seen.add(place["id"])
+                self.places.append(dict(place, query=item))
+        return []
+
+
+def _split_tile(tile):
+    min_x, min_y, max_x, max_y = tile
+    mid_x, mid_y = (min_x + max_x) / 2, (min_y + max_y) / 2
+    return [
+        (min_x, min_y, mid_x, mid_y),
+        (mid_x, min_y, max_x, mid_y),
+        (min_x, mid_y, mid_x, max_y),
+        (mid_x, mid_y, max_x, max_y),
+    ]
+
+
+def _tile_params(query, tile, kwargs):
+    min_x, min_y, max_x, max_y = tile
+    params = {
+        "query": query,
+        "searchCoord": f"{(min_x + max_x) / 2};{(min_y + max_y) / 2}",
+        "boundary": f"{min_x};{min_y};{max_x};{max_y}",
+    }
+    params.update(kwargs)
+    return params
+
+
+def _crawl_tiles(places, tiles, results, cap, saturated):
+    # 실패한 타일(None)을 반환하고, 결과 개수 제한에 걸린 타일은 saturated에 추가
+    failed = []
+    for tile, result in zip(tiles, results):
+        if result is None:
+            failed.append(tile)
+            continue
+        items = _search_places(result)
+        for item in items:
+            places.setdefault(item["id"], item)
+        if _tile_saturated(result, items, cap):
+            saturated.append(tile)
+    return failed
+
+
+def _crawl_frame(places, failed, saturated, max_depth):
+    if failed:
+        warnings.warn(f"검색에 실패한 타일 {len(failed)}개의 장소가 빠졌습니다 "
+                      f"(attrs['failed_tiles'] 참고).", RuntimeWarning, stacklevel=3)
+    if saturated:
+        warnings.warn(f"max_depth({max_depth})에서도 결과 개수 제한에 걸린 타일이 {len(saturated)}개 "
+                      f"남아 일부 장소가 빠졌을 수 있습니다 (attrs['saturated_tiles'] 참고).",
+                      RuntimeWarning, stacklevel=3)
+    df = pd.DataFrame(list(places.values()))
+    df.attrs["failed_tiles"] = failed
+    df.attrs["saturated_tiles"] = saturated
+    return df
+
+
+def _transit_duration(result):
+    paths = result.get("paths") or []
+    durations = [p["duration"] for p in paths if p.get("duration") is not None]
+    return float(min(durations)) if durations else np.nan
+
+
+def _transit_pairs(origins, destinations):
+    origins = [_format_point(p) for p in origins]
+    destinations = [_format_point(p) for p in destinations]
+    pairs = list(dict.fromkeys((o, d) for o in origins for d in destinations if o != d))
+    return origins, destinations, pairs
+
+
+def _transit_matrix(origins, destinations, pairs, results):
+    durations = dict(zip(pairs, results))
+    matrix = np.full((len(origins), len(destinations)), np.nan)
+    for i, o in enumerate(origins):
+        for j, d in enumerate(destinations):
+            matrix[i, j] = 0.0 if o == d else durations[(o, d)]
+    return matrix
+
+
+def _isochrone_grid(origin, radius_km, size):
+    lon0, lat0 = (float(v) for v in _format_point(origin).split(",")[:2])
+    dlat = radius_km / 111.32
+    dlon = radius_km / (111.32 * np.cos(np.radians(lat0)))
+    lon, lat = np.meshgrid(np.linspace(lon0 - dlon, lon0 + dlon, size),
+                           np.linspace(lat0 - dlat, lat0 + dlat, size))
+    return (lon0, lat0), lon, lat
+
+
+def _isochrone_result(lon, lat, duration, minutes):
+    duration = duration.reshape(lon.shape)
+    with np.errstate(invalid="ignore"):
+        masks = {m: duration <= m for m in minutes}
+    return {"lon": lon, "lat": lat, "duration": duration, "masks": masks}
+
+
+_RAW_PARSERS = {
+    _parse_items: _parse_items_raw,
+    _parse_romanization: _parse_romanization_raw,
+    _parse_datalab: _parse_datalab_raw,
+}
+
+
+_BROWSER_HEADERS = {
+    'content-type': 'application/json',
+    'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/105.0.0.0 Safari/537.36',
+}
+
+
+def _quantize_coords(client, payload):
+    if client.coords_cache is not None:
+        payload["coords"] = client.coords_cache.quantize(payload["coords"])
+    return payload
+
+
+def _clova_payload(payload):
+    return {
+        "document": {
+            "content": payload.pop("content"),
+            "title": payload.pop("title"),
+        },
+        "option": payload,
+    }
+
+
+class _Endpoint:
+    """
+    엔드포인트 정의
+
+    Parameters
+    ----------
+    method : string
+        HTTP 메서드
+    url : string
+        요청 URL (path의 이름을 {이름} 형식으로 포함 가능)
+    auth : string
+        인증 헤더 종류 (naver, ncp, ncp_json, browser, None)
+    payload : string
+        요청 형식 (params: 쿼리 파라미터, data: JSON 본문(bytes), json: JSON 본문)
+    parse : callable
+        응답 파서
+    args : tuple, OPTIONAL
+        필수 파라미터
+    path : tuple, OPTIONAL
+        URL 경로에 들어가는 필수 파라미터
+    defaults : dict, OPTIONAL
+        기본 파라미터
+    options : dict, OPTIONAL
+        파서에 전달할 파라미터와 기본 값
+    cache : string, OPTIONAL
+        사용할 캐시 속성 이름 (미지정 시 클라이언트의 cache)
+    prepare : callable, OPTIONAL
+        (클라이언트, 파라미터)를 받아 파라미터를 고치는 함수
+    build : callable, OPTIONAL
+        파라미터를 요청 본문으로 바꾸는 함수
+    """
 
+    def __init__(self, method, url, auth, payload, parse, args=(), path=(), defaults=None,
+                 options=None, cache=None, prepare=None, build=None):
+        self.method = method
+        self.url = url
+        self.auth = auth
+        self.payload = payload
+        self.parse = parse
+        self.args = args
+        self.path = path
+        self.required = args + path
+        self.defaults = defaults or {}
+        self.options = options or {}
+        self.cache = cache
+        self.prepare = prepare
+        self.build = build
+
+
+_DATALAB_URL = "https://openapi.naver.com/v1/datalab/"
+_DATALAB_ARGS = ("startDate", "endDate", "timeUnit")
+_NCP_URL = "https://naveropenapi.apigw.ntruss.com/"
+
+_ENDPOINTS = {
+    "datalab_search": _Endpoint(
+        "POST", _DATALAB_URL + "search", "naver", "data",
+        partial(_parse_datalab, column="title"),
+        args=_DATALAB_ARGS + ("keywordGroups",), options={"output": "frame"}),
+    "datalab_shopping_categories": _Endpoint(
+        "POST", _DATALAB_URL + "shopping/categories", "naver", "data",
+        partial(_parse_datalab, column="title"),
+        args=_DATALAB_ARGS + ("category",), options={"output": "frame"}),
+    "datalab_shopping_category_device": _Endpoint(
+        "POST", _DATALAB_URL + "shopping/category/device", "naver", "data",
+        partial(_parse_datalab, column="group"),
+        args=_DATALAB_ARGS + ("category",), options={"output": "frame"}),
+    "datalab_shopping_category_gender": _Endpoint(
+        "POST", _DATALAB_URL + "shopping/category/gender", "naver", "data",
+        partial(_parse_datalab, column="group"),
+        args=_DATALAB_ARGS + ("category",), options={"output": "frame"}),
+    "datalab_shopping_category_age": _Endpoint(
+        "POST", _DATALAB_URL + "shopping/category/age", "naver", "data",
+        partial(_parse_datalab, column="group"),
+        args=_DATALAB_ARGS + ("category",), options={"output": "frame"}),
+    "datalab_shopping_category_keywords": _Endpoint(
+        "POST", _DATALAB_URL + "shopping/category/keywords", "naver", "data",
+        partial(_parse_datalab, column="title"),
+        args=_DATALAB_ARGS + ("category", "keyword"), options={"output": "frame"}),
+    "datalab_shopping_category_keyword_device": _Endpoint(
+        "POST", _DATALAB_URL + "shopping/category/keyword/device", "naver", "data",
+        partial(_parse_datalab, column="group"),
+        args=_DATALAB_ARGS + ("category", "keyword"), options={"output": "frame"}),
+    "datalab_shopping_category_keyword_gender": _Endpoint(
+        "POST", _DATALAB_URL + "shopping/category/keyword/gender", "naver", "data",
+        partial(_parse_datalab, column="group"),
+        args=_DATALAB_ARGS + ("category", "keyword"), options={"output": "frame"}),
+    "datalab_shopping_category_keyword_age": _Endpoint(
+        "POST", _DATALAB_URL + "shopping/category/keyword/age", "naver", "data",
+        partial(_parse_datalab, column="group"),
+        args=_DATALAB_ARGS + ("category", "keyword"), options={"output": "frame"}),
+    "util_shorturl": _Endpoint(
+        "GET", "https://openapi.naver.com/v1/util/shorturl", "naver", "params", _parse_json,
+        args=("url",)),
+    "papago_n2mt": _Endpoint(
+        "POST", "https://openapi.naver.com/v1/papago/n2mt", "naver", "data", _parse_papago,
+        args=("source", "target", "text")),
+    "krdict_romanization": _Endpoint(
+        "GET", "https://openapi.naver.com/v1/krdict/romanization", "naver", "params",
+        _parse_romanization, args=("query",)),
+    **{f"search_{kind}": _Endpoint("GET", url, "naver", "params", _parse_items, args=("query",))
+       for kind, url in _SEARCH_URLS.items()},
+    "geocoding": _Endpoint(
+        "GET", _NCP_URL + "map-geocode/v2/geocode", "ncp", "params", _parse_json,
+        args=("query",)),
+    "reverse_geocoding": _Endpoint(
+        "GET", _NCP_URL + "map-reversegeocode/v2/gc", "ncp", "params", _parse_json,
+        args=("coords",), defaults={"output": "json", "orders": "addr"},
+        cache="coords_cache", prepare=_quantize_coords),
+    "directions5": _Endpoint(
+        "GET", _NCP_URL + "map-direction/v1/driving", "ncp", "params", _parse_json,
+        args=("start", "goal")),
+    "directions15": _Endpoint(
+        "GET", _NCP_URL + "map-direction-15/v1/driving", "ncp", "params", _parse_json,
+        args=("start", "goal")),
+    "clova_summary": _Endpoint(
+        "POST", _NCP_URL + "text-summary/v1/summarize", "ncp_json", "json", _parse_json,
+        args=("content",),
+        defaults={"title": None, "language": "ko", "model": "general", "tone": 0, "summaryCount": 3},
+        build=_clova_payload),
+    "search": _Endpoint(
+        "GET", "https://map.naver.com/v5/api/search", "browser", "params", _parse_json_any,
+        args=("query",), defaults={"type": "all", "lang": "ko"}),
+    "sites_summary": _Endpoint(
+        "GET", "https://map.naver.com/v5/api/sites/summary/{site_id}", "browser", "params",
+        _parse_json_any, path=("site_id",), defaults={"lang": "ko"}),
+    "transit_directions_point_to_point": _Endpoint(
+        "GET", "https://map.naver.com/v5/api/transit/directions/point-to-point", None, "params",
+        _parse_json_any, args=("start", "goal"),
+        defaults={"crs": "EPSG:4326", "mode": "TIME", "lang": "ko", "includeDetailOperation": "true"},
+        cache="transit_cache"),
+}
+
+
+class _Client:
+    """
+    API 클라이언트 공통 클래스
 
-class Naver:
+    Parameters
+    ----------
+    transport : Transport, optional
+        HTTP 전송 계층 (미지정 시 공유 기본 Transport 사용)
+    session : requests.Session, optional
+        사용할 세션 (transport 미지정 시 적용)
+    cache : ResponseCache, optional
+        응답 캐시
+    raw : bool, optional
+        DataFrame 대신 파싱한 JSON(list, dict)을 반환할지 여부 (pandas를 import하지 않음)
+    """
+
+    def __init__(self, transport=None, session=None, cache=None, raw=False):
+        self.transport = resolve_transport(transport, session)
+        self.cache = cache
+        self.raw = raw
+        self.auth_headers = {}
+
+    def as_raw(self, raw=True):
+        """
+        반환 형식만 바꾼 인스턴스 반환
+
+        Parameters
+        ----------
+        raw : bool, OPTIONAL
+            파싱한 JSON 반환 여부 (미지정 시 기본 값: True)
+
+        Returns
+        -------
+        object
+            Transport와 캐시를 공유하는 같은 클래스의 인스턴스
+        """
+        client = copy.copy(self)
+        client.raw = raw
+        return client
+
+    def _parser(self, parse):
+        if self.raw and getattr(parse, "keywords", {}).get("output") != "numpy":
+            func = getattr(parse, "func", parse)
+            if func in _RAW_PARSERS:
+                return _RAW_PARSERS[func]
+        return parse
+
+    def batch(self, endpoint, params, max_workers=8):
+        """
+        엔드포인트 일괄 호출
+
+        같은 엔드포인트를 파라미터 목록으로 동시에 호출하고 결과를 입력 순서대로 반환합니다.
+
+        Parameters
+        ----------
+        endpoint : string
+            엔드포인트 이름 (메서드 이름과 같음, 예: search_blog, geocoding, sites_summary)
+        params : list
+            호출별 파라미터 목록 (dict, 또는 첫 번째 필수 파라미터 값)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+
+        Returns
+        -------
+        list
+            호출별 결과 (입력과 같은 순서)
+        """
+        self._endpoint(endpoint)
+        return _map_concurrent(lambda p: self._request(endpoint, p), list(params), max_workers)
+
+    def _endpoint(self, name):
+        endpoint = _ENDPOINTS.get(name)
+        if endpoint is None or endpoint.auth not in self.auth_headers:
+            raise ValueError(f"{type(self).__name__}에서 지원하지 않는 엔드포인트입니다: {name}")
+        return endpoint
+
+    def _request(self, name, params, parse=None):
+        endpoint = self._endpoint(name)
+        if not isinstance(params, dict):
+            params = {endpoint.required[0]: params}
+        params = dict(params)
+        missing = [arg for arg in endpoint.required if arg not in params]
+        if missing:
+            raise TypeError(f"{name}: 필수 파라미터가 없습니다: {', '.join(missing)}")
+        options = {key: params.pop(key, value) for key, value in endpoint.options.items()}
+        parse = parse or endpoint.parse
+        parse = partial(parse, **options) if options else parse
+        url = endpoint.url
+        if endpoint.path:
+            url = url.format(**{key: params.pop(key) for key in endpoint.path})
+        payload = {arg: params.pop(arg) for arg in endpoint.args}
+        payload.update(endpoint.defaults)
+        payload.update(params)
+        if endpoint.prepare is not None:
+            payload = endpoint.prepare(self, payload)
+        if endpoint.build is not None:
+            payload = endpoint.build(payload)
+        if endpoint.payload == "data":
+            kwargs = {"data": json.dumps(payload, ensure_ascii=False).encode("utf-8")}
+        else:
+            kwargs = {endpoint.payload: payload}
+        headers = self.auth_headers[endpoint.auth]
+        if headers is not None:
+            kwargs["headers"] = headers
+        cache = getattr(self, endpoint.cache) if endpoint.cache else None
+        return self._call(endpoint.method, url, parse, cache=cache, endpoint=name, **kwargs)
+
+    def _call(self, method, url, parse, cache=None, endpoint=None, **kwargs):
+        parse = self._parser(parse)
+        cache = cache or self.cache
+        key, hit = self._cache_lookup(cache, method, url, parse, kwargs)
+        if hit is not None:
+            return hit[0]
+        res = self.transport.request(method, url, **kwargs)
+        result = parse(res)
+        self._cache_store(cache, key, url, kwargs, res, result, endpoint)
+        return result
+
+    def _cache_lookup(self, cache, method, url, parse, kwargs):
+        if cache is None:
+            return None, None
+        body = kwargs.get("data", kwargs.get("json"))
+        key = cache.key(method, url, parse, kwargs.get("params"), body)
+        hit = cache.get(key)
+        metrics = getattr(self.transport, "metrics", None)
+        if metrics is not None:
+            metrics.cache(url, hit is not None)
+        return key, hit
+
+    def _cache_store(self, cache, key, url, kwargs, res, result, endpoint=None):
+        if key is not None and res.status_code == 200:
+            body = kwargs.get("data", kwargs.get("json"))
+            cache.set(key, result, cache.ttl_for(url, body, endpoint))
+
+
+class Naver(_Client):
     """
     네이버 OPEN API 클래스
 
@@ -13,16 +981,26 @@ class Naver:
         네이버 개발자 센터에서 발급받은 클라이언트 ID
     client_secret : string
         네이버 개발자 센터에서 발급받은 클라이언트 SECRET
+    transport : Transport, optional
+        HTTP 전송 계층 (미지정 시 공유 기본 Transport 사용)
+    session : requests.Session, optional
+        사용할 세션 (transport 미지정 시 적용)
+    cache : ResponseCache, optional
+        응답 캐시
+    raw : bool, optional
+        DataFrame 대신 파싱한 JSON(list, dict)을 반환할지 여부 (pandas를 import하지 않음)
     """
 
-    def __init__(self, client_id, client_secret):
+    def __init__(self, client_id, client_secret, transport=None, session=None, cache=None, raw=False):
+        super().__init__(transport, session, cache, raw)
         self.headers = {
             "X-Naver-Client-Id": client_id,
             "X-Naver-Client-Secret": client_secret,
             "Content-Type": "application/json",
         }
+        self.auth_headers = {"naver": self.headers}
 
-    def datalab_search(self, startDate, endDate, timeUnit, keywordGroups, **kwargs):
+    def datalab_search(self, startDate, endDate, timeUnit, keywordGroups, output="frame", **kwargs):
         """
         네이버 통합 검색어 트렌드 조회
 
@@ -36,44 +1014,107 @@ class Naver:
             조회 기간
         keywordGroups : list
             키워드 그룹
+        output : string, OPTIONAL
+            반환 형식 (frame: DataFrame, numpy: (값 배열, 날짜 배열, 레이블 목록)) (미지정 시 기본 값: frame)
+            raw 인스턴스에서는 frame이면 JSON을 반환하고, numpy는 그대로 적용합니다.
         kwargs : dict
             그 외 파라미터
 
         Returns
         -------
         DataFrame
-            키워드 그룹별 트렌드
+            키워드 그룹별 트렌드 (날짜 인덱스)
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/datalab/search/search.md
         """
-        url = "https://openapi.naver.com/v1/datalab/search"
-        data = {
-            "startDate": startDate,
-            "endDate": endDate,
-            "timeUnit": timeUnit,
-            "keywordGroups": keywordGroups,
-        }
-        data.update(kwargs)
-        data = json.dumps(data, ensure_ascii=False).encode("utf-8")
-        res = requests.post(url, data=data, headers=self.headers)
-        if res.status_code == 200:
-            data = res.json()['results']
-            num = len(data)
-            df = pd.DataFrame()
-            for i in range(num):
-                sub = pd.DataFrame(data[i]['data'])
-                sub['title'] = data[i]['title']
-                sub = sub[['title', 'period', 'ratio']]
-                df = pd.concat([df, sub], axis=0, ignore_index=True)
-            pivot = pd.pivot(df, index='period', columns='title',
-                             values='ratio').reset_index()
-            pivot.columns.name = None
-            pivot = pivot.rename(columns={"period": "날짜"})
-            return pivot
-        else:
-            return res
+        return self._request("datalab_search", dict(
+            kwargs, startDate=startDate, endDate=endDate, timeUnit=timeUnit, keywordGroups=keywordGroups, output=output))
+
+    def datalab_search_many(self, startDate, endDate, timeUnit, keywordGroups, anchor=None, chunk_size=5, max_workers=4, **kwargs):
+        """
+        네이버 통합 검색어 트렌드 대량 조회
+
+        키워드 그룹을 chunk_size개 단위로 나누어 동시에 조회하고, 모든 요청에
+        포함한 기준(anchor) 그룹의 비율로 각 결과를 같은 척도로 보정합니다.
 
-    def datalab_shopping_categories(self, startDate, endDate, timeUnit, category, **kwargs):
+        Parameters
+        ----------
+        startDate : string
+            조회 시작일
+        endDate : string
+            조회 종료일
+        timeUnit : string
+            조회 기간
+        keywordGroups : list
+            키워드 그룹 (개수 제한 없음)
+        anchor : string or dict, OPTIONAL
+            기준 그룹의 groupName 또는 키워드 그룹 (미지정 시 첫 번째 그룹)
+        chunk_size : int, OPTIONAL
+            요청당 키워드 그룹 수 (기준 그룹 포함, 최대 5) (미지정 시 기본 값: 5)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 4)
+        kwargs : dict
+            그 외 파라미터
+
+        Returns
+        -------
+        DataFrame
+            키워드 그룹별 트렌드 (날짜 인덱스, 전체 최댓값 100 기준)
+        """
+        name, chunks = _anchor_chunks(keywordGroups, anchor, chunk_size)
+        client = self.as_raw(False)
+
+        def fetch(groups):
+            return _ensure_ok(client.datalab_search(startDate, endDate, timeUnit, groups, **kwargs))
+
+        frames = _map_concurrent(fetch, chunks, max_workers)
+        merged = _rescale_on_anchor(frames, name)
+        return merged[[g["groupName"] for g in keywordGroups]]
+
+    def datalab_windowed(self, name, startDate, endDate, timeUnit, *args, window_days=365, overlap_days=28, max_workers=4, **kwargs):
+        """
+        데이터랩 장기간 조회
+
+        조회 기간을 겹치는 구간으로 나누어 동시에 조회한 뒤, 겹치는 구간의
+        비율로 각 결과를 보정하여 하나의 시계열로 이어 붙입니다.
+
+        Parameters
+        ----------
+        name : string
+            데이터랩 메서드 이름에서 datalab_ 이후 부분 (예: search, shopping_categories)
+        startDate : string
+            조회 시작일
+        endDate : string
+            조회 종료일
+        timeUnit : string
+            구간 단위 (date만 지원)
+        args : list
+            메서드의 나머지 위치 인자 (keywordGroups 또는 category, keyword)
+        window_days : int, OPTIONAL
+            요청당 조회 기간(일) (미지정 시 기본 값: 365)
+        overlap_days : int, OPTIONAL
+            인접 구간이 겹치는 기간(일, 1 이상) (미지정 시 기본 값: 28)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 4)
+        kwargs : dict
+            그 외 파라미터
+
+        Returns
+        -------
+        DataFrame
+            트렌드 (날짜 인덱스, 전체 최댓값 100 기준)
+        """
+        if timeUnit != "date":
+            raise ValueError(f"datalab_windowed는 timeUnit='date'만 지원합니다: {timeUnit}")
+        method = getattr(self.as_raw(False), f"datalab_{name}")
+        windows = _split_period(startDate, endDate, window_days, overlap_days)
+
+        def fetch(window):
+            return _ensure_ok(method(window[0], window[1], timeUnit, *args, **kwargs))
+
+        return _stitch_windows(_map_concurrent(fetch, windows, max_workers))
+
+    def datalab_shopping_categories(self, startDate, endDate, timeUnit, category, output="frame", **kwargs):
         """
         쇼핑인사이트 분야별 트렌드 조회
 
@@ -87,44 +1128,23 @@ class Naver:
             구간 단위
         category : list
             분야
+        output : string, OPTIONAL
+            반환 형식 (frame: DataFrame, numpy: (값 배열, 날짜 배열, 레이블 목록)) (미지정 시 기본 값: frame)
+            raw 인스턴스에서는 frame이면 JSON을 반환하고, numpy는 그대로 적용합니다.
         kwargs : dict
             그 외 파라미터
 
         Returns
         -------
         DataFrame
-            분야별 트렌드
+            분야별 트렌드 (날짜 인덱스)
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/datalab/shopping/shopping.md
         """
-        url = "https://openapi.naver.com/v1/datalab/shopping/categories"
-        data = {
-            "startDate": startDate,
-            "endDate": endDate,
-            "timeUnit": timeUnit,
-            "category": category,
-        }
-        data.update(kwargs)
-        data = json.dumps(data, ensure_ascii=False).encode("utf-8")
-        res = requests.post(url, data=data, headers=self.headers)
-        if res.status_code == 200:
-            data = res.json()['results']
-            num = len(data)
-            df = pd.DataFrame()
-            for i in range(num):
-                sub = pd.DataFrame(data[i]['data'])
-                sub['title'] = data[i]['title']
-                sub = sub[['title', 'period', 'ratio']]
-                df = pd.concat([df, sub], axis=0, ignore_index=True)
-            pivot = pd.pivot(df, index='period', columns='title',
-                             values='ratio').reset_index()
-            pivot.columns.name = None
-            pivot = pivot.rename(columns={"period": "날짜"})
-            return pivot
-        else:
-            return res
+        return self._request("datalab_shopping_categories", dict(
+            kwargs, startDate=startDate, endDate=endDate, timeUnit=timeUnit, category=category, output=output))
 
-    def datalab_shopping_category_device(self, startDate, endDate, timeUnit, category, **kwargs):
+    def datalab_shopping_category_device(self, startDate, endDate, timeUnit, category, output="frame", **kwargs):
         """
         쇼핑인사이트 분야 내 기기별 트렌드 조회
 
@@ -138,39 +1158,23 @@ class Naver:
             구간 단위
         category : list
             분야
+        output : string, OPTIONAL
+            반환 형식 (frame: DataFrame, numpy: (값 배열, 날짜 배열, 레이블 목록)) (미지정 시 기본 값: frame)
+            raw 인스턴스에서는 frame이면 JSON을 반환하고, numpy는 그대로 적용합니다.
         kwargs : dict
             그 외 파라미터
 
         Returns
         -------
         DataFrame
-            분야 내 기기별 트렌드
+            분야 내 기기별 트렌드 (날짜 인덱스)
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/datalab/shopping/shopping.md
         """
-        url = "https://openapi.naver.com/v1/datalab/shopping/category/device"
-        data = {
-            "startDate": startDate,
-            "endDate": endDate,
-            "timeUnit": timeUnit,
-            "category": category,
-        }
-        data.update(kwargs)
-        data = json.dumps(data, ensure_ascii=False).encode("utf-8")
-        res = requests.post(url, data=data, headers=self.headers)
-        if res.status_code == 200:
-            data = res.json()['results']
-            df = pd.DataFrame(data[0]['data'])
-            df = df[['group', 'period', 'ratio']]
-            pivot = pd.pivot(df, index='period', columns=[
-                             'group'], values='ratio').reset_index()
-            pivot.columns.name = None
-            pivot = pivot.rename(columns={"period": "날짜"})
-            return pivot
-        else:
-            return res
+        return self._request("datalab_shopping_category_device", dict(
+            kwargs, startDate=startDate, endDate=endDate, timeUnit=timeUnit, category=category, output=output))
 
-    def datalab_shopping_category_gender(self, startDate, endDate, timeUnit, category, **kwargs):
+    def datalab_shopping_category_gender(self, startDate, endDate, timeUnit, category, output="frame", **kwargs):
         """
         쇼핑인사이트 분야 내 성별 트렌드 조회
 
@@ -184,39 +1188,23 @@ class Naver:
             구간 단위
         category : list
             분야
+        output : string, OPTIONAL
+            반환 형식 (frame: DataFrame, numpy: (값 배열, 날짜 배열, 레이블 목록)) (미지정 시 기본 값: frame)
+            raw 인스턴스에서는 frame이면 JSON을 반환하고, numpy는 그대로 적용합니다.
         kwargs : dict
             그 외 파라미터
 
         Returns
         -------
         DataFrame
-            분야 내 성별 트렌드
+            분야 내 성별 트렌드 (날짜 인덱스)
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/datalab/shopping/shopping.md
         """
-        url = "https://openapi.naver.com/v1/datalab/shopping/category/gender"
-        data = {
-            "startDate": startDate,
-            "endDate": endDate,
-            "timeUnit": timeUnit,
-            "category": category,
-        }
-        data.update(kwargs)
-        data = json.dumps(data, ensure_ascii=False).encode("utf-8")
-        res = requests.post(url, data=data, headers=self.headers)
-        if res.status_code == 200:
-            data = res.json()['results']
-            df = pd.DataFrame(data[0]['data'])
-            df = df[['group', 'period', 'ratio']]
-            pivot = pd.pivot(df, index='period', columns=[
-                             'group'], values='ratio').reset_index()
-            pivot.columns.name = None
-            pivot = pivot.rename(columns={"period": "날짜"})
-            return pivot
-        else:
-            return res
+        return self._request("datalab_shopping_category_gender", dict(
+            kwargs, startDate=startDate, endDate=endDate, timeUnit=timeUnit, category=category, output=output))
 
-    def datalab_shopping_category_age(self, startDate, endDate, timeUnit, category, **kwargs):
+    def datalab_shopping_category_age(self, startDate, endDate, timeUnit, category, output="frame", **kwargs):
         """
         쇼핑인사이트 분야 내 연령별 트렌드 조회
 
@@ -230,39 +1218,23 @@ class Naver:
             구간 단위
         category : list
             분야
+        output : string, OPTIONAL
+            반환 형식 (frame: DataFrame, numpy: (값 배열, 날짜 배열, 레이블 목록)) (미지정 시 기본 값: frame)
+            raw 인스턴스에서는 frame이면 JSON을 반환하고, numpy는 그대로 적용합니다.
         kwargs : dict
             그 외 파라미터
 
         Returns
         -------
         DataFrame
-            분야 내 연령별 트렌드
+            분야 내 연령별 트렌드 (날짜 인덱스)
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/datalab/shopping/shopping.md
         """
-        url = "https://openapi.naver.com/v1/datalab/shopping/category/age"
-        data = {
-            "startDate": startDate,
-            "endDate": endDate,
-            "timeUnit": timeUnit,
-            "category": category,
-        }
-        data.update(kwargs)
-        data = json.dumps(data, ensure_ascii=False).encode("utf-8")
-        res = requests.post(url, data=data, headers=self.headers)
-        if res.status_code == 200:
-            data = res.json()['results']
-            df = pd.DataFrame(data[0]['data'])
-            df = df[['group', 'period', 'ratio']]
-            pivot = pd.pivot(df, index='period', columns=[
-                             'group'], values='ratio').reset_index()
-            pivot.columns.name = None
-            pivot = pivot.rename(columns={"period": "날짜"})
-            return pivot
-        else:
-            return res
+        return self._request("datalab_shopping_category_age", dict(
+            kwargs, startDate=startDate, endDate=endDate, timeUnit=timeUnit, category=category, output=output))
 
-    def datalab_shopping_category_keywords(self, startDate, endDate, timeUnit, category, keyword, **kwargs):
+    def datalab_shopping_category_keywords(self, startDate, endDate, timeUnit, category, keyword, output="frame", **kwargs):
         """
         쇼핑인사이트 키워드별 트렌드 조회
 
@@ -278,45 +1250,23 @@ class Naver:
             분야
         keyword : list
             키워드
+        output : string, OPTIONAL
+            반환 형식 (frame: DataFrame, numpy: (값 배열, 날짜 배열, 레이블 목록)) (미지정 시 기본 값: frame)
+            raw 인스턴스에서는 frame이면 JSON을 반환하고, numpy는 그대로 적용합니다.
         kwargs : dict
             그 외 파라미터
 
         Returns
         -------
         DataFrame
-            키워드별 트렌드
+            키워드별 트렌드 (날짜 인덱스)
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/datalab/shopping/shopping.md
         """
-        url = "https://openapi.naver.com/v1/datalab/shopping/category/keywords"
-        data = {
-            "startDate": startDate,
-            "endDate": endDate,
-            "timeUnit": timeUnit,
-            "category": category,
-            "keyword": keyword,
-        }
-        data.update(kwargs)
-        data = json.dumps(data, ensure_ascii=False).encode("utf-8")
-        res = requests.post(url, data=data, headers=self.headers)
-        if res.status_code == 200:
-            data = res.json()['results']
-            num = len(data)
-            df = pd.DataFrame()
-            for i in range(num):
-                sub = pd.DataFrame(data[i]['data'])
-                sub['title'] = data[i]['title']
-                sub = sub[['title', 'period', 'ratio']]
-                df = pd.concat([df, sub], axis=0, ignore_index=True)
-            pivot = pd.pivot(df, index='period', columns='title',
-                             values='ratio').reset_index()
-            pivot.columns.name = None
-            pivot = pivot.rename(columns={"period": "날짜"})
-            return pivot
-        else:
-            return res
+        return self._request("datalab_shopping_category_keywords", dict(
+            kwargs, startDate=startDate, endDate=endDate, timeUnit=timeUnit, category=category, keyword=keyword, output=output))
 
-    def datalab_shopping_category_keyword_device(self, startDate, endDate, timeUnit, category, keyword, **kwargs):
+    def datalab_shopping_category_keyword_device(self, startDate, endDate, timeUnit, category, keyword, output="frame", **kwargs):
         """
         쇼핑인사이트 키워드 기기별 트렌드 조회
 
@@ -332,40 +1282,23 @@ class Naver:
             분야
         keyword : list
             키워드
+        output : string, OPTIONAL
+            반환 형식 (frame: DataFrame, numpy: (값 배열, 날짜 배열, 레이블 목록)) (미지정 시 기본 값: frame)
+            raw 인스턴스에서는 frame이면 JSON을 반환하고, numpy는 그대로 적용합니다.
         kwargs : dict
             그 외 파라미터
 
         Returns
         -------
         DataFrame
-            키워드 기기별 트렌드
+            키워드 기기별 트렌드 (날짜 인덱스)
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/datalab/shopping/shopping.md
         """
-        url = "https://openapi.naver.com/v1/datalab/shopping/category/keyword/device"
-        data = {
-            "startDate": startDate,
-            "endDate": endDate,
-            "timeUnit": timeUnit,
-            "category": category,
-            "keyword": keyword,
-        }
-        data.update(kwargs)
-        data = json.dumps(data, ensure_ascii=False).encode("utf-8")
-        res = requests.post(url, data=data, headers=self.headers)
-        if res.status_code == 200:
-            data = res.json()['results']
-            df = pd.DataFrame(data[0]['data'])
-            df = df[['group', 'period', 'ratio']]
-            pivot = pd.pivot(df, index='period', columns=[
-                             'group'], values='ratio').reset_index()
-            pivot.columns.name = None
-            pivot = pivot.rename(columns={"period": "날짜"})
-            return pivot
-        else:
-            return res
+        return self._request("datalab_shopping_category_keyword_device", dict(
+            kwargs, startDate=startDate, endDate=endDate, timeUnit=timeUnit, category=category, keyword=keyword, output=output))
 
-    def datalab_shopping_category_keyword_gender(self, startDate, endDate, timeUnit, category, keyword, **kwargs):
+    def datalab_shopping_category_keyword_gender(self, startDate, endDate, timeUnit, category, keyword, output="frame", **kwargs):
         """
         쇼핑인사이트 키워드 성별 트렌드 조회
 
@@ -381,40 +1314,23 @@ class Naver:
             분야
         keyword : list
             키워드
+        output : string, OPTIONAL
+            반환 형식 (frame: DataFrame, numpy: (값 배열, 날짜 배열, 레이블 목록)) (미지정 시 기본 값: frame)
+            raw 인스턴스에서는 frame이면 JSON을 반환하고, numpy는 그대로 적용합니다.
         kwargs : dict
             그 외 파라미터
 
         Returns
         -------
         DataFrame
-            키워드 성별 트렌드
+            키워드 성별 트렌드 (날짜 인덱스)
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/datalab/shopping/shopping.md
         """
-        url = "https://openapi.naver.com/v1/datalab/shopping/category/keyword/gender"
-        data = {
-            "startDate": startDate,
-            "endDate": endDate,
-            "timeUnit": timeUnit,
-            "category": category,
-            "keyword": keyword,
-        }
-        data.update(kwargs)
-        data = json.dumps(data, ensure_ascii=False).encode("utf-8")
-        res = requests.post(url, data=data, headers=self.headers)
-        if res.status_code == 200:
-            data = res.json()['results']
-            df = pd.DataFrame(data[0]['data'])
-            df = df[['group', 'period', 'ratio']]
-            pivot = pd.pivot(df, index='period', columns=[
-                             'group'], values='ratio').reset_index()
-            pivot.columns.name = None
-            pivot = pivot.rename(columns={"period": "날짜"})
-            return pivot
-        else:
-            return res
+        return self._request("datalab_shopping_category_keyword_gender", dict(
+            kwargs, startDate=startDate, endDate=endDate, timeUnit=timeUnit, category=category, keyword=keyword, output=output))
 
-    def datalab_shopping_category_keyword_age(self, startDate, endDate, timeUnit, category, keyword, **kwargs):
+    def datalab_shopping_category_keyword_age(self, startDate, endDate, timeUnit, category, keyword, output="frame", **kwargs):
         """
         쇼핑인사이트 키워드 연령별 트렌드 조회
 
@@ -430,38 +1346,58 @@ class Naver:
             분야
         keyword : list
             키워드
+        output : string, OPTIONAL
+            반환 형식 (frame: DataFrame, numpy: (값 배열, 날짜 배열, 레이블 목록)) (미지정 시 기본 값: frame)
+            raw 인스턴스에서는 frame이면 JSON을 반환하고, numpy는 그대로 적용합니다.
         kwargs : dict
             그 외 파라미터
 
         Returns
         -------
         DataFrame
-            키워드 연령별 트렌드
+            키워드 연령별 트렌드 (날짜 인덱스)
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/datalab/shopping/shopping.md
         """
-        url = "https://openapi.naver.com/v1/datalab/shopping/category/keyword/age"
-        data = {
-            "startDate": startDate,
-            "endDate": endDate,
-            "timeUnit": timeUnit,
-            "category": category,
-            "keyword": keyword,
-        }
-        data.update(kwargs)
-        data = json.dumps(data, ensure_ascii=False).encode("utf-8")
-        res = requests.post(url, data=data, headers=self.headers)
-        if res.status_code == 200:
-            data = res.json()['results']
-            df = pd.DataFrame(data[0]['data'])
-            df = df[['group', 'period', 'ratio']]
-            pivot = pd.pivot(df, index='period', columns=[
-                             'group'], values='ratio').reset_index()
-            pivot.columns.name = None
-            pivot = pivot.rename(columns={"period": "날짜"})
-            return pivot
-        else:
-            return res
+        return self._request("datalab_shopping_category_keyword_age", dict(
+            kwargs, startDate=startDate, endDate=endDate, timeUnit=timeUnit, category=category, keyword=keyword, output=output))
+
+    def export_datalab(self, name, jobs, sink, max_workers=4):
+        """
+        데이터랩 결과 스트리밍 내보내기
+
+        여러 데이터랩 요청을 동시에 실행하고 완료되는 대로 (job, 날짜, label, ratio)
+        형식의 행으로 sink에 기록합니다. 중단 후 같은 sink로 다시 실행하면 기록한
+        요청은 건너뜁니다.
+
+        Parameters
+        ----------
+        name : string
+            데이터랩 메서드 이름에서 datalab_ 이후 부분 (예: search, shopping_categories)
+        jobs : dict
+            요청 키별 메서드 파라미터 (dict)
+        sink : JSONLSink or CSVSink or ParquetSink
+            내보내기 대상
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 4)
+
+        Returns
+        -------
+        int
+            이번 실행에서 기록한 행 수
+        """
+        method = getattr(self.as_raw(False), f"datalab_{name}")
+        todo = [key for key in jobs if f"datalab:{name}:{key}" not in sink.done]
+
+        def fetch(key):
+            return _ensure_ok(method(output="numpy", **jobs[key]))
+
+        rows = 0
+        for key, result in _imap_unordered(fetch, todo, max_workers):
+            records = _datalab_records(key, *result)
+            sink.write(f"datalab:{name}:{key}", records)
+            rows += len(records)
+        return rows
 
     def util_shorturl(self, url):
         """
@@ -479,15 +1415,7 @@ class Naver:
 
         - API 레퍼런스: https://developers.naver.com/docs/utils/shortenurl/
         """
-        req_url = f"https://openapi.naver.com/v1/util/shorturl"
-        params = {
-            "url": url
-        }
-        res = requests.get(req_url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return res.json()
-        else:
-            return res
+        return self._request("util_shorturl", {"url": url})
 
     def papago_n2mt(self, source, target, text, **kwargs):
         """
@@ -511,19 +1439,58 @@ class Naver:
 
         - API 레퍼런스: https://developers.naver.com/docs/papago/papago-nmt-api-reference.md
         """
-        url = "https://openapi.naver.com/v1/papago/n2mt"
-        data = {
-            "source": source,
-            "target": target,
-            "text": text
-        }
-        data.update(kwargs)
-        data = json.dumps(data, ensure_ascii=False).encode("utf-8")
-        res = requests.post(url, data=data, headers=self.headers)
-        if res.status_code == 200:
-            return res.json()['message']['result']['translatedText']
-        else:
-            return res
+        return self._request("papago_n2mt", dict(kwargs, source=source, target=target, text=text))
+
+    def papago_n2mt_many(self, source, target, texts, max_chars=5000, memory=None, max_workers=4, **kwargs):
+        """
+        Papago 대량 번역
+
+        짧은 텍스트 여러 개를 줄바꿈으로 이어 글자 수 한도 안에서 최소한의
+        요청으로 묶어 동시에 번역하고, 결과를 다시 원래 단위로 나눕니다.
+        나눈 결과의 개수가 맞지 않는 묶음은 텍스트별로 다시 번역합니다.
+        일부 묶음의 요청이 실패해도 나머지 묶음을 모두 번역해 메모리에 저장한 뒤
+        첫 번째 오류를 발생시킵니다.
+
+        Parameters
+        ----------
+        source : string
+            번역할 언어
+        target : string
+            번역될 언어
+        texts : list or Series
+            번역할 텍스트 목록
+        max_chars : int, OPTIONAL
+            요청당 최대 글자 수 (미지정 시 기본 값: 5000)
+        memory : TranslationMemory, OPTIONAL
+            번역 메모리 (지정 시 이미 번역한 텍스트는 요청하지 않고, 묶음이 번역될 때마다 저장)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 4)
+        kwargs : dict
+            그 외 파라미터
+
+        Returns
+        -------
+        list or Series
+            번역된 텍스트 (입력과 같은 순서)
+        """
+        series, texts, done, todo = _translation_todo(source, target, texts, memory)
+
+        def translate(batch):
+            try:
+                text = _ensure_ok(self.papago_n2mt(source, target, "\n".join(batch), **kwargs))
+                parts = text.split("\n")
+                if len(parts) == len(batch):
+                    return dict(zip(batch, parts))
+                return {t: _ensure_ok(self.papago_n2mt(source, target, t, **kwargs)) for t in batch}
+            except requests.RequestException as e:
+                return e
+
+        error = None
+        for _, translated in _imap_unordered(translate, _pack_texts(todo, max_chars), max_workers):
+            error = _store_translations(source, target, done, memory, translated, error)
+        if error is not None:
+            raise error
+        return _translation_result(series, texts, done)
 
     def krdict_romanization(self, query, **kwargs):
         """
@@ -543,16 +1510,7 @@ class Naver:
 
         - API 레퍼런스: https://developers.naver.com/docs/papago/papago-romanization-api-reference.md
         """
-        url = "https://openapi.naver.com/v1/krdict/romanization"
-        params = {
-            "query": query
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return pd.DataFrame(res.json()['aResult'][0]['aItems'])
-        else:
-            return res
+        return self._request("krdict_romanization", dict(kwargs, query=query))
 
     def search_blog(self, query, **kwargs):
         """
@@ -572,16 +1530,7 @@ class Naver:
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/search/blog/blog.md
         """
-        url = "https://openapi.naver.com/v1/search/blog.json"
-        params = {
-            "query": query
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return pd.DataFrame(res.json()['items'])
-        else:
-            return res
+        return self._request("search_blog", dict(kwargs, query=query))
 
     def search_news(self, query, **kwargs):
         """
@@ -601,16 +1550,7 @@ class Naver:
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/search/news/news.md
         """
-        url = "https://openapi.naver.com/v1/search/news.json"
-        params = {
-            "query": query
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return pd.DataFrame(res.json()['items'])
-        else:
-            return res
+        return self._request("search_news", dict(kwargs, query=query))
 
     def search_book(self, query, **kwargs):
         """
@@ -630,16 +1570,7 @@ class Naver:
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/search/book/book.md#%EC%B1%85
         """
-        url = "https://openapi.naver.com/v1/search/book.json"
-        params = {
-            "query": query
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return pd.DataFrame(res.json()['items'])
-        else:
-            return res
+        return self._request("search_book", dict(kwargs, query=query))
 
     def search_encyc(self, query, **kwargs):
         """
@@ -659,16 +1590,7 @@ class Naver:
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/search/encyclopedia/encyclopedia.md
         """
-        url = "https://openapi.naver.com/v1/search/encyc.json"
-        params = {
-            "query": query
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return pd.DataFrame(res.json()['items'])
-        else:
-            return res
+        return self._request("search_encyc", dict(kwargs, query=query))
 
     def search_movie(self, query, **kwargs):
         """
@@ -688,16 +1610,7 @@ class Naver:
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/search/movie/movie.md
         """
-        url = "https://openapi.naver.com/v1/search/movie.json"
-        params = {
-            "query": query
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return pd.DataFrame(res.json()['items'])
-        else:
-            return res
+        return self._request("search_movie", dict(kwargs, query=query))
 
     def search_cafearticle(self, query, **kwargs):
         """
@@ -717,16 +1630,7 @@ class Naver:
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/search/cafearticle/cafearticle.md
         """
-        url = "https://openapi.naver.com/v1/search/cafearticle.json"
-        params = {
-            "query": query
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return pd.DataFrame(res.json()['items'])
-        else:
-            return res
+        return self._request("search_cafearticle", dict(kwargs, query=query))
 
     def search_kin(self, query, **kwargs):
         """
@@ -746,16 +1650,7 @@ class Naver:
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/search/kin/kin.md
         """
-        url = "https://openapi.naver.com/v1/search/kin.json"
-        params = {
-            "query": query
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return pd.DataFrame(res.json()['items'])
-        else:
-            return res
+        return self._request("search_kin", dict(kwargs, query=query))
 
     def search_webkr(self, query, **kwargs):
         """
@@ -775,16 +1670,7 @@ class Naver:
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/search/web/web.md
         """
-        url = "https://openapi.naver.com/v1/search/webkr.json"
-        params = {
-            "query": query
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return pd.DataFrame(res.json()['items'])
-        else:
-            return res
+        return self._request("search_webkr", dict(kwargs, query=query))
 
     def search_image(self, query, **kwargs):
         """
@@ -804,16 +1690,7 @@ class Naver:
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/search/image/image.md
         """
-        url = "https://openapi.naver.com/v1/search/image"
-        params = {
-            "query": query
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return pd.DataFrame(res.json()['items'])
-        else:
-            return res
+        return self._request("search_image", dict(kwargs, query=query))
 
     def search_local(self, query, **kwargs):
         """
@@ -833,16 +1710,7 @@ class Naver:
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/search/local/local.md
         """
-        url = "https://openapi.naver.com/v1/search/local.json"
-        params = {
-            "query": query
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return pd.DataFrame(res.json()['items'])
-        else:
-            return res
+        return self._request("search_local", dict(kwargs, query=query))
 
     def search_shop(self, query, **kwargs):
         """
@@ -862,16 +1730,7 @@ class Naver:
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/search/shopping/shopping.md
         """
-        url = "https://openapi.naver.com/v1/search/shop.json"
-        params = {
-            "query": query
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return pd.DataFrame(res.json()['items'])
-        else:
-            return res
+        return self._request("search_shop", dict(kwargs, query=query))
 
     def search_doc(self, query, **kwargs):
         """
@@ -891,19 +1750,160 @@ class Naver:
 
         - API 레퍼런스: https://developers.naver.com/docs/serviceapi/search/doc/doc.md
         """
-        url = "https://openapi.naver.com/v1/search/doc.json"
-        params = {
-            "query": query
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return pd.DataFrame(res.json()['items'])
-        else:
-            return res
+        return self._request("search_doc", dict(kwargs, query=query))
+
+    def iter_search(self, kind, query, display=100, limit=1000, prefetch=2, output="frame", **kwargs):
+        """
+        검색 결과 페이지 순회
 
+        다음 페이지를 미리 동시에 요청하면서 페이지별 검색 결과를 반환합니다.
 
-class NaverCloudPlatform:
+        Parameters
+        ----------
+        kind : string
+            검색 종류 (blog, news, book, encyc, movie, cafearticle, kin, webkr, image, local, shop, doc)
+        query : string
+            검색어
+        display : int, OPTIONAL
+            페이지당 결과 수 (미지정 시 기본 값: 100)
+        limit : int, OPTIONAL
+            최대 결과 수 (미지정 시 기본 값: 1000)
+        prefetch : int, OPTIONAL
+            미리 요청할 페이지 수 (미지정 시 기본 값: 2)
+        output : string, OPTIONAL
+            반환 형식 (frame: DataFrame, records: 검색 종류별 SearchRecord 목록) (미지정 시 기본 값: frame)
+        kwargs : dict
+            그 외 파라미터
+
+        Yields
+        ------
+        DataFrame
+            페이지별 검색 결과 (raw 모드에서는 list, output="records"이면 SearchRecord 목록)
+        """
+        if output not in ("frame", "records"):
+            raise ValueError(f"지원하지 않는 반환 형식입니다: {output}")
+        for items in self._iter_search_pages(kind, query, display, limit, prefetch, **kwargs):
+            if output == "records":
+                yield [RECORD_TYPES[kind].from_dict(item) for item in items]
+            else:
+                yield items if self.raw else pd.DataFrame(items)
+
+    def collect_search(self, kind, query, display=100, limit=1000, prefetch=2, output="frame", **kwargs):
+        """
+        검색 결과 전체 수집
+
+        모든 페이지의 결과를 모은 뒤 한 번에 DataFrame으로 변환합니다.
+        output="columns"이면 결과를 열 단위로 누적한 SearchColumns를 반환하며,
+        여러 검색어의 결과를 하나의 SearchColumns에 이어 담을 수 있습니다.
+
+        Parameters
+        ----------
+        kind : string
+            검색 종류 (blog, news, book, encyc, movie, cafearticle, kin, webkr, image, local, shop, doc)
+        query : string
+            검색어
+        display : int, OPTIONAL
+            페이지당 결과 수 (미지정 시 기본 값: 100)
+        limit : int, OPTIONAL
+            최대 결과 수 (미지정 시 기본 값: 1000)
+        prefetch : int, OPTIONAL
+            미리 요청할 페이지 수 (미지정 시 기본 값: 2)
+        output : string or SearchColumns, OPTIONAL
+            반환 형식 (frame: DataFrame, records: SearchRecord 목록, columns: SearchColumns,
+            SearchColumns 객체: 해당 객체에 이어 담음) (미지정 시 기본 값: frame)
+        kwargs : dict
+            그 외 파라미터
+
+        Returns
+        -------
+        DataFrame
+            검색 결과 (raw 모드에서는 list, output에 따라 SearchRecord 목록 또는 SearchColumns)
+        """
+        columns = _search_columns(kind, output)
+        if columns is not None:
+            for page in self._iter_search_pages(kind, query, display, limit, prefetch, **kwargs):
+                columns.extend(page)
+            return list(columns.records()) if output == "records" else columns
+        items = []
+        for page in self._iter_search_pages(kind, query, display, limit, prefetch, **kwargs):
+            items.extend(page)
+        return items if self.raw else pd.DataFrame(items)
+
+    def export_search(self, kind, query, sink, display=100, limit=1000, prefetch=2, **kwargs):
+        """
+        검색 결과 스트리밍 내보내기
+
+        페이지를 받는 대로 sink에 기록하므로 전체 결과를 메모리에 올리지 않습니다.
+        중단 후 같은 sink로 같은 인자(display, kwargs 포함)로 다시 실행하면 기록한 페이지
+        다음부터 요청합니다.
+
+        Parameters
+        ----------
+        kind : string
+            검색 종류 (blog, news, book, encyc, movie, cafearticle, kin, webkr, image, local, shop, doc)
+        query : string
+            검색어
+        sink : JSONLSink or CSVSink or ParquetSink
+            내보내기 대상
+        display : int, OPTIONAL
+            페이지당 결과 수 (미지정 시 기본 값: 100)
+        limit : int, OPTIONAL
+            최대 결과 수 (미지정 시 기본 값: 1000)
+        prefetch : int, OPTIONAL
+            미리 요청할 페이지 수 (미지정 시 기본 값: 2)
+        kwargs : dict
+            그 외 파라미터
+
+        Returns
+        -------
+        int
+            이번 실행에서 기록한 행 수
+        """
+        start = 1
+        while _search_key(kind, query, display, start, kwargs) in sink.done:
+            start += display
+        rows = 0
+        for items in self._iter_search_pages(kind, query, display, limit, prefetch, first=start, **kwargs):
+            sink.write(_search_key(kind, query, display, start, kwargs), items)
+            rows += len(items)
+            start += display
+        return rows
+
+    def _iter_search_pages(self, kind, query, display, limit, prefetch, first=1, **kwargs):
+        url, pages = _search_pages(kind, display, limit, first)
+
+        def fetch(start, count):
+            params = _search_params(query, start, count, kwargs)
+            return self._call("GET", url, _parse_json_ok, endpoint=f"search_{kind}",
+                              headers=self.headers, params=params)
+
+        executor = ThreadPoolExecutor(max_workers=max(1, prefetch))
+        pending = deque()
+        remaining = iter(pages)
+        total = None
+
+        def submit():
+            page = next(remaining, None)
+            if page is not None and (total is None or page[0] <= total):
+                pending.append((page[1], executor.submit(fetch, *page)))
+
+        try:
+            for _ in range(max(1, prefetch)):
+                submit()
+            while pending:
+                count, future = pending.popleft()
+                data = future.result()
+                total = data.get("total", total)
+                items = data["items"]
+                yield items
+                if len(items) < count:
+                    break
+                submit()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class NaverCloudPlatform(_Client):
     """
     네이버 클라우드 플랫폼 OPEN API 클래스
 
@@ -913,13 +1913,29 @@ class NaverCloudPlatform:
         네이버 클라우드 플랫폼에서 발급받은 클라이언트 ID
     client_secret : string
         네이버 클라우드 플랫폼에서 발급받은 클라이언트 SECRET
+    transport : Transport, optional
+        HTTP 전송 계층 (미지정 시 공유 기본 Transport 사용)
+    session : requests.Session, optional
+        사용할 세션 (transport 미지정 시 적용)
+    cache : ResponseCache, optional
+        응답 캐시
+    coords_cache : CoordinateCache, optional
+        reverse_geocoding 전용 좌표 양자화 LRU 캐시
+    raw : bool, optional
+        DataFrame 대신 파싱한 JSON(list, dict)을 반환할지 여부 (pandas를 import하지 않음)
     """
 
-    def __init__(self, client_id, client_secret):
+    def __init__(self, client_id, client_secret, transport=None, session=None, cache=None, coords_cache=None, raw=False):
+        super().__init__(transport, session, cache, raw)
+        self.coords_cache = coords_cache
         self.headers = {
             "X-NCP-APIGW-API-KEY-ID": client_id,
             "X-NCP-APIGW-API-KEY": client_secret,
         }
+        self.auth_headers = {
+            "ncp": self.headers,
+            "ncp_json": dict(self.headers, **{"Content-Type": "application/json"}),
+        }
 
     def geocoding(self, query, **kwargs):
         """
@@ -939,16 +1955,49 @@ class NaverCloudPlatform:
 
         - API 레퍼런스: https://api.ncloud-docs.com/docs/ai-naver-mapsgeocoding
         """
-        url = f"https://naveropenapi.apigw.ntruss.com/map-geocode/v2/geocode"
-        params = {
-            "query": query
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return res.json()
-        else:
-            return res
+        return self._request("geocoding", dict(kwargs, query=query))
+
+    def geocode_many(self, addresses, max_workers=8, checkpoint=None, progress=None, **kwargs):
+        """
+        지오코딩 대량 실행
+
+        주소를 정규화하고 중복을 제거한 뒤 동시에 지오코딩하여 입력 순서에
+        맞춘 결과를 반환합니다.
+
+        Parameters
+        ----------
+        addresses : list or Series
+            주소 목록
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+        checkpoint : string, OPTIONAL
+            진행 상황을 기록할 JSONL 파일 경로 (다시 실행하면 완료된 주소는 건너뜀)
+        progress : callable, OPTIONAL
+            주소 하나를 처리할 때마다 (완료 수, 전체 수)로 호출되는 함수
+        kwargs : dict
+            그 외 파라미터
+
+        Returns
+        -------
+        DataFrame
+            주소별 결과 (query, x, y, address, status)
+        """
+        index, queries, normalized = _address_queries(addresses)
+        state = _Checkpoint(checkpoint)
+        todo = [q for q in dict.fromkeys(normalized) if q and q not in state.done]
+        total = len(todo)
+
+        def geocode(query):
+            try:
+                return _geocode_record(self.geocoding(query, **kwargs))
+            except requests.RequestException as e:
+                return {"status": f"ERROR: {type(e).__name__}"}
+
+        for count, (query, record) in enumerate(_imap_unordered(geocode, todo, max_workers), 1):
+            _store_geocode(state, query, record)
+            if progress is not None:
+                progress(count, total)
+        return _geocode_frame(index, queries, normalized, state.done)
 
     def reverse_geocoding(self, coords, **kwargs):
         """
@@ -968,18 +2017,45 @@ class NaverCloudPlatform:
 
         - API 레퍼런스: https://api.ncloud-docs.com/docs/ai-naver-mapsreversegeocoding
         """
-        params = {
-            "coords": coords,
-            "output": "json",
-            "orders": "addr",
-        }
-        params.update(kwargs)
-        url = f"https://naveropenapi.apigw.ntruss.com/map-reversegeocode/v2/gc"
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return res.json()
-        else:
-            return res
+        return self._request("reverse_geocoding", dict(kwargs, coords=coords))
+
+    def reverse_geocode_many(self, lon, lat, orders="legalcode,admcode,addr,roadaddr", max_workers=8, precision=7, **kwargs):
+        """
+        리버스 지오코딩 대량 실행
+
+        좌표 배열을 한 번에 문자열로 변환하고 같은 좌표를 한 번만 요청한 뒤
+        orders별 결과를 열로 펼친 DataFrame을 반환합니다.
+
+        Parameters
+        ----------
+        lon : array-like
+            경도 배열
+        lat : array-like
+            위도 배열
+        orders : string, OPTIONAL
+            변환 작업 이름 (미지정 시 기본 값: legalcode,admcode,addr,roadaddr)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+        precision : int, OPTIONAL
+            좌표 소수점 자릿수 (미지정 시 기본 값: 7)
+        kwargs : dict
+            그 외 파라미터
+
+        Returns
+        -------
+        DataFrame
+            좌표별 결과 (lon, lat, status, {order}_code, {order}_area1~4 등)
+        """
+        lon, lat, unique, inverse = _unique_coords(lon, lat, precision)
+
+        def reverse(c):
+            try:
+                return _reverse_geocode_record(self.reverse_geocoding(c, orders=orders, **kwargs))
+            except requests.RequestException as e:
+                return {"status": f"ERROR: {type(e).__name__}"}
+
+        records = _map_concurrent(reverse, unique, max_workers)
+        return _reverse_geocode_frame(records, inverse, lon, lat)
 
     def directions5(self, start, goal, **kwargs):
         """
@@ -1001,17 +2077,7 @@ class NaverCloudPlatform:
 
         - API 레퍼런스: https://api.ncloud-docs.com/docs/ai-naver-mapsdirections
         """
-        url = f"https://naveropenapi.apigw.ntruss.com/map-direction/v1/driving"
-        params = {
-            "start": start,
-            "goal": goal,
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return res.json()
-        else:
-            return res
+        return self._request("directions5", dict(kwargs, start=start, goal=goal))
 
     def directions15(self, start, goal, **kwargs):
         """
@@ -1033,17 +2099,50 @@ class NaverCloudPlatform:
 
         - API 레퍼런스: https://api.ncloud-docs.com/docs/ai-naver-mapsdirections15
         """
-        url = f"https://naveropenapi.apigw.ntruss.com/map-direction-15/v1/driving"
-        params = {
-            "start": start,
-            "goal": goal,
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=self.headers, params=params)
-        if res.status_code == 200:
-            return res.json()
-        else:
-            return res
+        return self._request("directions15", dict(kwargs, start=start, goal=goal))
+
+    def route_matrix(self, origins, destinations, api="directions5", option="trafast", pack=False, max_workers=8, **kwargs):
+        """
+        출발지-도착지 행렬 조회
+
+        모든 출발지-도착지 쌍의 경로를 동시에 조회하여 소요 시간과 거리 행렬을
+        반환합니다. 중복 쌍과 출발지와 도착지가 같은 쌍은 요청하지 않습니다.
+
+        Parameters
+        ----------
+        origins : list
+            출발지 좌표 목록 ("경도,위도" 또는 (경도, 위도))
+        destinations : list
+            도착지 좌표 목록 ("경도,위도" 또는 (경도, 위도))
+        api : string, OPTIONAL
+            사용할 API (directions5, directions15) (미지정 시 기본 값: directions5)
+        option : string, OPTIONAL
+            경로 조회 옵션 (미지정 시 기본 값: trafast)
+        pack : bool, OPTIONAL
+            필요한 쌍을 경유지로 이어 한 번의 요청으로 여러 구간을 조회할지 여부
+            (경유 구간은 출발 시각이 달라지므로 실시간 교통 반영 결과가 조금 다를 수 있음)
+            (미지정 시 기본 값: False)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+        kwargs : dict
+            그 외 파라미터
+
+        Returns
+        -------
+        tuple
+            (소요 시간 행렬(초), 거리 행렬(m), 실패 여부 행렬)
+        """
+        origins, destinations, chains = _route_chains(origins, destinations, api, pack)
+        method = getattr(self, api)
+
+        def route(chain):
+            try:
+                res = method(chain[0], chain[-1], **_route_params(chain, option, kwargs))
+            except requests.RequestException:
+                return None
+            return _route_legs(res, option, len(chain) - 1)
+
+        return _route_matrices(origins, destinations, chains, _map_concurrent(route, chains, max_workers))
 
     def clova_summary(self,
                       content=None,
@@ -1071,37 +2170,104 @@ class NaverCloudPlatform:
         summaryCount : int, OPTIONAL
             요약문 개수 (미지정 시 기본 값: 3)
         """
-        url = "https://naveropenapi.apigw.ntruss.com/text-summary/v1/summarize"
-        params = {
-            "document": {
-                "content": content,
-                "title": title,
-            },
-            "option": {
-                "language": language,
-                "model": model,
-                "tone": tone,
-                "summaryCount": summaryCount,
-            },
-        }
-        headers = self.headers.copy()
-        headers.update({
-            "Content-Type": "application/json",
+        return self._request("clova_summary", {
+            "content": content,
+            "title": title,
+            "language": language,
+            "model": model,
+            "tone": tone,
+            "summaryCount": summaryCount,
         })
-        res = requests.post(url, headers=headers, json=params)
-        if res.status_code == 200:
-            return res.json()
-        else:
-            return res
 
+    def clova_summary_long(self, content, title=None, max_chars=2000, fanout=5, max_depth=3, max_workers=4, **kwargs):
+        """
+        Clova Summary 긴 문서 요약
 
-class Map:
+        문서를 문장 단위로 max_chars 이하의 조각으로 나누어 동시에 요약한 뒤,
+        부분 요약을 fanout개씩 묶어 다시 요약하는 과정을 하나가 남을 때까지
+        반복합니다.
+
+        Parameters
+        ----------
+        content : string
+            요약할 내용
+        title : string, OPTIONAL
+            요약할 제목
+        max_chars : int, OPTIONAL
+            요청당 최대 글자 수 (미지정 시 기본 값: 2000)
+        fanout : int, OPTIONAL
+            한 번에 다시 요약할 부분 요약 수 (미지정 시 기본 값: 5)
+        max_depth : int, OPTIONAL
+            최대 요약 단계 수 (초과 시 남은 부분 요약을 이어 붙여 반환) (미지정 시 기본 값: 3)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 4)
+        kwargs : dict
+            clova_summary 파라미터 (language, model, tone, summaryCount)
+
+        Returns
+        -------
+        dict
+            요약 결과 ({"summary": 요약문})
+        """
+        def summarize(text):
+            return _ensure_ok(self.clova_summary(text, title=title, **kwargs))["summary"]
+
+        if len(content) <= max_chars:
+            return {"summary": summarize(content)}
+        parts = _split_sentences(content, max_chars)
+        for _ in range(max_depth):
+            parts = _map_concurrent(summarize, parts, max_workers)
+            if len(parts) == 1:
+                return {"summary": parts[0]}
+            parts = ["\n".join(group) for group in _group_texts(parts, fanout, max_chars)]
+        return {"summary": "\n".join(parts)}
+
+    def clova_summary_many(self, contents, max_workers=4, **kwargs):
+        """
+        Clova Summary 대량 요약
+
+        Parameters
+        ----------
+        contents : list
+            요약할 문서 목록
+        max_workers : int, OPTIONAL
+            동시에 요약할 문서 수 (미지정 시 기본 값: 4)
+        kwargs : dict
+            clova_summary_long 파라미터
+
+        Returns
+        -------
+        list
+            문서별 요약 결과 ({"summary": 요약문})
+        """
+        kwargs["max_workers"] = 1
+        return _map_concurrent(lambda c: self.clova_summary_long(c, **kwargs), contents, max_workers)
+
+
+class Map(_Client):
     """
     네이버 지도 API 클래스
+
+    Parameters
+    ----------
+    transport : Transport, optional
+        HTTP 전송 계층 (미지정 시 공유 기본 Transport 사용)
+    session : requests.Session, optional
+        사용할 세션 (transport 미지정 시 적용)
+    cache : ResponseCache, optional
+        응답 캐시
+    transit_cache : ResponseCache or LRUCache, optional
+        대중교통 길찾기 전용 캐시 (미지정 시 cache, cache도 없으면 캐시하지 않음)
+        (실시간 운행 정보가 바뀌므로 LRUCache(ttl=600)처럼 보관 시간을 지정)
+    raw : bool, optional
+        DataFrame 대신 파싱한 JSON(list, dict)을 반환할지 여부 (pandas를 import하지 않음)
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, transport=None, session=None, cache=None, transit_cache=None, raw=False):
+        super().__init__(transport, session, cache, raw)
+        self.enriched_ids = set()
+        self.transit_cache = transit_cache
+        self.auth_headers = {"browser": _BROWSER_HEADERS, None: None}
 
     def search(self, query, **kwargs):
         """
@@ -1119,19 +2285,7 @@ class Map:
         dict
             검색 결과
         """
-        url = "https://map.naver.com/v5/api/search"
-        headers = {
-            'content-type': 'application/json',
-            'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/105.0.0.0 Safari/537.36',
-        }
-        params = {
-            "query": query,
-            "type": "all",
-            "lang": "ko",
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=headers, params=params)
-        return res.json()
+        return self._request("search", dict(kwargs, query=query))
 
     def sites_summary(self, site_id, **kwargs):
         """
@@ -1149,17 +2303,141 @@ class Map:
         dict
             검색 결과
         """
-        url = f"https://map.naver.com/v5/api/sites/summary/{site_id}"
-        headers = {
-            'content-type': 'application/json',
-            'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/105.0.0.0 Safari/537.36',
-        }
-        params = {
-            "lang": "ko",
-        }
-        params.update(kwargs)
-        res = requests.get(url, headers=headers, params=params)
-        return res.json()
+        return self._request("sites_summary", dict(kwargs, site_id=site_id))
+
+    def iter_enriched_places(self, queries, max_workers=8, **kwargs):
+        """
+        장소 검색 결과 요약 정보 순회
+
+        검색어별로 장소를 검색하고, 검색어 사이에서 중복된 장소 ID와 이 인스턴스에서
+        이미 처리한 장소 ID를 제외한 뒤 장소 요약을 동시에 조회하여 완료되는 대로
+        반환합니다. 장소 요약은 각 검색이 끝나는 즉시 조회를 시작하며, 검색에 실패하거나
+        2xx가 아닌 응답을 받은 검색어는 query와 status만 담아 반환합니다. 장소 ID는 요약을
+        2xx 응답으로 받은 경우에만 처리한 것으로 기록합니다.
+
+        Parameters
+        ----------
+        queries : list
+            검색어 목록
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+        kwargs : dict
+            search 파라미터
+
+        Yields
+        ------
+        dict
+            검색 결과와 장소 요약(summary)을 합친 장소 정보
+        """
+        def search(query):
+            try:
+                return self._request("search", dict(kwargs, query=query), _parse_json_ok), "OK"
+            except requests.RequestException as e:
+                return None, _error_status(e)
+
+        def summarize(place):
+            try:
+                return self._request("sites_summary", {"site_id": place["id"]}, _parse_json_ok), "OK"
+            except requests.RequestException as e:
+                return None, _error_status(e)
+
+        calls = {"search": search, "summary": summarize}
+        enrichment = _Enrichment(queries, self.enriched_ids)
+        max_workers = max(1, max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {}
+
+            def submit():
+                while len(pending) < max_workers * 2:
+                    job = enrichment.next_job()
+                    if job is None:
+                        return
+                    pending[executor.submit(calls[job[0]], job[1])] = job
+
+            submit()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, item = pending.pop(future)
+                    yield from enrichment.records(kind, item, *future.result())
+                submit()
+
+    def enrich_places(self, queries, max_workers=8, **kwargs):
+        """
+        장소 검색 결과 요약 정보 수집
+
+        Parameters
+        ----------
+        queries : list
+            검색어 목록
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+        kwargs : dict
+            search 파라미터
+
+        Returns
+        -------
+        DataFrame
+            장소 정보 (요약 정보는 summary_ 접두사 열)
+        """
+        records = list(self.iter_enriched_places(queries, max_workers, **kwargs))
+        return pd.json_normalize(records, sep="_")
+
+    def crawl_places(self, query, bbox, cap=None, max_depth=6, max_workers=8, retries=2, **kwargs):
+        """
+        영역 분할 장소 수집
+
+        영역을 타일로 나누어 검색하고, 결과 개수 제한에 걸린 타일만 4개로 다시
+        나누어 검색하는 과정을 반복하여 영역 안의 장소를 중복 없이 수집합니다.
+        같은 깊이의 타일은 동시에 검색합니다.
+
+        검색에 실패하거나 2xx가 아닌 응답을 받은 타일은 같은 깊이에서 retries번까지 다시
+        검색합니다. 끝내 실패한 타일과 max_depth에서도 결과 개수 제한에 걸린 타일은
+        경고(RuntimeWarning)와 함께 결과의 attrs["failed_tiles"], attrs["saturated_tiles"]에
+        담아 반환합니다.
+
+        Parameters
+        ----------
+        query : string
+            검색어
+        bbox : tuple
+            검색 영역 (최소 경도, 최소 위도, 최대 경도, 최대 위도)
+        cap : int, OPTIONAL
+            검색 1회의 최대 결과 수 (미지정 시 응답의 totalCount로 판단)
+        max_depth : int, OPTIONAL
+            최대 분할 깊이 (미지정 시 기본 값: 6)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+        retries : int, OPTIONAL
+            실패한 타일을 다시 검색할 횟수 (미지정 시 기본 값: 2)
+        kwargs : dict
+            search 파라미터
+
+        Returns
+        -------
+        DataFrame
+            장소 목록 (attrs에 failed_tiles, saturated_tiles)
+        """
+        def search(tile):
+            try:
+                return self._request("search", _tile_params(query, tile, kwargs), _parse_json_ok)
+            except (requests.RequestException, ValueError):
+                return None
+
+        places, failed = {}, []
+        tiles = [tuple(bbox)]
+        for depth in range(max_depth + 1):
+            saturated = []
+            for _ in range(retries + 1):
+                results = _map_concurrent(search, tiles, max_workers)
+                tiles = _crawl_tiles(places, tiles, results, cap, saturated)
+                if not tiles:
+                    break
+            failed.extend(tiles)
+            if depth == max_depth or not saturated:
+                break
+            tiles = [t for tile in saturated for t in _split_tile(tile)]
+        return _crawl_frame(places, failed, saturated, max_depth)
 
     def transit_directions_point_to_point(self, start, goal, **kwargs):
         """
@@ -1179,15 +2457,66 @@ class Map:
         dict
             검색 결과
         """
-        url = "https://map.naver.com/v5/api/transit/directions/point-to-point"
-        params = {
-            "start": start,
-            "goal": goal,
-            "crs": "EPSG:4326",
-            "mode": "TIME",
-            "lang": "ko",
-            "includeDetailOperation": "true",
-        }
-        params.update(kwargs)
-        res = requests.get(url, params=params)
-        return res.json()
+        return self._request("transit_directions_point_to_point", dict(kwargs, start=start, goal=goal))
+
+    def transit_matrix(self, origins, destinations, max_workers=8, **kwargs):
+        """
+        대중교통 소요 시간 행렬 조회
+
+        Parameters
+        ----------
+        origins : list
+            출발지 좌표 목록 ("경도,위도" 또는 (경도, 위도))
+        destinations : list
+            도착지 좌표 목록 ("경도,위도" 또는 (경도, 위도))
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+        kwargs : dict
+            transit_directions_point_to_point 파라미터
+
+        Returns
+        -------
+        ndarray
+            최단 경로 소요 시간 행렬(분) (실패한 쌍은 NaN)
+        """
+        origins, destinations, pairs = _transit_pairs(origins, destinations)
+
+        def route(pair):
+            try:
+                return _transit_duration(self.transit_directions_point_to_point(*pair, **kwargs))
+            except requests.RequestException:
+                return np.nan
+
+        return _transit_matrix(origins, destinations, pairs, _map_concurrent(route, pairs, max_workers))
+
+    def transit_isochrone(self, origin, minutes=(15, 30, 45, 60), radius_km=5, size=11, max_workers=8, **kwargs):
+        """
+        대중교통 도달권 표본 조회
+
+        출발지를 중심으로 한 size x size 격자점까지의 소요 시간을 동시에 조회하여
+        시간별 도달 가능 여부를 반환합니다.
+
+        Parameters
+        ----------
+        origin : string or tuple
+            출발지 좌표 ("경도,위도" 또는 (경도, 위도))
+        minutes : tuple, OPTIONAL
+            도달 시간 기준(분) (미지정 시 기본 값: 15, 30, 45, 60)
+        radius_km : float, OPTIONAL
+            격자 반경(km) (미지정 시 기본 값: 5)
+        size : int, OPTIONAL
+            격자 한 변의 점 개수 (미지정 시 기본 값: 11)
+        max_workers : int, OPTIONAL
+            동시 요청 수 (미지정 시 기본 값: 8)
+        kwargs : dict
+            transit_directions_point_to_point 파라미터
+
+        Returns
+        -------
+        dict
+            lon, lat (격자 좌표), duration (소요 시간(분)), masks (기준 시간별 도달 가능 여부)
+        """
+        center, lon, lat = _isochrone_grid(origin, radius_km, size)
+        points = list(zip(lon.ravel(), lat.ravel()))
+        duration = self.transit_matrix([center], points, max_workers, **kwargs)
+        return _isochrone_result(lon, lat, duration, minutes)
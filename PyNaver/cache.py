@@ -0,0 +1,419 @@
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from urllib.parse import urlsplit
+from .ratelimit import _FAMILIES, endpoint_family
+
+
+_FAMILY_NAMES = {family for _, family in _FAMILIES} | {"default"}
+
+DEFAULT_TTLS = {
+    "search": 600,
+    "datalab": 3600,
+    "papago": 30 * 86400,
+    "util": 30 * 86400,
+    "maps": 30 * 86400,
+    "summary": 30 * 86400,
+    "map": 86400,
+    # 대중교통 길찾기는 실시간 운행 정보를 반영하므로 짧게 보관
+    "transit_directions_point_to_point": 600,
+    "default": 3600,
+}
+
+
+def _canonical(value):
+    if isinstance(value, bytes):
+        value = value.decode("utf-8")
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return value
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def _parser_name(parse):
+    func = getattr(parse, "func", parse)
+    keywords = getattr(parse, "keywords", {})
+    return f"{func.__module__}.{func.__qualname__}{sorted(keywords.items())}"
+
+
+def _request_key(method, url, parse, params, body):
+    raw = "\n".join([method, url, _parser_name(parse),
+                     _canonical(params or {}), _canonical(body)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite 기반 응답 캐시 클래스
+
+    엔드포인트, 정렬된 파라미터와 본문을 키로 파싱된 결과를 저장하므로
+    캐시 적중 시 네트워크 요청과 JSON 디코딩을 모두 생략합니다.
+    같은 호스트의 여러 프로세스가 하나의 파일을 공유할 수 있습니다.
+
+    Parameters
+    ----------
+    path : string, OPTIONAL
+        SQLite 파일 경로 (미지정 시 기본 값: pynaver_cache.sqlite)
+    ttls : dict, OPTIONAL
+        보관 시간(초) (None: 만료 없음, 0: 저장 안 함). 키는 엔드포인트 이름(메서드 이름,
+        예: sites_summary, geocoding, search_blog), "/"로 시작하는 URL 경로 접두사
+        (예: /v5/api/search) 또는 엔드포인트 그룹(search, datalab, maps, map 등)이며
+        이 순서로 찾습니다. 그룹 이름과 같은 엔드포인트 이름(Map.search의 search)은
+        그룹으로 해석하므로 URL 경로로 지정합니다. (미지정 그룹은 DEFAULT_TTLS 적용)
+    """
+
+    def __init__(self, path="pynaver_cache.sqlite", ttls=None):
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, expires REAL, value BLOB)")
+
+    def key(self, method, url, parse, params=None, body=None):
+        """
+        캐시 키 생성
+
+        Parameters
+        ----------
+        method : string
+            HTTP 메서드
+        url : string
+            요청 URL
+        parse : callable
+            응답 파서
+        params : dict, OPTIONAL
+            쿼리 파라미터
+        body : bytes or dict, OPTIONAL
+            요청 본문
+
+        Returns
+        -------
+        string
+            캐시 키
+        """
+        return _request_key(method, url, parse, params, body)
+
+    def ttl_for(self, url, body=None, endpoint=None):
+        """
+        요청의 보관 시간
+
+        엔드포인트 이름, URL 경로, 엔드포인트 그룹 순으로 ttls에서 찾습니다.
+        그룹 값을 사용하는 데이터랩 요청 중 종료일이 오늘 이전인 요청은 결과가
+        바뀌지 않으므로 만료 없이 보관합니다.
+
+        Parameters
+        ----------
+        url : string
+            요청 URL
+        body : bytes or dict, OPTIONAL
+            요청 본문
+        endpoint : string, OPTIONAL
+            엔드포인트 이름 (예: sites_summary)
+
+        Returns
+        -------
+        float
+            보관 시간(초) (None: 만료 없음)
+        """
+        if endpoint in self.ttls and endpoint not in _FAMILY_NAMES:
+            return self.ttls[endpoint]
+        path = urlsplit(url).path
+        prefixes = [key for key in self.ttls if key.startswith("/") and path.startswith(key)]
+        if prefixes:
+            return self.ttls[max(prefixes, key=len)]
+        family = endpoint_family(url)
+        if family == "datalab":
+            try:
+                end = date.fromisoformat(json.loads(body)["endDate"])
+            except (TypeError, ValueError, KeyError):
+                end = None
+            if end is not None and end < date.today():
+                return None
+        return self.ttls.get(family, self.ttls["default"])
+
+    def get(self, key):
+        """
+        캐시 조회
+
+        Parameters
+        ----------
+        key : string
+            캐시 키
+
+        Returns
+        -------
+        tuple
+            (결과,) 또는 캐시에 없으면 None
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT expires, value FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None or (row[0] is not None and row[0] < time.time()):
+            return None
+        return (pickle.loads(row[1]),)
+
+    def set(self, key, value, ttl):
+        """
+        캐시 저장
+
+        Parameters
+        ----------
+        key : string
+            캐시 키
+        value : object
+            저장할 결과
+        ttl : float
+            보관 시간(초) (None: 만료 없음, 0: 저장 안 함)
+        """
+        if ttl == 0:
+            return
+        expires = None if ttl is None else time.time() + ttl
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (key, expires, blob))
+
+    def clear(self, expired_only=False):
+        """
+        캐시 삭제
+
+        Parameters
+        ----------
+        expired_only : bool, OPTIONAL
+            만료된 항목만 삭제할지 여부 (미지정 시 기본 값: False)
+        """
+        with self.lock:
+            if expired_only:
+                self.conn.execute(
+                    "DELETE FROM responses WHERE expires IS NOT NULL AND expires < ?",
+                    (time.time(),))
+            else:
+                self.conn.execute("DELETE FROM responses")
+
+
+class LRUCache:
+    """
+    프로세스 내 LRU 응답 캐시 클래스
+
+    Parameters
+    ----------
+    maxsize : int, OPTIONAL
+        최대 항목 수 (미지정 시 기본 값: 10000)
+    ttl : float, OPTIONAL
+        응답 보관 시간(초) (미지정 시 만료 없음)
+    """
+
+    def __init__(self, maxsize=10000, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, method, url, parse, params=None, body=None):
+        """
+        캐시 키 생성 (ResponseCache.key와 동일)
+        """
+        return _request_key(method, url, parse, params, body)
+
+    def ttl_for(self, url, body=None, endpoint=None):
+        """
+        요청의 보관 시간 (모든 요청에 ttl 적용)
+        """
+        return self.ttl
+
+    def get(self, key):
+        """
+        캐시 조회
+
+        Parameters
+        ----------
+        key : string
+            캐시 키
+
+        Returns
+        -------
+        tuple
+            (결과,) 또는 캐시에 없으면 None
+        """
+        with self.lock:
+            entry = self.data.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > time.monotonic():
+                    self.data.move_to_end(key)
+                    self.hits += 1
+                    return (value,)
+                del self.data[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, value, ttl=None):
+        """
+        캐시 저장
+
+        Parameters
+        ----------
+        key : string
+            캐시 키
+        value : object
+            저장할 결과
+        ttl : float, OPTIONAL
+            보관 시간(초) (None: 만료 없음, 0: 저장 안 함)
+        """
+        if ttl == 0:
+            return
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self.lock:
+            self.data[key] = (value, expires)
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def stats(self):
+        """
+        캐시 통계
+
+        Returns
+        -------
+        dict
+            hits, misses, size, maxsize
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self.data),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self):
+        """
+        캐시 및 통계 초기화
+        """
+        with self.lock:
+            self.data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class CoordinateCache(LRUCache):
+    """
+    좌표 양자화 LRU 캐시 클래스
+
+    좌표를 precision 자리로 반올림한 뒤 조회하므로 몇 미터 이내의 좌표는
+    같은 항목을 사용합니다. (소수점 4자리는 약 11m, 5자리는 약 1.1m)
+
+    Parameters
+    ----------
+    maxsize : int, OPTIONAL
+        최대 항목 수 (미지정 시 기본 값: 10000)
+    precision : int, OPTIONAL
+        좌표 소수점 자릿수 (미지정 시 기본 값: 4)
+    ttl : float, OPTIONAL
+        응답 보관 시간(초) (미지정 시 만료 없음)
+    """
+
+    def __init__(self, maxsize=10000, precision=4, ttl=None):
+        super().__init__(maxsize, ttl)
+        self.precision = precision
+
+    def quantize(self, coords):
+        """
+        좌표 양자화
+
+        Parameters
+        ----------
+        coords : string
+            "경도,위도" 형식의 좌표
+
+        Returns
+        -------
+        string
+            반올림한 좌표
+        """
+        return ",".join(f"{float(v):.{self.precision}f}" for v in coords.split(","))
+
+
+class TranslationMemory:
+    """
+    번역 메모리 클래스
+
+    원문과 번역문 쌍을 SQLite에 저장하여 같은 문장을 다시 번역 요청하지
+    않도록 합니다.
+
+    Parameters
+    ----------
+    path : string, OPTIONAL
+        SQLite 파일 경로 (미지정 시 기본 값: pynaver_tm.sqlite, ":memory:"는 프로세스 내 보관)
+    """
+
+    def __init__(self, path="pynaver_tm.sqlite"):
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations "
+            "(source TEXT, target TEXT, text TEXT, translated TEXT, "
+            "PRIMARY KEY (source, target, text))")
+
+    def get_many(self, source, target, texts):
+        """
+        번역문 조회
+
+        Parameters
+        ----------
+        source : string
+            원본 언어
+        target : string
+            번역 언어
+        texts : list
+            원문 목록
+
+        Returns
+        -------
+        dict
+            저장된 원문별 번역문
+        """
+        found = {}
+        texts = list(texts)
+        with self.lock:
+            for i in range(0, len(texts), 500):
+                chunk = texts[i:i + 500]
+                rows = self.conn.execute(
+                    "SELECT text, translated FROM translations "
+                    "WHERE source = ? AND target = ? AND text IN (%s)" % ",".join("?" * len(chunk)),
+                    [source, target] + chunk).fetchall()
+                found.update(rows)
+        return found
+
+    def set_many(self, source, target, pairs):
+        """
+        번역문 저장
+
+        Parameters
+        ----------
+        source : string
+            원본 언어
+        target : string
+            번역 언어
+        pairs : dict
+            원문별 번역문
+        """
+        with self.lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?)",
+                [(source, target, text, translated) for text, translated in pairs.items()])
@@ -0,0 +1,235 @@
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+import requests
+from requests.structures import CaseInsensitiveDict
+from .cache import _canonical
+
+
+_HEADERS = ("Content-Type", "Retry-After")
+
+
+class CassetteMissError(Exception):
+    """
+    replay 모드에서 카세트에 없는 요청을 보냈을 때 발생하는 예외
+    """
+
+    def __init__(self, method, url):
+        super().__init__(f"카세트에 기록되지 않은 요청입니다: {method} {url}")
+        self.method = method
+        self.url = url
+
+
+def _request_key(method, url, kwargs):
+    params = {k: v for k, v in (kwargs.get("params") or {}).items() if v is not None}
+    body = kwargs.get("data", kwargs.get("json"))
+    raw = "\n".join([method.upper(), url, _canonical(params), _canonical(body)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """
+    요청/응답 기록 및 재생 Transport 클래스
+
+    클라이언트의 transport로 지정하면 Naver, NaverCloudPlatform, Map의 요청과 응답 쌍을
+    gzip으로 압축한 JSONL 파일(카세트)에 기록하고, 재생 모드에서는 네트워크 없이 기록한
+    응답을 반환합니다. 인증 정보가 담긴 요청 헤더는 기록하지 않습니다.
+    같은 요청이 여러 번 기록되어 있으면 기록 순서대로 반환하고, 마지막 응답을 반복합니다.
+
+    Parameters
+    ----------
+    path : string
+        카세트 파일 경로
+    mode : string, OPTIONAL
+        동작 방식 (replay: 재생만, record: 항상 요청 후 기록, auto: 기록된 요청은 재생하고
+        없는 요청만 요청 후 기록) (미지정 시 기본 값: replay)
+    transport : Transport, OPTIONAL
+        record, auto 모드에서 실제 요청에 사용할 Transport (미지정 시 공유 기본 Transport 사용)
+    latency : float, OPTIONAL
+        재생 시 기록된 응답 시간에 곱해 대기할 배율 (0: 대기 없음, 1: 기록된 시간만큼 대기)
+        (미지정 시 기본 값: 0)
+    """
+
+    def __init__(self, path, mode="replay", transport=None, latency=0.0):
+        if mode not in ("replay", "record", "auto"):
+            raise ValueError(f"지원하지 않는 모드입니다: {mode}")
+        if mode != "replay" and transport is None:
+            transport = self._default_transport()
+        self.path = path
+        self.mode = mode
+        self.transport = transport
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.positions = {}
+        self.file = None
+        if os.path.exists(path):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.entries.setdefault(entry["key"], []).append(entry)
+
+    def _default_transport(self):
+        from .transport import get_default_transport
+        return get_default_transport()
+
+    def __len__(self):
+        return sum(len(entries) for entries in self.entries.values())
+
+    def _lookup(self, method, url, key):
+        with self.lock:
+            entries = self.entries.get(key)
+            if not entries:
+                if self.mode == "replay":
+                    raise CassetteMissError(method, url)
+                return None
+            position = self.positions.get(key, 0)
+            self.positions[key] = position + 1
+            return entries[min(position, len(entries) - 1)]
+
+    def _response(self, entry):
+        res = requests.Response()
+        res.status_code = entry["status"]
+        res.headers = CaseInsensitiveDict(entry["headers"])
+        res.url = entry["url"]
+        res.encoding = "utf-8"
+        if "body_b64" in entry:
+            res._content = base64.b64decode(entry["body_b64"])
+        else:
+            res._content = entry["body"].encode("utf-8")
+        return res
+
+    def _record(self, method, key, res, elapsed):
+        content = res.content
+        entry = {
+            "key": key,
+            "method": method.upper(),
+            "url": str(res.url),
+            "status": res.status_code,
+            "headers": {k: res.headers[k] for k in _HEADERS if k in res.headers},
+            "elapsed": round(elapsed, 6),
+        }
+        try:
+            entry["body"] = content.decode("utf-8")
+        except UnicodeDecodeError:
+            entry["body_b64"] = base64.b64encode(content).decode("ascii")
+        with self.lock:
+            if self.file is None:
+                self.file = gzip.open(self.path, "at", encoding="utf-8")
+            self.file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self.file.flush()
+            self.entries.setdefault(key, []).append(entry)
+            self.positions[key] = len(self.entries[key])
+
+    def request(self, method, url, **kwargs):
+        """
+        HTTP 요청 (재생 또는 요청 후 기록)
+
+        Parameters
+        ----------
+        method : string
+            HTTP 메서드
+        url : string
+            요청 URL
+        kwargs : dict
+            요청 파라미터
+
+        Returns
+        -------
+        Response
+            응답 객체
+        """
+        key = _request_key(method, url, kwargs)
+        if self.mode != "record":
+            entry = self._lookup(method, url, key)
+            if entry is not None:
+                if self.latency:
+                    time.sleep(entry["elapsed"] * self.latency)
+                return self._response(entry)
+        start = time.perf_counter()
+        res = self.transport.request(method, url, **kwargs)
+        self._record(method, key, res, time.perf_counter() - start)
+        return res
+
+    def close(self):
+        """
+        카세트 파일 닫기
+        """
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AsyncCassette(Cassette):
+    """
+    비동기 요청/응답 기록 및 재생 Transport 클래스
+
+    AsyncNaver, AsyncNaverCloudPlatform, AsyncMap의 transport로 지정합니다.
+    record, auto 모드에서는 AsyncTransport가 필요합니다.
+
+    Parameters
+    ----------
+    path : string
+        카세트 파일 경로
+    mode : string, OPTIONAL
+        동작 방식 (replay, record, auto) (미지정 시 기본 값: replay)
+    transport : AsyncTransport, OPTIONAL
+        record, auto 모드에서 실제 요청에 사용할 AsyncTransport (미지정 시 새로 생성)
+    latency : float, OPTIONAL
+        재생 시 기록된 응답 시간에 곱해 대기할 배율 (미지정 시 기본 값: 0)
+    """
+
+    def _default_transport(self):
+        from .aio import AsyncTransport
+        return AsyncTransport()
+
+    async def request(self, method, url, **kwargs):
+        """
+        비동기 HTTP 요청 (재생 또는 요청 후 기록)
+
+        Parameters
+        ----------
+        method : string
+            HTTP 메서드
+        url : string
+            요청 URL
+        kwargs : dict
+            요청 파라미터
+
+        Returns
+        -------
+        Response
+            응답 객체
+        """
+        key = _request_key(method, url, kwargs)
+        if self.mode != "record":
+            entry = self._lookup(method, url, key)
+            if entry is not None:
+                if self.latency:
+                    await asyncio.sleep(entry["elapsed"] * self.latency)
+                return self._response(entry)
+        start = time.perf_counter()
+        res = await self.transport.request(method, url, **kwargs)
+        self._record(method, key, res, time.perf_counter() - start)
+        return res
+
+    async def aclose(self):
+        """
+        카세트 파일과 Transport 닫기
+        """
+        self.close()
+        if self.transport is not None:
+            await self.transport.aclose()
@@ -0,0 +1,279 @@
+import re
+import threading
+from bisect import bisect_left
+from datetime import date
+from urllib.parse import urlsplit
+from .ratelimit import endpoint_family
+
+
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def endpoint_name(url):
+    """
+    요청 URL의 엔드포인트 이름 반환
+
+    경로 중 숫자로만 된 부분(장소 ID 등)은 {id}로 바꿔 엔드포인트별로 집계되도록 합니다.
+
+    Parameters
+    ----------
+    url : string
+        요청 URL
+
+    Returns
+    -------
+    string
+        엔드포인트 이름 (예: openapi.naver.com/v1/search/blog.json)
+    """
+    parts = urlsplit(url)
+    return parts.hostname + re.sub(r"/\d+(?=/|$)", "/{id}", parts.path)
+
+
+def _body_size(request):
+    if request is None:
+        return 0
+    body = getattr(request, "body", None)
+    if body is None:
+        body = getattr(request, "content", None)
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    try:
+        return len(body)
+    except TypeError:
+        return 0
+
+
+class _EndpointStats:
+    def __init__(self, family, buckets):
+        self.family = family
+        self.statuses = {}
+        self.buckets = [0] * (len(buckets) + 1)
+        self.latency_sum = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+class Metrics:
+    """
+    요청 계측 클래스
+
+    Transport(또는 AsyncTransport)에 지정하면 엔드포인트별 응답 시간 히스토그램,
+    요청/응답 바이트, 상태 코드별 횟수, 재시도 횟수, 캐시 적중 횟수와 엔드포인트
+    그룹별 일일 요청 수를 집계합니다. 결과는 snapshot(dict), to_prometheus(텍스트)
+    또는 callback으로 내보낼 수 있습니다.
+
+    Parameters
+    ----------
+    buckets : tuple, OPTIONAL
+        응답 시간 히스토그램 구간 상한(초) (미지정 시 기본 값: DEFAULT_BUCKETS)
+    quotas : dict, OPTIONAL
+        엔드포인트 그룹별 일일 요청 한도 (예: {"search": 25000, "datalab": 1000})
+    callback : callable, OPTIONAL
+        이벤트마다 호출할 함수 (event, endpoint, family 등을 담은 dict를 인자로 받음)
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, quotas=None, callback=None):
+        self.buckets = tuple(sorted(buckets))
+        self.quotas = dict(quotas or {})
+        self.callback = callback
+        self.lock = threading.Lock()
+        self.endpoints = {}
+        self.day = date.today()
+        self.daily = {}
+
+    def _stats(self, url):
+        endpoint = endpoint_name(url)
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = _EndpointStats(endpoint_family(url), self.buckets)
+        return endpoint, stats
+
+    def _emit(self, event):
+        if self.callback is not None:
+            self.callback(event)
+
+    def observe(self, url, res, elapsed):
+        """
+        요청 한 번의 결과 기록
+
+        Parameters
+        ----------
+        url : string
+            요청 URL
+        res : Response
+            응답 객체 (연결 오류 시 None)
+        elapsed : float
+            응답 시간(초)
+        """
+        status = "error" if res is None else str(res.status_code)
+        request_bytes = 0 if res is None else _body_size(res.request)
+        response_bytes = 0 if res is None else len(res.content)
+        with self.lock:
+            endpoint, stats = self._stats(url)
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.buckets[bisect_left(self.buckets, elapsed)] += 1
+            stats.latency_sum += elapsed
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+            today = date.today()
+            if today != self.day:
+                self.day = today
+                self.daily = {}
+            self.daily[stats.family] = self.daily.get(stats.family, 0) + 1
+        self._emit({
+            "event": "request",
+            "endpoint": endpoint,
+            "family": stats.family,
+            "status": status,
+            "elapsed": elapsed,
+            "request_bytes": request_bytes,
+            "response_bytes": response_bytes,
+        })
+
+    def retry(self, url):
+        """
+        재시도 기록
+
+        Parameters
+        ----------
+        url : string
+            요청 URL
+        """
+        with self.lock:
+            endpoint, stats = self._stats(url)
+            stats.retries += 1
+        self._emit({"event": "retry", "endpoint": endpoint, "family": stats.family})
+
+    def cache(self, url, hit):
+        """
+        캐시 조회 결과 기록
+
+        Parameters
+        ----------
+        url : string
+            요청 URL
+        hit : bool
+            적중 여부
+        """
+        with self.lock:
+            endpoint, stats = self._stats(url)
+            if hit:
+                stats.cache_hits += 1
+            else:
+                stats.cache_misses += 1
+        self._emit({"event": "cache_hit" if hit else "cache_miss",
+                    "endpoint": endpoint, "family": stats.family})
+
+    def snapshot(self):
+        """
+        현재 집계 결과
+
+        Returns
+        -------
+        dict
+            endpoints: 엔드포인트별 requests, statuses, latency(count, sum, buckets),
+            request_bytes, response_bytes, retries, cache_hits, cache_misses
+            quota: 엔드포인트 그룹별 오늘 요청 수(used), 한도(limit), 남은 요청 수(remaining)
+        """
+        with self.lock:
+            endpoints = {}
+            for endpoint, stats in self.endpoints.items():
+                cumulative = 0
+                buckets = {}
+                for bound, count in zip(self.buckets + (float("inf"),), stats.buckets):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                endpoints[endpoint] = {
+                    "family": stats.family,
+                    "requests": cumulative,
+                    "statuses": dict(stats.statuses),
+                    "latency": {"count": cumulative, "sum": stats.latency_sum, "buckets": buckets},
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                    "retries": stats.retries,
+                    "cache_hits": stats.cache_hits,
+                    "cache_misses": stats.cache_misses,
+                }
+            daily = self.daily if self.day == date.today() else {}
+            quota = {}
+            for family in sorted(set(daily) | set(self.quotas)):
+                used = daily.get(family, 0)
+                limit = self.quotas.get(family)
+                quota[family] = {
+                    "used": used,
+                    "limit": limit,
+                    "remaining": None if limit is None else max(0, limit - used),
+                }
+        return {"endpoints": endpoints, "quota": quota}
+
+    def to_prometheus(self, prefix="pynaver"):
+        """
+        Prometheus 텍스트 형식으로 내보내기
+
+        Parameters
+        ----------
+        prefix : string, OPTIONAL
+            지표 이름 접두어 (미지정 시 기본 값: pynaver)
+
+        Returns
+        -------
+        string
+            Prometheus exposition 형식의 텍스트
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for suffix, labels, value in samples:
+                label = ",".join(f'{k}="{v}"' for k, v in labels.items())
+                lines.append(f"{prefix}_{name}{suffix}{{{label}}} {value}")
+
+        endpoints = snapshot["endpoints"]
+
+        def labels(endpoint, **extra):
+            return dict(endpoint=endpoint, family=endpoints[endpoint]["family"], **extra)
+
+        family("requests_total", "counter", "HTTP requests by status code", [
+            ("", labels(endpoint, status=status), count)
+            for endpoint, stats in endpoints.items()
+            for status, count in sorted(stats["statuses"].items())])
+        samples = []
+        for endpoint, stats in endpoints.items():
+            latency = stats["latency"]
+            for bound, count in latency["buckets"].items():
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                samples.append(("_bucket", labels(endpoint, le=le), count))
+            samples.append(("_sum", labels(endpoint), latency["sum"]))
+            samples.append(("_count", labels(endpoint), latency["count"]))
+        family("request_duration_seconds", "histogram", "HTTP request latency", samples)
+        for name, key, help_text in (
+                ("request_bytes_total", "request_bytes", "HTTP request body bytes"),
+                ("response_bytes_total", "response_bytes", "HTTP response body bytes"),
+                ("retries_total", "retries", "Retried requests"),
+                ("cache_hits_total", "cache_hits", "Response cache hits"),
+                ("cache_misses_total", "cache_misses", "Response cache misses")):
+            family(name, "counter", help_text, [
+                ("", labels(endpoint), stats[key]) for endpoint, stats in endpoints.items()])
+        quota = snapshot["quota"]
+        family("quota_used", "gauge", "Requests sent today by endpoint family", [
+            ("", {"family": name}, usage["used"]) for name, usage in quota.items()])
+        family("quota_limit", "gauge", "Daily request quota by endpoint family", [
+            ("", {"family": name}, usage["limit"]) for name, usage in quota.items()
+            if usage["limit"] is not None])
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """
+        집계 초기화
+        """
+        with self.lock:
+            self.endpoints = {}
+            self.day = date.today()
+            self.daily = {}
@@ -0,0 +1,137 @@
+import sqlite3
+import threading
+import time
+
+
+_FAMILIES = (
+    ("openapi.naver.com/v1/search/", "search"),
+    ("openapi.naver.com/v1/datalab/", "datalab"),
+    ("openapi.naver.com/v1/papago/", "papago"),
+    ("openapi.naver.com/v1/krdict/", "papago"),
+    ("openapi.naver.com/v1/util/", "util"),
+    ("apigw.ntruss.com/map-", "maps"),
+    ("apigw.ntruss.com/text-summary/", "summary"),
+    ("map.naver.com/", "map"),
+)
+
+
+def endpoint_family(url):
+    """
+    요청 URL의 엔드포인트 그룹 반환
+
+    Parameters
+    ----------
+    url : string
+        요청 URL
+
+    Returns
+    -------
+    string
+        엔드포인트 그룹 (search, datalab, papago, util, maps, summary, map, default)
+    """
+    for prefix, family in _FAMILIES:
+        if prefix in url:
+            return family
+    return "default"
+
+
+def _take(tokens, updated, rate, capacity, now):
+    tokens = min(capacity, tokens + max(0.0, now - updated) * rate) - 1
+    delay = -tokens / rate if tokens < 0 else 0.0
+    return tokens, max(updated, now), delay
+
+
+class _MemoryStore:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.state = {}
+
+    def reserve(self, key, rate, capacity):
+        with self.lock:
+            now = time.time()
+            tokens, updated = self.state.get(key, (capacity, now))
+            tokens, updated, delay = _take(tokens, updated, rate, capacity, now)
+            self.state[key] = (tokens, updated)
+            return delay
+
+
+class _SQLiteStore:
+    def __init__(self, path):
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets "
+            "(key TEXT PRIMARY KEY, tokens REAL, updated REAL)")
+
+    def reserve(self, key, rate, capacity):
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self.conn.execute(
+                    "SELECT tokens, updated FROM buckets WHERE key = ?", (key,)).fetchone()
+                tokens, updated = row if row else (capacity, now)
+                tokens, updated, delay = _take(tokens, updated, rate, capacity, now)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?)", (key, tokens, updated))
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            return delay
+
+
+class RateLimiter:
+    """
+    엔드포인트 그룹별 토큰 버킷 요청 제한 클래스
+
+    스레드 간에 안전하게 공유되며, path를 지정하면 SQLite 파일을 통해
+    같은 호스트의 여러 프로세스가 하나의 한도를 나누어 씁니다.
+
+    Parameters
+    ----------
+    limits : dict
+        엔드포인트 그룹별 한도 목록 (예: {"search": [(10, 1), (25000, 86400)]}는
+        1초에 10회, 하루에 25000회)
+    path : string, OPTIONAL
+        프로세스 간 공유에 사용할 SQLite 파일 경로 (미지정 시 프로세스 내 공유)
+    """
+
+    def __init__(self, limits, path=None):
+        self.limits = {family: [(count / period, count) for count, period in rules]
+                       for family, rules in limits.items()}
+        self.store = _SQLiteStore(path) if path else _MemoryStore()
+
+    def reserve(self, url):
+        """
+        요청 1회분 토큰 예약
+
+        Parameters
+        ----------
+        url : string
+            요청 URL
+
+        Returns
+        -------
+        float
+            요청 전에 기다려야 하는 시간(초)
+        """
+        family = endpoint_family(url)
+        delay = 0.0
+        for i, (rate, capacity) in enumerate(self.limits.get(family, ())):
+            delay = max(delay, self.store.reserve(f"{family}:{i}", rate, capacity))
+        return delay
+
+    def acquire(self, url):
+        """
+        토큰을 예약하고 필요한 만큼 대기
+
+        Parameters
+        ----------
+        url : string
+            요청 URL
+        """
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,276 @@
+from ._lazy import LazyModule
+
+pd = LazyModule("pandas")
+
+
+class SearchRecord:
+    """
+    검색 결과 항목 공통 클래스
+
+    __slots__로 필드를 고정하여 dict보다 적은 메모리로 항목 하나를 보관합니다.
+    응답에 있지만 필드에 없는 키는 무시합니다.
+    """
+
+    __slots__ = ()
+    kind = None
+    categorical = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    @classmethod
+    def from_dict(cls, item):
+        """
+        응답 항목(dict)으로 레코드 생성
+
+        Parameters
+        ----------
+        item : dict
+            검색 API 응답의 items 항목
+
+        Returns
+        -------
+        SearchRecord
+            레코드
+        """
+        return cls(**item)
+
+    def to_dict(self):
+        """
+        dict 변환
+
+        Returns
+        -------
+        dict
+            필드별 값
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class BlogItem(SearchRecord):
+    """
+    블로그 검색 결과 항목
+    """
+    __slots__ = ("title", "link", "description", "bloggername", "bloggerlink", "postdate")
+    kind = "blog"
+    categorical = ("bloggername", "bloggerlink", "postdate")
+
+
+class NewsItem(SearchRecord):
+    """
+    뉴스 검색 결과 항목
+    """
+    __slots__ = ("title", "originallink", "link", "description", "pubDate")
+    kind = "news"
+    categorical = ()
+
+
+class BookItem(SearchRecord):
+    """
+    책 검색 결과 항목
+    """
+    __slots__ = ("title", "link", "image", "author", "discount", "publisher", "pubdate",
+                 "isbn", "description")
+    kind = "book"
+    categorical = ("author", "publisher", "pubdate", "discount")
+
+
+class EncycItem(SearchRecord):
+    """
+    백과사전 검색 결과 항목
+    """
+    __slots__ = ("title", "link", "description", "thumbnail")
+    kind = "encyc"
+    categorical = ()
+
+
+class MovieItem(SearchRecord):
+    """
+    영화 검색 결과 항목
+    """
+    __slots__ = ("title", "link", "image", "subtitle", "pubDate", "director", "actor",
+                 "userRating")
+    kind = "movie"
+    categorical = ("pubDate", "director", "userRating")
+
+
+class CafeArticleItem(SearchRecord):
+    """
+    카페글 검색 결과 항목
+    """
+    __slots__ = ("title", "link", "description", "cafename", "cafeurl")
+    kind = "cafearticle"
+    categorical = ("cafename", "cafeurl")
+
+
+class KinItem(SearchRecord):
+    """
+    지식iN 검색 결과 항목
+    """
+    __slots__ = ("title", "link", "description")
+    kind = "kin"
+    categorical = ()
+
+
+class WebkrItem(SearchRecord):
+    """
+    웹문서 검색 결과 항목
+    """
+    __slots__ = ("title", "link", "description")
+    kind = "webkr"
+    categorical = ()
+
+
+class ImageItem(SearchRecord):
+    """
+    이미지 검색 결과 항목
+    """
+    __slots__ = ("title", "link", "thumbnail", "sizeheight", "sizewidth")
+    kind = "image"
+    categorical = ("sizeheight", "sizewidth")
+
+
+class LocalItem(SearchRecord):
+    """
+    지역 검색 결과 항목
+    """
+    __slots__ = ("title", "link", "category", "description", "telephone", "address",
+                 "roadAddress", "mapx", "mapy")
+    kind = "local"
+    categorical = ("category",)
+
+
+class ShopItem(SearchRecord):
+    """
+    쇼핑 검색 결과 항목
+    """
+    __slots__ = ("title", "link", "image", "lprice", "hprice", "mallName", "productId",
+                 "productType", "brand", "maker", "category1", "category2", "category3",
+                 "category4")
+    kind = "shop"
+    categorical = ("hprice", "mallName", "productType", "brand", "maker",
+                   "category1", "category2", "category3", "category4")
+
+
+class DocItem(SearchRecord):
+    """
+    전문자료 검색 결과 항목
+    """
+    __slots__ = ("title", "link", "description")
+    kind = "doc"
+    categorical = ()
+
+
+RECORD_TYPES = {cls.kind: cls for cls in (
+    BlogItem, NewsItem, BookItem, EncycItem, MovieItem, CafeArticleItem, KinItem,
+    WebkrItem, ImageItem, LocalItem, ShopItem, DocItem,
+)}
+
+
+class SearchColumns:
+    """
+    검색 결과 열 단위 누적 클래스
+
+    항목을 필드별 list에 쌓고, 반복이 많은 문자열 필드(블로거 이름, 카테고리,
+    쇼핑몰 이름 등)는 같은 값을 하나의 객체로 공유합니다. 페이지마다 DataFrame을
+    만들지 않으므로 대량 수집 시 메모리 사용량이 크게 줄어듭니다.
+
+    Parameters
+    ----------
+    kind : string
+        검색 종류 (blog, news, book, encyc, movie, cafearticle, kin, webkr, image, local, shop, doc)
+    categorical : tuple, OPTIONAL
+        값을 공유하고 범주형으로 변환할 필드 (미지정 시 검색 종류별 기본 필드)
+    """
+
+    def __init__(self, kind, categorical=None):
+        if kind not in RECORD_TYPES:
+            raise ValueError(f"지원하지 않는 검색 종류입니다: {kind}")
+        self.kind = kind
+        self.record_type = RECORD_TYPES[kind]
+        self.categorical = frozenset(self.record_type.categorical if categorical is None
+                                     else categorical)
+        self.columns = {}
+        self.strings = {}
+        self.size = 0
+
+    def extend(self, items):
+        """
+        항목 추가
+
+        Parameters
+        ----------
+        items : list
+            검색 API 응답의 items 목록 (dict 또는 SearchRecord)
+
+        Returns
+        -------
+        SearchColumns
+            자기 자신
+        """
+        columns = self.columns
+        strings = self.strings
+        for item in items:
+            if isinstance(item, SearchRecord):
+                item = item.to_dict()
+            for key in item:
+                if key not in columns:
+                    columns[key] = [None] * self.size
+            for key, column in columns.items():
+                value = item.get(key)
+                if key in self.categorical and isinstance(value, str):
+                    value = strings.setdefault(value, value)
+                column.append(value)
+            self.size += 1
+        return self
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return self.records()
+
+    def records(self):
+        """
+        레코드 순회
+
+        Yields
+        ------
+        SearchRecord
+            검색 종류별 레코드 (필드에 없는 열은 제외)
+        """
+        names = [name for name in self.record_type.__slots__ if name in self.columns]
+        for values in zip(*(self.columns[name] for name in names)):
+            yield self.record_type(**dict(zip(names, values)))
+
+    def to_frame(self, categorical=True):
+        """
+        DataFrame 변환
+
+        Parameters
+        ----------
+        categorical : bool, OPTIONAL
+            공유 대상 필드를 범주형(category)으로 변환할지 여부 (미지정 시 기본 값: True)
+
+        Returns
+        -------
+        DataFrame
+            검색 결과
+        """
+        data = {}
+        for key, column in self.columns.items():
+            if categorical and key in self.categorical:
+                data[key] = pd.Categorical(column)
+            else:
+                data[key] = column
+        return pd.DataFrame(data, index=pd.RangeIndex(self.size))
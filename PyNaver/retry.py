@@ -0,0 +1,196 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+
+class CircuitOpenError(Exception):
+    """
+    회로 차단기가 열려 있어 요청을 보내지 않았을 때 발생하는 예외
+    """
+
+    def __init__(self, host, retry_in):
+        super().__init__(f"{host} 회로 차단 중 ({retry_in:.1f}초 후 재시도 가능)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class RetryPolicy:
+    """
+    재시도 정책 클래스
+
+    지터를 적용한 지수 백오프로 재시도하며, 응답에 Retry-After 헤더가 있으면
+    그 값을 우선합니다.
+
+    Parameters
+    ----------
+    total : int, OPTIONAL
+        최대 재시도 횟수 (미지정 시 기본 값: 3)
+    backoff_factor : float, OPTIONAL
+        백오프 기준 시간(초) (미지정 시 기본 값: 0.5)
+    max_backoff : float, OPTIONAL
+        최대 대기 시간(초) (미지정 시 기본 값: 30)
+    status_forcelist : tuple, OPTIONAL
+        재시도할 HTTP 상태 코드 (미지정 시 기본 값: 429, 500, 502, 503, 504)
+    respect_retry_after : bool, OPTIONAL
+        Retry-After 헤더 반영 여부 (미지정 시 기본 값: True)
+    """
+
+    def __init__(self,
+                 total=3,
+                 backoff_factor=0.5,
+                 max_backoff=30,
+                 status_forcelist=(429, 500, 502, 503, 504),
+                 respect_retry_after=True,
+                 ):
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.status_forcelist = frozenset(status_forcelist)
+        self.respect_retry_after = respect_retry_after
+
+    def should_retry(self, attempt, res=None):
+        """
+        재시도 여부
+
+        Parameters
+        ----------
+        attempt : int
+            지금까지 재시도한 횟수
+        res : Response, OPTIONAL
+            응답 객체 (미지정 시 연결 오류로 간주)
+
+        Returns
+        -------
+        bool
+            재시도 여부
+        """
+        if attempt >= self.total:
+            return False
+        return res is None or res.status_code in self.status_forcelist
+
+    def backoff(self, attempt, res=None):
+        """
+        다음 재시도까지 대기할 시간
+
+        Parameters
+        ----------
+        attempt : int
+            지금까지 재시도한 횟수
+        res : Response, OPTIONAL
+            응답 객체
+
+        Returns
+        -------
+        float
+            대기 시간(초)
+        """
+        if self.respect_retry_after and res is not None:
+            retry_after = _parse_retry_after(res.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** attempt))
+
+
+def _parse_retry_after(value):
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """
+    호스트별 회로 차단기 클래스
+
+    연속 실패가 failure_threshold회에 이르면 reset_timeout 동안 해당 호스트로의
+    요청을 즉시 CircuitOpenError로 실패시키고, 이후 한 번의 시험 요청이
+    성공하면 다시 요청을 허용합니다.
+
+    Parameters
+    ----------
+    failure_threshold : int, OPTIONAL
+        회로를 여는 연속 실패 횟수 (미지정 시 기본 값: 5)
+    reset_timeout : float, OPTIONAL
+        회로를 연 뒤 시험 요청까지 기다리는 시간(초) (미지정 시 기본 값: 30)
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+        self.failures = {}
+        self.opened_at = {}
+        self.probing = set()
+
+    def before_request(self, host):
+        """
+        요청 허용 여부 확인
+
+        Parameters
+        ----------
+        host : string
+            요청 호스트
+
+        Returns
+        -------
+        bool
+            이 요청이 회로를 다시 닫기 위한 시험 요청인지 여부
+
+        Raises
+        ------
+        CircuitOpenError
+            회로가 열려 있는 경우
+        """
+        with self.lock:
+            opened_at = self.opened_at.get(host)
+            if opened_at is None:
+                return False
+            retry_in = opened_at + self.reset_timeout - time.monotonic()
+            if retry_in > 0 or host in self.probing:
+                raise CircuitOpenError(host, max(0.0, retry_in))
+            self.probing.add(host)
+            return True
+
+    def record(self, host, success):
+        """
+        요청 결과 기록
+
+        Parameters
+        ----------
+        host : string
+            요청 호스트
+        success : bool
+            성공 여부
+        """
+        with self.lock:
+            self.probing.discard(host)
+            if success:
+                self.failures.pop(host, None)
+                self.opened_at.pop(host, None)
+                return
+            failures = self.failures.get(host, 0) + 1
+            self.failures[host] = failures
+            if failures >= self.failure_threshold:
+                self.opened_at[host] = time.monotonic()
+
+    def release(self, host):
+        """
+        결과를 기록하지 않고 시험 요청 종료
+
+        요청이 응답이나 네트워크 오류 외의 예외(중단, 취소 등)로 끝났을 때
+        다른 요청이 다시 시험 요청을 보낼 수 있도록 합니다.
+
+        Parameters
+        ----------
+        host : string
+            요청 호스트
+        """
+        with self.lock:
+            self.probing.discard(host)
@@ -0,0 +1,166 @@
+import csv
+import json
+import os
+import threading
+
+
+class _Sink:
+    """
+    내보내기 대상 공통 클래스
+
+    기록을 마친 조각(페이지, 청크)의 키를 manifest 파일에 남겨, 중단된 내보내기를
+    다시 실행하면 이미 기록한 조각을 건너뜁니다.
+
+    Parameters
+    ----------
+    path : string
+        출력 경로
+    manifest : string, OPTIONAL
+        manifest 파일 경로 (미지정 시 기본 값: path + ".manifest.jsonl")
+    """
+
+    def __init__(self, path, manifest=None):
+        self.path = path
+        self.manifest = manifest or f"{path}.manifest.jsonl"
+        self.lock = threading.Lock()
+        self.done = set()
+        if os.path.exists(self.manifest):
+            with open(self.manifest, encoding="utf-8") as f:
+                self.done = {json.loads(line)["key"] for line in f if line.strip()}
+
+    def write(self, key, records):
+        """
+        조각 기록
+
+        Parameters
+        ----------
+        key : string
+            조각 키
+        records : list
+            기록할 행 목록 (dict)
+
+        Returns
+        -------
+        bool
+            기록 여부 (이미 기록한 조각이면 False)
+        """
+        with self.lock:
+            if key in self.done:
+                return False
+            if records:
+                self._write(records)
+            with open(self.manifest, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"key": key, "rows": len(records)}, ensure_ascii=False) + "\n")
+            self.done.add(key)
+            return True
+
+    def _write(self, records):
+        raise NotImplementedError
+
+    def close(self):
+        """
+        출력 종료
+        """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class JSONLSink(_Sink):
+    """
+    JSONL 내보내기 클래스
+
+    Parameters
+    ----------
+    path : string
+        출력 파일 경로
+    manifest : string, OPTIONAL
+        manifest 파일 경로 (미지정 시 기본 값: path + ".manifest.jsonl")
+    """
+
+    def _write(self, records):
+        with open(self.path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+
+class CSVSink(_Sink):
+    """
+    CSV 내보내기 클래스
+
+    첫 조각의 열을 기준으로 기록하며, 이후 조각의 다른 열은 무시합니다.
+
+    Parameters
+    ----------
+    path : string
+        출력 파일 경로
+    manifest : string, OPTIONAL
+        manifest 파일 경로 (미지정 시 기본 값: path + ".manifest.jsonl")
+    """
+
+    def __init__(self, path, manifest=None):
+        super().__init__(path, manifest)
+        self.fields = None
+        if os.path.exists(path) and os.path.getsize(path):
+            with open(path, encoding="utf-8-sig", newline="") as f:
+                self.fields = next(csv.reader(f))
+
+    def _write(self, records):
+        header = self.fields is None
+        if header:
+            self.fields = list(dict.fromkeys(k for record in records for k in record))
+        with open(self.path, "a", encoding="utf-8-sig" if header else "utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.fields, extrasaction="ignore")
+            if header:
+                writer.writeheader()
+            writer.writerows(records)
+
+
+class ParquetSink(_Sink):
+    """
+    Parquet 내보내기 클래스
+
+    조각마다 path 디렉터리에 part 파일 하나를 기록합니다. 임시 파일에 기록을 마친 뒤
+    이름을 바꾸고 manifest에 남기므로, 중단되더라도 manifest에 남은 조각은 모두 읽을 수
+    있는 파일로 존재합니다. 열은 첫 part 파일의 스키마를 따릅니다. pyarrow가 필요합니다.
+
+    Parameters
+    ----------
+    path : string
+        출력 디렉터리 경로
+    manifest : string, OPTIONAL
+        manifest 파일 경로 (미지정 시 기본 값: path + ".manifest.jsonl")
+    """
+
+    def __init__(self, path, manifest=None):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError(
+                "Parquet로 내보내려면 pyarrow를 설치해야 합니다: pip install pyarrow")
+        super().__init__(path, manifest)
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        os.makedirs(path, exist_ok=True)
+        parts = sorted(p for p in os.listdir(path)
+                       if p.startswith("part-") and p.endswith(".parquet"))
+        self.count = len(parts)
+        self.schema = self.pq.read_schema(os.path.join(path, parts[0])) if parts else None
+
+    def _write(self, records):
+        if self.schema is None:
+            table = self.pa.Table.from_pylist(records)
+            self.schema = table.schema
+        else:
+            table = self.pa.Table.from_pylist(records, schema=self.schema)
+        while os.path.exists(os.path.join(self.path, f"part-{self.count:05d}.parquet")):
+            self.count += 1
+        name = f"part-{self.count:05d}.parquet"
+        temp = os.path.join(self.path, f".{name}.tmp")
+        self.pq.write_table(table, temp)
+        os.replace(temp, os.path.join(self.path, name))
+        self.count += 1
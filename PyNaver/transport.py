@@ -0,0 +1,183 @@
+import threading
+import time
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class Transport:
+    """
+    HTTP 전송 계층 클래스
+
+    keep-alive 세션을 보유하여 Naver, NaverCloudPlatform, Map 클래스가
+    같은 호스트에 대한 연결을 재사용하도록 합니다.
+
+    Parameters
+    ----------
+    session : requests.Session, optional
+        사용할 세션 (미지정 시 새 세션 생성)
+    adapter : requests.adapters.HTTPAdapter, optional
+        http/https에 마운트할 어댑터 (미지정 시 pool 설정으로 생성)
+    pool_connections : int, optional
+        커넥션 풀을 유지할 호스트 수 (미지정 시 기본 값: 10)
+    pool_maxsize : int, optional
+        호스트별 커넥션 풀 크기 (미지정 시 기본 값: 10)
+    timeout : float or tuple, optional
+        요청 타임아웃(초)
+    rate_limiter : RateLimiter, optional
+        요청 전에 적용할 요청 제한
+    retry : RetryPolicy, optional
+        일시적 오류에 대한 재시도 정책
+    circuit_breaker : CircuitBreaker, optional
+        호스트별 회로 차단기
+    metrics : Metrics, optional
+        요청 계측
+    """
+
+    def __init__(self,
+                 session=None,
+                 adapter=None,
+                 pool_connections=10,
+                 pool_maxsize=10,
+                 timeout=None,
+                 rate_limiter=None,
+                 retry=None,
+                 circuit_breaker=None,
+                 metrics=None,
+                 ):
+        if session is None:
+            session = requests.Session()
+            if adapter is None:
+                adapter = HTTPAdapter(pool_connections=pool_connections,
+                                      pool_maxsize=pool_maxsize)
+        if adapter is not None:
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.metrics = metrics
+
+    def request(self, method, url, **kwargs):
+        """
+        HTTP 요청
+
+        Parameters
+        ----------
+        method : string
+            HTTP 메서드
+        url : string
+            요청 URL
+        kwargs : dict
+            requests.Session.request 파라미터
+
+        Returns
+        -------
+        Response
+            응답 객체
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        host = urlsplit(url).hostname
+        attempt = 0
+        while True:
+            probe = self._before_request(host)
+            try:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(url)
+                start = time.perf_counter()
+                res = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self._record(host, False)
+                self._observe(url, None, start)
+                if self.retry is None or not self.retry.should_retry(attempt):
+                    raise
+                delay = self.retry.backoff(attempt)
+            except requests.RequestException:
+                self._record(host, False)
+                self._observe(url, None, start)
+                raise
+            except BaseException:
+                if probe:
+                    self.circuit_breaker.release(host)
+                raise
+            else:
+                self._record(host, res.status_code < 500)
+                self._observe(url, res, start)
+                if self.retry is None or not self.retry.should_retry(attempt, res):
+                    return res
+                delay = self.retry.backoff(attempt, res)
+            if self.metrics is not None:
+                self.metrics.retry(url)
+            time.sleep(delay)
+            attempt += 1
+
+    def _before_request(self, host):
+        if self.circuit_breaker is None:
+            return False
+        return self.circuit_breaker.before_request(host)
+
+    def _record(self, host, success):
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(host, success)
+
+    def _observe(self, url, res, start):
+        if self.metrics is not None:
+            self.metrics.observe(url, res, time.perf_counter() - start)
+
+    def close(self):
+        """
+        세션 종료
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport():
+    """
+    모든 클라이언트가 공유하는 기본 Transport 반환
+
+    Returns
+    -------
+    Transport
+        기본 Transport
+    """
+    global _default_transport
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                _default_transport = Transport()
+    return _default_transport
+
+
+def resolve_transport(transport=None, session=None):
+    """
+    클라이언트 생성자 인자로부터 Transport 결정
+
+    Parameters
+    ----------
+    transport : Transport, optional
+        사용할 Transport
+    session : requests.Session, optional
+        사용할 세션 (transport 미지정 시 이 세션으로 Transport 생성)
+
+    Returns
+    -------
+    Transport
+        사용할 Transport
+    """
+    if transport is not None:
+        return transport
+    if session is not None:
+        return Transport(session=session)
+    return get_default_transport()
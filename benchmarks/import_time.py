@@ -0,0 +1,59 @@
+"""
+import PyNaver 시간 회귀 검사
+
+새 인터프리터에서 import PyNaver를 여러 번 실행하여 최소 시간을 측정하고,
+pandas 또는 numpy가 함께 import되거나 시간이 기준을 넘으면 0이 아닌 값으로 종료합니다.
+
+사용법
+------
+python benchmarks/import_time.py [--max-ms 300] [--repeat 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import PyNaver\n"
+    "elapsed = time.perf_counter() - start\n"
+    "heavy = [m for m in ('pandas', 'numpy') if m in sys.modules]\n"
+    "print(elapsed, ','.join(heavy))\n"
+)
+
+
+def measure():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    out = subprocess.run([sys.executable, "-c", PROBE], env=env, check=True,
+                         capture_output=True, text=True).stdout.split()
+    return float(out[0]), out[1].split(",") if len(out) > 1 else []
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-ms", type=float, default=300, help="허용 import 시간(ms)")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 횟수")
+    args = parser.parse_args()
+
+    results = [measure() for _ in range(args.repeat)]
+    best = min(elapsed for elapsed, _ in results) * 1000
+    heavy = sorted({m for _, modules in results for m in modules})
+    print(f"import PyNaver: {best:.1f}ms (최소 {args.repeat}회), 기준 {args.max_ms:.0f}ms")
+
+    failed = False
+    if heavy:
+        print(f"실패: import PyNaver가 {', '.join(heavy)}를 import합니다")
+        failed = True
+    if best > args.max_ms:
+        print("실패: import 시간이 기준을 넘었습니다")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
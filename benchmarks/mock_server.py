@@ -0,0 +1,301 @@
+"""
+벤치마크용 로컬 API 서버
+
+openapi.naver.com, naveropenapi.apigw.ntruss.com, map.naver.com의 응답 형식을 흉내 내는
+HTTP 서버입니다. 응답 지연, 응답 크기, 오류(5xx)와 429 응답 비율을 지정할 수 있습니다.
+
+LocalAdapter(requests) 또는 local_async_transport(httpx)를 사용하면 PyNaver의 요청 URL을
+바꾸지 않고 이 서버로 보낼 수 있습니다. 요청 경로 앞에 원래 호스트를 붙여 보내므로
+(예: /openapi.naver.com/v1/search/blog.json) 하나의 서버가 모든 호스트를 처리합니다.
+"""
+import json
+import random
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from requests.adapters import HTTPAdapter
+
+
+def _periods(body):
+    try:
+        start = date.fromisoformat(body["startDate"])
+        end = date.fromisoformat(body["endDate"])
+    except (KeyError, TypeError, ValueError):
+        return []
+    return [(start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1)]
+
+
+class MockServer:
+    """
+    로컬 API 서버 클래스
+
+    Parameters
+    ----------
+    latency : float, OPTIONAL
+        응답 지연(초) (미지정 시 기본 값: 0)
+    jitter : float, OPTIONAL
+        지연에 더할 0 ~ jitter 사이의 무작위 시간(초) (미지정 시 기본 값: 0)
+    items : int, OPTIONAL
+        목록 응답의 최대 항목 수 (검색 display가 더 작으면 display) (미지정 시 기본 값: 10)
+    text_bytes : int, OPTIONAL
+        항목별 설명 문자열 길이 (미지정 시 기본 값: 100)
+    error_rate : float, OPTIONAL
+        500 응답 비율 (미지정 시 기본 값: 0)
+    throttle_rate : float, OPTIONAL
+        429 응답 비율 (Retry-After: 0) (미지정 시 기본 값: 0)
+    seed : int, OPTIONAL
+        오류 주입 난수 시드
+    host : string, OPTIONAL
+        바인드 주소 (미지정 시 기본 값: 127.0.0.1)
+    port : int, OPTIONAL
+        포트 (미지정 시 기본 값: 0, 빈 포트 자동 선택)
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, items=10, text_bytes=100, error_rate=0.0,
+                 throttle_rate=0.0, seed=None, host="127.0.0.1", port=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.items = items
+        self.text_bytes = text_bytes
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                server._handle(self, None)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                server._handle(self, self.rfile.read(length))
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        """
+        서버 주소 (예: http://127.0.0.1:8080)
+        """
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """
+        서버 시작 (별도 스레드)
+        """
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """
+        서버 종료
+        """
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _handle(self, handler, body):
+        with self.lock:
+            self.requests += 1
+            roll = self.random.random()
+            delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+        parts = urlsplit(handler.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        headers = {}
+        if roll < self.throttle_rate:
+            status, payload = 429, {"errorMessage": "Rate limit exceeded", "errorCode": "012"}
+            headers["Retry-After"] = "0"
+        elif roll < self.throttle_rate + self.error_rate:
+            status, payload = 500, {"errorMessage": "Internal server error", "errorCode": "999"}
+        else:
+            if body:
+                try:
+                    body = json.loads(body)
+                except ValueError:
+                    body = {k: v[-1] for k, v in parse_qs(body.decode("utf-8")).items()}
+            status, payload = self._route(parts.path, query, body or {})
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json; charset=utf-8")
+        handler.send_header("Content-Length", str(len(data)))
+        for key, value in headers.items():
+            handler.send_header(key, value)
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def _text(self, seed):
+        return (f"{seed} " + "가나다라마바사" * (self.text_bytes // 7 + 1))[:self.text_bytes]
+
+    def _route(self, path, query, body):
+        if "/v1/search/" in path:
+            start = int(query.get("start", 1))
+            count = min(int(query.get("display", 10)), self.items)
+            return 200, {
+                "lastBuildDate": "Mon, 01 Jan 2024 00:00:00 +0900",
+                "total": 1000,
+                "start": start,
+                "display": count,
+                "items": [{
+                    "title": f"{query.get('query', '')} {start + i}",
+                    "link": f"https://blog.naver.com/mock/{start + i}",
+                    "description": self._text(start + i),
+                    "bloggername": f"블로거{(start + i) % 50}",
+                    "bloggerlink": f"blog.naver.com/mock{(start + i) % 50}",
+                    "postdate": "20240101",
+                } for i in range(count)],
+            }
+        if "/v1/datalab/" in path:
+            periods = _periods(body)
+            groups = body.get("keywordGroups") or body.get("category") or [{"name": body.get("keyword")}]
+            return 200, {
+                "startDate": body.get("startDate"),
+                "endDate": body.get("endDate"),
+                "timeUnit": body.get("timeUnit"),
+                "results": [{
+                    "title": group.get("groupName") or group.get("name"),
+                    "keywords": group.get("keywords") or group.get("param") or [],
+                    "data": [{"period": p, "ratio": float((i * 7 + j) % 100)}
+                             for j, p in enumerate(periods)],
+                } for i, group in enumerate(groups)],
+            }
+        if "/v1/util/shorturl" in path:
+            return 200, {"result": {"url": "https://me2.do/mock", "hash": "mock",
+                                    "orgUrl": query.get("url")}, "code": "200", "message": "ok"}
+        if "/v1/papago/" in path:
+            return 200, {"message": {"result": {"srcLangType": body.get("source"),
+                                                "tarLangType": body.get("target"),
+                                                "translatedText": body.get("text", "")}}}
+        if "/v1/krdict/" in path:
+            return 200, {"aResult": [{"sFirstName": query.get("query", "")[:1],
+                                      "aItems": [{"name": "Mock", "score": "99"}]}]}
+        if "/map-geocode/" in path:
+            return 200, {
+                "status": "OK",
+                "meta": {"totalCount": 1, "page": 1, "count": 1},
+                "addresses": [{
+                    "roadAddress": query.get("query"),
+                    "jibunAddress": query.get("query"),
+                    "x": "126.9783882",
+                    "y": "37.5666103",
+                    "distance": 0.0,
+                }],
+                "errorMessage": "",
+            }
+        if "/map-reversegeocode/" in path:
+            return 200, {
+                "status": {"code": 0, "name": "ok", "message": "done"},
+                "results": [{
+                    "name": name,
+                    "code": {"id": "1114016200", "type": "L", "mappingId": "09140104"},
+                    "region": {f"area{i}": {"name": f"지역{i}"} for i in range(5)},
+                } for name in query.get("orders", "legalcode").split(",")],
+            }
+        if "/map-direction" in path:
+            option = query.get("option", "traoptimal").split(":")[0]
+            return 200, {
+                "code": 0,
+                "message": "길찾기를 성공하였습니다.",
+                "route": {option: [{
+                    "summary": {"distance": 12345, "duration": 1234567, "tollFare": 0,
+                                "taxiFare": 12000, "fuelPrice": 1500},
+                    "path": [[126.97 + i * 1e-4, 37.56 + i * 1e-4] for i in range(self.items)],
+                }]},
+            }
+        if "/text-summary/" in path:
+            content = (body.get("document") or {}).get("content", "")
+            return 200, {"summary": content[:self.text_bytes]}
+        if "/v5/api/search" in path:
+            return 200, {"result": {"place": {"totalCount": self.items, "list": [{
+                "id": str(1000000 + i),
+                "name": f"{query.get('query', '')} {i}",
+                "x": str(126.97 + i * 1e-3),
+                "y": str(37.56 + i * 1e-3),
+                "category": ["음식점", "카페"],
+                "address": self._text(i),
+            } for i in range(self.items)]}}}
+        if "/v5/api/sites/summary/" in path:
+            site_id = path.rstrip("/").rsplit("/", 1)[-1]
+            return 200, {"id": site_id, "name": f"장소 {site_id}", "description": self._text(site_id)}
+        if "/v5/api/transit/" in path:
+            return 200, {"paths": [{"duration": 30 + i, "distance": 10000} for i in range(3)]}
+        return 404, {"errorMessage": f"Unknown path: {path}"}
+
+
+def _local_url(base, url):
+    parts = urlsplit(url)
+    target = f"{base}/{parts.hostname}{parts.path}"
+    return f"{target}?{parts.query}" if parts.query else target
+
+
+class LocalAdapter(HTTPAdapter):
+    """
+    요청을 MockServer로 보내는 requests 어댑터
+
+    Parameters
+    ----------
+    server : MockServer
+        요청을 받을 서버
+    kwargs : dict
+        HTTPAdapter 파라미터 (pool_connections, pool_maxsize 등)
+    """
+
+    def __init__(self, server, **kwargs):
+        super().__init__(**kwargs)
+        self.base = server.url
+
+    def send(self, request, **kwargs):
+        request.url = _local_url(self.base, request.url)
+        return super().send(request, **kwargs)
+
+
+def local_async_transport(server, **kwargs):
+    """
+    요청을 MockServer로 보내는 httpx 비동기 전송 객체 생성
+
+    Parameters
+    ----------
+    server : MockServer
+        요청을 받을 서버
+    kwargs : dict
+        httpx.AsyncHTTPTransport 파라미터 (limits 등)
+
+    Returns
+    -------
+    httpx.AsyncBaseTransport
+        전송 객체
+    """
+    import httpx
+
+    class LocalAsyncTransport(httpx.AsyncBaseTransport):
+        def __init__(self):
+            self.inner = httpx.AsyncHTTPTransport(**kwargs)
+
+        async def handle_async_request(self, request):
+            request.url = httpx.URL(_local_url(server.url, str(request.url)))
+            return await self.inner.handle_async_request(request)
+
+        async def aclose(self):
+            await self.inner.aclose()
+
+    return LocalAsyncTransport()
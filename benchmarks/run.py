@@ -0,0 +1,225 @@
+"""
+PyNaver 오프라인 벤치마크
+
+로컬 MockServer를 띄우고 검색, 데이터랩, 지오코딩, 지도 검색 경로를 여러 동시성 수준에서
+호출하여 초당 호출 수, p50/p99 응답 시간, 동시 호출당 메모리(tracemalloc 최고치)를 측정합니다.
+--baseline으로 이전 결과(JSON)를 지정하면 초당 호출 수가 tolerance 이상 떨어진 항목이 있을 때
+0이 아닌 값으로 종료합니다.
+
+사용법
+------
+python benchmarks/run.py [--paths search,datalab,geocoding,map] [--concurrency 1,4,16]
+                         [--calls 200] [--latency 0.005] [--items 100] [--text-bytes 100]
+                         [--error-rate 0] [--throttle-rate 0] [--raw] [--async]
+                         [--json results.json] [--baseline results.json] [--tolerance 0.2]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import requests
+from PyNaver import Naver, NaverCloudPlatform, Map, Transport, RetryPolicy
+from mock_server import MockServer, LocalAdapter, local_async_transport
+
+
+PATHS = {
+    "search": lambda c, i: c["naver"].search_blog(f"검색어{i}", display=100),
+    "datalab": lambda c, i: c["naver"].datalab_search(
+        "2023-01-01", "2023-12-31", "date",
+        [{"groupName": f"그룹{i}", "keywords": [f"키워드{i}"]}]),
+    "geocoding": lambda c, i: c["ncp"].geocoding(f"서울특별시 중구 세종대로 {i}"),
+    "map": lambda c, i: c["map"].search(f"카페 {i}"),
+}
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def _ok(result):
+    return not isinstance(result, (requests.Response, Exception)) and \
+        type(result).__name__ != "Response"
+
+
+def _clients(transport, raw, asynchronous):
+    if asynchronous:
+        from PyNaver import AsyncNaver, AsyncNaverCloudPlatform, AsyncMap
+        return {
+            "naver": AsyncNaver("id", "secret", transport=transport, raw=raw),
+            "ncp": AsyncNaverCloudPlatform("id", "secret", transport=transport, raw=raw),
+            "map": AsyncMap(transport=transport, raw=raw),
+        }
+    return {
+        "naver": Naver("id", "secret", transport=transport, raw=raw),
+        "ncp": NaverCloudPlatform("id", "secret", transport=transport, raw=raw),
+        "map": Map(transport=transport, raw=raw),
+    }
+
+
+def run_sync(server, path, concurrency, calls, raw, retry):
+    adapter = LocalAdapter(server, pool_connections=4, pool_maxsize=concurrency)
+    transport = Transport(session=requests.Session(), adapter=adapter, retry=retry)
+    clients = _clients(transport, raw, False)
+    call = PATHS[path]
+
+    def timed(i):
+        start = time.perf_counter()
+        try:
+            result = call(clients, i)
+        except Exception as e:
+            result = e
+        return time.perf_counter() - start, _ok(result)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, range(concurrency)))
+        start = time.perf_counter()
+        samples = list(executor.map(timed, range(calls)))
+        wall = time.perf_counter() - start
+        tracemalloc.start()
+        list(executor.map(timed, range(min(calls, concurrency * 10))))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    transport.close()
+    return samples, wall, peak
+
+
+def run_async(server, path, concurrency, calls, raw, retry):
+    import httpx
+    from PyNaver import AsyncTransport
+
+    async def main():
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        client = httpx.AsyncClient(transport=local_async_transport(server, limits=limits))
+        transport = AsyncTransport(client=client, retry=retry)
+        clients = _clients(transport, raw, True)
+        call = PATHS[path]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def timed(i):
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    result = await call(clients, i)
+                except Exception as e:
+                    result = e
+                return time.perf_counter() - start, _ok(result)
+
+        await asyncio.gather(*[timed(i) for i in range(concurrency)])
+        start = time.perf_counter()
+        samples = await asyncio.gather(*[timed(i) for i in range(calls)])
+        wall = time.perf_counter() - start
+        tracemalloc.start()
+        await asyncio.gather(*[timed(i) for i in range(min(calls, concurrency * 10))])
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        await transport.aclose()
+        return samples, wall, peak
+
+    return asyncio.run(main())
+
+
+def benchmark(server, path, concurrency, calls, raw=False, asynchronous=False, retry=None):
+    """
+    한 경로를 한 동시성 수준에서 측정
+
+    Returns
+    -------
+    dict
+        path, mode, concurrency, calls, errors, calls_per_sec, p50_ms, p99_ms, mem_kib_per_call
+    """
+    runner = run_async if asynchronous else run_sync
+    samples, wall, peak = runner(server, path, concurrency, calls, raw, retry)
+    latencies = [elapsed for elapsed, _ in samples]
+    return {
+        "path": path,
+        "mode": ("async" if asynchronous else "sync") + ("-raw" if raw else ""),
+        "concurrency": concurrency,
+        "calls": calls,
+        "errors": sum(1 for _, ok in samples if not ok),
+        "calls_per_sec": calls / wall,
+        "p50_ms": _percentile(latencies, 0.5) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "mem_kib_per_call": peak / concurrency / 1024,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    기준 결과 대비 초당 호출 수가 tolerance 이상 떨어진 항목 목록
+    """
+    previous = {(r["path"], r["mode"], r["concurrency"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get((result["path"], result["mode"], result["concurrency"]))
+        if before and result["calls_per_sec"] < before["calls_per_sec"] * (1 - tolerance):
+            regressions.append((result, before))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PyNaver 오프라인 벤치마크")
+    parser.add_argument("--paths", default=",".join(PATHS), help="측정할 경로 (쉼표 구분)")
+    parser.add_argument("--concurrency", default="1,4,16", help="동시성 수준 (쉼표 구분)")
+    parser.add_argument("--calls", type=int, default=200, help="수준별 호출 수")
+    parser.add_argument("--latency", type=float, default=0.005, help="서버 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="서버 응답 지연 편차(초)")
+    parser.add_argument("--items", type=int, default=100, help="목록 응답 항목 수")
+    parser.add_argument("--text-bytes", type=int, default=100, help="항목별 설명 길이")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--retries", type=int, default=3, help="재시도 횟수")
+    parser.add_argument("--raw", action="store_true", help="raw 모드 클라이언트 사용")
+    parser.add_argument("--async", dest="asynchronous", action="store_true",
+                        help="비동기 클라이언트 사용 (httpx 필요)")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 초당 호출 수 감소 비율")
+    args = parser.parse_args()
+
+    paths = [p for p in args.paths.split(",") if p]
+    unknown = set(paths) - set(PATHS)
+    if unknown:
+        parser.error(f"지원하지 않는 경로입니다: {', '.join(sorted(unknown))}")
+    retry = RetryPolicy(total=args.retries, backoff_factor=0.01) if args.retries else None
+
+    results = []
+    print(f"{'path':<10} {'mode':<10} {'conc':>5} {'calls/s':>9} {'p50 ms':>8} "
+          f"{'p99 ms':>8} {'KiB/call':>9} {'errors':>7}")
+    with MockServer(latency=args.latency, jitter=args.jitter, items=args.items,
+                    text_bytes=args.text_bytes, error_rate=args.error_rate,
+                    throttle_rate=args.throttle_rate, seed=0) as server:
+        for path in paths:
+            for concurrency in [int(c) for c in args.concurrency.split(",") if c]:
+                result = benchmark(server, path, concurrency, args.calls, args.raw,
+                                   args.asynchronous, retry)
+                results.append(result)
+                print(f"{result['path']:<10} {result['mode']:<10} {concurrency:>5} "
+                      f"{result['calls_per_sec']:>9.1f} {result['p50_ms']:>8.2f} "
+                      f"{result['p99_ms']:>8.2f} {result['mem_kib_per_call']:>9.1f} "
+                      f"{result['errors']:>7}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for result, before in regressions:
+            print(f"회귀: {result['path']} {result['mode']} 동시성 {result['concurrency']}: "
+                  f"{before['calls_per_sec']:.1f} -> {result['calls_per_sec']:.1f} calls/s")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,6 +19,10 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url=__github__,
     packages=setuptools.find_packages(),
+    extras_require={
+        "async": ["httpx"],
+        "parquet": ["pyarrow"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
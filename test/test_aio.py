@@ -0,0 +1,310 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from urllib.parse import parse_qs
+import numpy as np
+import pandas as pd
+import pytest
+httpx = pytest.importorskip("httpx")
+from PyNaver import (AsyncMap, AsyncNaver, AsyncNaverCloudPlatform, AsyncTransport, CircuitBreaker,
+                     JSONLSink, TranslationMemory)
+from test_api import (by_status, datalab_handler, expected, groups, papago_handler, places_handler,
+                      tiles_handler)
+
+
+def fake_transport(handler):
+    # handler(request) -> (status, body)
+    def respond(request):
+        status, body = handler(request)
+        return httpx.Response(status, json=body)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+    return AsyncTransport(client=client)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def query(request):
+    return {k: v[-1] for k, v in parse_qs(request.url.query.decode()).items()}
+
+
+def body_handler(handler):
+    # requests용 핸들러에 httpx 요청 본문을 전달
+    return lambda request: handler(SimpleNamespace(body=request.content, url=str(request.url)))
+
+
+def search_handler(total, calls):
+    def handler(request):
+        q = query(request)
+        start, display = int(q["start"]), int(q["display"])
+        calls.append(start)
+        items = [{"title": f"{q['query']} {i}", "link": f"https://blog.naver.com/{i}"}
+                 for i in range(start, min(start + display, total + 1))]
+        return 200, {"total": total, "start": start, "display": display, "items": items}
+    return handler
+
+
+def test_iter_search_prefetches_pages():
+    calls = []
+
+    async def main():
+        async with AsyncNaver("id", "secret", transport=fake_transport(search_handler(250, calls))) as api:
+            return [len(page) async for page in api.iter_search("blog", "q")]
+
+    assert run(main()) == [100, 100, 50]
+    assert sorted(calls) == [1, 101, 201]
+
+
+def test_collect_search_outputs():
+    async def main():
+        async with AsyncNaver("id", "secret", transport=fake_transport(search_handler(250, []))) as api:
+            frame = await api.collect_search("blog", "q", display=50, limit=120)
+            raw = await api.as_raw().collect_search("blog", "q", limit=100)
+            columns = await api.collect_search("blog", "q", output="columns")
+            return frame, raw, columns
+
+    frame, raw, columns = run(main())
+    assert frame.shape[0] == 120
+    assert isinstance(raw, list) and len(raw) == 100
+    assert len(columns) == 250
+
+
+def test_datalab_search_many_rescales_on_anchor():
+    dates = pd.date_range("2022-01-01", "2022-01-10")
+    truth = {name: np.arange(1, 11) * (i + 1.0) for i, name in enumerate("abcde")}
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.body))
+        return datalab_handler(truth, dates)(request)
+
+    async def main():
+        async with AsyncNaver("id", "secret", transport=fake_transport(body_handler(handler))) as api:
+            return await api.datalab_search_many("2022-01-01", "2022-01-10", "date", groups("abcde"),
+                                                 anchor="b", chunk_size=3)
+
+    df = run(main())
+    assert len(bodies) == 2
+    assert list(df.columns) == list("abcde")
+    np.testing.assert_allclose(df.values, expected(truth, "abcde", dates).values)
+
+
+def test_datalab_windowed_stitches_windows():
+    dates = pd.date_range("2020-01-01", "2021-12-31")
+    truth = {"a": np.linspace(1, 50, len(dates)), "b": np.linspace(30, 2, len(dates))}
+
+    async def main():
+        transport = fake_transport(body_handler(datalab_handler(truth, dates)))
+        async with AsyncNaver("id", "secret", transport=transport) as api:
+            return await api.datalab_windowed("search", "2020-01-01", "2021-12-31", "date",
+                                              groups("ab"), window_days=200, overlap_days=20)
+
+    np.testing.assert_allclose(run(main()).values, expected(truth, "ab", dates).values)
+
+
+def test_breaker_probe_released_on_cancel():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record("openapi.naver.com", False)
+
+    async def slow(request):
+        await asyncio.sleep(10)
+        return httpx.Response(200)
+
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(slow))
+        transport = AsyncTransport(client=client, circuit_breaker=breaker)
+        task = asyncio.ensure_future(transport.request("GET", "https://openapi.naver.com/v1/search/blog.json"))
+        await asyncio.sleep(0.01)
+        assert breaker.probing
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await client.aclose()
+
+    run(main())
+    assert not breaker.probing
+
+
+def test_geocode_many_records_failures(tmp_path):
+    calls = []
+
+    def handler(request):
+        q = query(request)["query"]
+        calls.append(q)
+        if q == "부산":
+            return 500, {}
+        return 200, {"addresses": [{"x": "127.0", "y": "37.5", "roadAddress": q}]}
+
+    async def main():
+        async with AsyncNaverCloudPlatform("id", "secret", transport=fake_transport(handler)) as api:
+            return await api.geocode_many(["서울  시청", "부산", "서울 시청", None],
+                                          checkpoint=str(tmp_path / "geo.jsonl"))
+
+    df = run(main())
+    assert sorted(calls) == ["부산", "서울 시청"]
+    assert df["status"].tolist() == ["OK", "HTTP 500", "OK", "EMPTY"]
+    assert df["x"].tolist()[:1] == [127.0]
+    assert len((tmp_path / "geo.jsonl").read_text().splitlines()) == 1
+
+
+def test_reverse_geocode_many_requests_each_coordinate_once():
+    calls = []
+
+    def handler(request):
+        coords = query(request)["coords"]
+        calls.append(coords)
+        region = {"area1": {"name": "서울특별시"}, "area2": {"name": coords}}
+        return 200, {"results": [{"name": "legalcode", "code": {"id": "1"}, "region": region}]}
+
+    async def main():
+        async with AsyncNaverCloudPlatform("id", "secret", transport=fake_transport(handler)) as api:
+            return await api.reverse_geocode_many([127.1, 127.2, 127.1], [37.5, 37.6, 37.5],
+                                                  orders="legalcode", precision=1)
+
+    df = run(main())
+    assert sorted(calls) == ["127.1,37.5", "127.2,37.6"]
+    assert df["legalcode_area2"].tolist() == ["127.1,37.5", "127.2,37.6", "127.1,37.5"]
+    assert df["lon"].tolist() == [127.1, 127.2, 127.1]
+
+
+def test_route_matrix_packs_waypoints():
+    calls = []
+
+    def handler(request):
+        q = query(request)
+        calls.append(q)
+        stops = [q["start"]] + (q["waypoints"].split("|") if "waypoints" in q else []) + [q["goal"]]
+        legs = [{"duration": 1000, "distance": 10}] * (len(stops) - 1)
+        summary = {"duration": 1000 * len(legs), "distance": 10 * len(legs), "waypoints": legs[:-1]}
+        return 200, {"code": 0, "route": {"trafast": [{"summary": summary}]}}
+
+    async def main():
+        async with AsyncNaverCloudPlatform("id", "secret", transport=fake_transport(handler)) as api:
+            return await api.route_matrix(["1,1", "2,2"], ["1,1", "2,2", "3,3"], pack=True)
+
+    duration, distance, failed = run(main())
+    np.testing.assert_allclose(duration, [[0, 1, 1], [1, 0, 1]])
+    np.testing.assert_allclose(distance, [[0, 10, 10], [10, 0, 10]])
+    assert not failed.any()
+    assert len(calls) == 2
+
+
+def test_papago_n2mt_many_keeps_completed_batches(tmp_path):
+    memory = TranslationMemory(str(tmp_path / "tm.sqlite"))
+    handler = body_handler(papago_handler(fail=("bad",), merge=("bb",)))
+
+    async def main():
+        async with AsyncNaver("id", "secret", transport=fake_transport(handler)) as api:
+            assert await api.papago_n2mt_many("ko", "en", ["aa", "bb", "aa"]) == ["AA", "BB", "AA"]
+            await api.papago_n2mt_many("ko", "en", ["aa", "bb", "bad", "cc"], max_chars=3, memory=memory)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        run(main())
+    assert memory.get_many("ko", "en", ["aa", "bb", "bad", "cc"]) == {"aa": "AA", "bb": "BB", "cc": "CC"}
+
+
+def test_clova_summary_long_reduces_parts():
+    contents = []
+
+    def handler(request):
+        content = json.loads(request.content)["document"]["content"]
+        contents.append(content)
+        return 200, {"summary": content.split(".")[0] + "."}
+
+    text = " ".join(f"문장 {i}번은 요약 테스트용입니다." for i in range(6))
+
+    async def main():
+        async with AsyncNaverCloudPlatform("id", "secret", transport=fake_transport(handler)) as api:
+            return await api.clova_summary_many([text, "짧은 문서."], max_chars=40)
+
+    long, short = run(main())
+    assert long == {"summary": "문장 0번은 요약 테스트용입니다."}
+    assert short == {"summary": "짧은 문서."}
+    assert len(contents) == 7
+
+
+def test_iter_enriched_places_reports_non_2xx_replies():
+    async def main():
+        async with AsyncMap(transport=fake_transport(places_handler)) as api:
+            records = [r async for r in api.iter_enriched_places(["ok", "bad"], max_workers=2)]
+            frame = await api.enrich_places(["ok"])
+            return api, records, frame
+
+    api, records, frame = run(main())
+    assert by_status(records) == [("1", "OK"), ("2", "HTTP 429"), ("bad", "HTTP 429")]
+    assert api.enriched_ids == {"1"}
+    assert frame["status"].tolist() == ["HTTP 429"]
+
+
+def test_crawl_places_retries_and_reports_tiles():
+    handler, attempts = tiles_handler()
+
+    async def main():
+        async with AsyncMap(transport=fake_transport(body_handler(handler))) as api:
+            return await api.crawl_places("카페", (0, 0, 4, 4), max_depth=1, retries=1)
+
+    with pytest.warns(RuntimeWarning):
+        df = run(main())
+    assert sorted(df["id"]) == ["(0.0, 0.0)", "(2.0, 0.0)", "(2.0, 2.0)", "a"]
+    assert df.attrs["failed_tiles"] == [(0.0, 2.0, 2.0, 4.0)]
+    assert df.attrs["saturated_tiles"] == [(2.0, 2.0, 4.0, 4.0)]
+
+
+def test_transit_isochrone_samples_grid():
+    def handler(request):
+        lon, lat = (float(v) for v in query(request)["goal"].split(","))
+        return 200, {"paths": [{"duration": abs(lon - 127.0) * 1000 + abs(lat - 37.5) * 1000}]}
+
+    async def main():
+        async with AsyncMap(transport=fake_transport(handler)) as api:
+            return await api.transit_isochrone((127.0, 37.5), minutes=(25,), radius_km=2, size=3)
+
+    result = run(main())
+    assert result["duration"].shape == (3, 3)
+    assert result["duration"][1, 1] == 0
+    assert result["masks"][25].sum() == 5
+
+
+def test_export_search_resumes_after_interruption(tmp_path):
+    path = str(tmp_path / "out.jsonl")
+    calls = []
+
+    def flaky(request):
+        # 201 페이지의 첫 요청만 실패
+        if query(request)["start"] == "201" and 201 not in calls:
+            calls.append(201)
+            return 500, {}
+        return search_handler(250, calls)(request)
+
+    async def main():
+        async with AsyncNaver("id", "secret", transport=fake_transport(flaky)) as api:
+            with pytest.raises(httpx.HTTPStatusError):
+                await api.export_search("blog", "q", JSONLSink(path), prefetch=1)
+            return await api.export_search("blog", "q", JSONLSink(path), prefetch=1)
+
+    assert run(main()) == 50
+    assert calls == [1, 101, 201, 201]
+    with open(path, encoding="utf-8") as f:
+        assert len({json.loads(line)["title"] for line in f}) == 250
+
+
+def test_export_datalab_skips_written_jobs(tmp_path):
+    dates = pd.date_range("2022-01-01", "2022-01-10")
+    truth = {name: np.arange(1, 11) * (i + 1.0) for i, name in enumerate("ab")}
+    jobs = {name: {"startDate": "2022-01-01", "endDate": "2022-01-10", "timeUnit": "date",
+                   "keywordGroups": groups(name)} for name in "ab"}
+    sink = JSONLSink(str(tmp_path / "out.jsonl"))
+    sink.write("datalab:search:a", [])
+
+    async def main():
+        transport = fake_transport(body_handler(datalab_handler(truth, dates)))
+        async with AsyncNaver("id", "secret", transport=transport) as api:
+            return await api.export_datalab("search", jobs, sink)
+
+    assert run(main()) == 10
+    with open(tmp_path / "out.jsonl", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert {r["job"] for r in records} == {"b"}
+    assert records[-1] == {"job": "b", "날짜": "2022-01-10", "label": "b", "ratio": 100.0}
+
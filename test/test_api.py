@@ -0,0 +1,280 @@
+import json
+from urllib.parse import parse_qs, urlsplit
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from PyNaver import Map, Naver, TranslationMemory
+from PyNaver.api import _route_legs
+
+
+class FakeAdapter(BaseAdapter):
+    """
+    handler(request) -> (status, body)로 응답하는 requests 어댑터
+    """
+
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+        self.calls = []
+
+    def send(self, request, **kwargs):
+        self.calls.append(request)
+        status, body = self.handler(request)
+        res = requests.Response()
+        res.status_code = status
+        res.url = request.url
+        res.request = request
+        res.headers["Content-Type"] = "application/json"
+        res._content = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        return res
+
+    def close(self):
+        pass
+
+
+def fake_session(handler):
+    session = requests.Session()
+    adapter = FakeAdapter(handler)
+    session.mount("https://", adapter)
+    return session, adapter
+
+
+def fake_naver(handler):
+    session, adapter = fake_session(handler)
+    return Naver("id", "secret", session=session), adapter
+
+
+def datalab_handler(truth, dates):
+    # 요청 구간과 그룹 안에서 최댓값을 100으로 맞추는 데이터랩 응답
+    def handler(request):
+        body = json.loads(request.body)
+        mask = (dates >= body["startDate"]) & (dates <= body["endDate"])
+        names = [g["groupName"] for g in body["keywordGroups"]]
+        peak = max(truth[name][mask].max() for name in names)
+        return 200, {"results": [{
+            "title": name,
+            "data": [{"period": d.strftime("%Y-%m-%d"), "ratio": v / peak * 100}
+                     for d, v in zip(dates[mask], truth[name][mask])],
+        } for name in names]}
+    return handler
+
+
+def groups(names):
+    return [{"groupName": name, "keywords": [name]} for name in names]
+
+
+def expected(truth, names, dates):
+    frame = pd.DataFrame({name: truth[name] for name in names}, index=dates)
+    return frame / frame.values.max() * 100
+
+
+def test_datalab_search_many_rescales_on_anchor():
+    dates = pd.date_range("2022-01-01", "2022-01-10")
+    truth = {name: np.arange(1, 11) * (i + 1.0) for i, name in enumerate("abcdefg")}
+    api, adapter = fake_naver(datalab_handler(truth, dates))
+
+    df = api.datalab_search_many("2022-01-01", "2022-01-10", "date", groups("abcdefg"),
+                                 anchor="c", chunk_size=3)
+
+    assert len(adapter.calls) == 3
+    assert all(json.loads(c.body)["keywordGroups"][0]["groupName"] == "c" for c in adapter.calls)
+    assert list(df.columns) == list("abcdefg")
+    np.testing.assert_allclose(df.values, expected(truth, "abcdefg", dates).values)
+
+
+def test_datalab_search_many_unknown_anchor():
+    api, adapter = fake_naver(lambda request: (200, {"results": []}))
+
+    with pytest.raises(ValueError, match="'z'"):
+        api.datalab_search_many("2022-01-01", "2022-01-10", "date", groups("ab"), anchor="z")
+    assert not adapter.calls
+
+
+def test_datalab_windowed_stitches_windows():
+    dates = pd.date_range("2020-01-01", "2021-12-31")
+    truth = {"a": np.linspace(1, 50, len(dates)), "b": np.linspace(30, 2, len(dates))}
+    api, adapter = fake_naver(datalab_handler(truth, dates))
+
+    df = api.datalab_windowed("search", "2020-01-01", "2021-12-31", "date", groups("ab"),
+                              window_days=200, overlap_days=20)
+
+    assert len(adapter.calls) == 4
+    assert list(df.columns) == ["a", "b"]
+    np.testing.assert_allclose(df.values, expected(truth, "ab", dates).values)
+
+
+@pytest.mark.parametrize("timeUnit, overlap_days", [
+    ("date", 0),
+    ("date", 200),
+    ("week", 28),
+])
+def test_datalab_windowed_rejects_invalid_windows(timeUnit, overlap_days):
+    api, adapter = fake_naver(lambda request: (200, {"results": []}))
+
+    with pytest.raises(ValueError):
+        api.datalab_windowed("search", "2020-01-01", "2021-12-31", timeUnit, groups("ab"),
+                             window_days=200, overlap_days=overlap_days)
+    assert not adapter.calls
+
+
+def test_datalab_windowed_requires_common_dates():
+    dates = pd.date_range("2020-01-01", "2020-01-20")
+    truth = {"a": np.arange(1.0, 21.0)}
+    handler = datalab_handler(truth, dates)
+
+    def sparse(request):
+        # 두 번째 구간은 겹치는 날짜 없이 응답
+        status, body = handler(request)
+        if json.loads(request.body)["startDate"] != "2020-01-01":
+            for result in body["results"]:
+                result["data"] = [d for d in result["data"] if d["period"] > "2020-01-10"]
+        return status, body
+
+    api, adapter = fake_naver(sparse)
+
+    with pytest.raises(ValueError, match="겹치는 구간"):
+        api.datalab_windowed("search", "2020-01-01", "2020-01-20", "date", groups("a"),
+                             window_days=10, overlap_days=2)
+
+
+def route(summary, code=0, option="traoptimal"):
+    return {"code": code, "route": {option: [{"summary": summary}]}}
+
+
+def test_route_legs_splits_waypoints():
+    result = route({
+        "duration": 600000, "distance": 9000,
+        "waypoints": [{"duration": 120000, "distance": 2000},
+                      {"duration": 180000, "distance": 3000}],
+    })
+
+    assert _route_legs(result, "traoptimal", 3) == [(120.0, 2000), (180.0, 3000), (300.0, 4000)]
+
+
+def test_route_legs_without_waypoints():
+    result = route({"duration": 60000, "distance": 500})
+
+    assert _route_legs(result, "traoptimal", 1) == [(60.0, 500)]
+
+
+@pytest.mark.parametrize("result, count", [
+    (route({"duration": 60000, "distance": 500}, code=1), 1),
+    (route({"duration": 60000, "distance": 500}), 2),
+    (None, 1),
+])
+def test_route_legs_rejects_unusable_results(result, count):
+    assert _route_legs(result, "traoptimal", count) is None
+
+
+def papago_handler(fail=(), merge=()):
+    # 텍스트를 대문자로 번역하고, merge에 포함된 텍스트는 앞 줄과 합쳐 줄 수를 바꿈
+    def handler(request):
+        text = json.loads(request.body)["text"]
+        if any(t in text for t in fail):
+            return 500, {"errorMessage": "error"}
+        lines = text.split("\n")
+        out = [lines[0]]
+        for line in lines[1:]:
+            if line in merge:
+                out[-1] += " " + line
+            else:
+                out.append(line)
+        return 200, {"message": {"result": {"translatedText": "\n".join(out).upper()}}}
+    return handler
+
+
+def test_papago_n2mt_many_joins_and_splits_lines():
+    api, adapter = fake_naver(papago_handler())
+    texts = ["abc", "def", "abc", "", None, "ghi"]
+
+    result = api.papago_n2mt_many("ko", "en", texts)
+
+    assert result == ["ABC", "DEF", "ABC", "", None, "GHI"]
+    assert len(adapter.calls) == 1
+    assert json.loads(adapter.calls[0].body)["text"] == "abc\ndef\nghi"
+
+
+def test_papago_n2mt_many_falls_back_per_text():
+    api, adapter = fake_naver(papago_handler(merge=("def",)))
+    texts = pd.Series(["abc", "def", "ghi"], index=[10, 20, 30])
+
+    result = api.papago_n2mt_many("ko", "en", texts)
+
+    assert result.tolist() == ["ABC", "DEF", "GHI"]
+    assert result.index.tolist() == [10, 20, 30]
+    assert len(adapter.calls) == 4
+
+
+def test_papago_n2mt_many_keeps_completed_batches(tmp_path):
+    api, adapter = fake_naver(papago_handler(fail=("bad",)))
+    memory = TranslationMemory(str(tmp_path / "tm.sqlite"))
+
+    with pytest.raises(requests.HTTPError):
+        api.papago_n2mt_many("ko", "en", ["aa", "bb", "bad", "cc"], max_chars=3, memory=memory)
+
+    assert memory.get_many("ko", "en", ["aa", "bb", "bad", "cc"]) == {"aa": "AA", "bb": "BB", "cc": "CC"}
+
+
+def places_handler(request):
+    # 검색어 bad와 장소 2는 429로 응답
+    url = str(request.url)
+    if "/sites/summary/" in url:
+        site_id = url.split("/sites/summary/")[1].split("?")[0]
+        return (429, {"error": "throttled"}) if site_id == "2" else (200, {"name": f"place {site_id}"})
+    if "query=bad" in url:
+        return 429, {"error": "throttled"}
+    return 200, {"result": {"place": {"list": [{"id": "1"}, {"id": "2"}]}}}
+
+
+def by_status(records):
+    return sorted((r.get("id") or r["query"], r["status"]) for r in records)
+
+
+def test_iter_enriched_places_reports_non_2xx_replies():
+    session, adapter = fake_session(places_handler)
+    api = Map(session=session)
+
+    records = list(api.iter_enriched_places(["ok", "bad", "ok"], max_workers=2))
+
+    assert by_status(records) == [("1", "OK"), ("2", "HTTP 429"), ("bad", "HTTP 429")]
+    assert next(r for r in records if r.get("id") == "2")["summary"] is None
+    assert api.enriched_ids == {"1"}
+    assert [r["status"] for r in api.iter_enriched_places(["ok"])] == ["HTTP 429"]
+
+
+def tiles_handler():
+    # 경계의 최소 좌표로 타일을 구분하고, (2, 0) 타일은 처음 한 번, (0, 2) 타일은 항상 실패
+    attempts = []
+
+    def handler(request):
+        boundary = parse_qs(urlsplit(request.url).query)["boundary"][0]
+        min_x, min_y, max_x, _ = (float(v) for v in boundary.split(";"))
+        tile = (min_x, min_y)
+        attempts.append(tile)
+        if max_x - min_x == 4:
+            return 200, {"result": {"place": {"list": [{"id": "a"}], "totalCount": 10}}}
+        if tile == (2.0, 0.0) and attempts.count(tile) == 1:
+            return 500, {}
+        if tile == (0.0, 2.0):
+            return 503, {}
+        total = 5 if tile == (2.0, 2.0) else 1
+        return 200, {"result": {"place": {"list": [{"id": f"{tile}"}], "totalCount": total}}}
+    return handler, attempts
+
+
+def test_crawl_places_retries_and_reports_tiles():
+    handler, attempts = tiles_handler()
+    session, _ = fake_session(handler)
+    api = Map(session=session)
+
+    with pytest.warns(RuntimeWarning) as record:
+        df = api.crawl_places("카페", (0, 0, 4, 4), max_depth=1, retries=1)
+
+    assert sorted(df["id"]) == ["(0.0, 0.0)", "(2.0, 0.0)", "(2.0, 2.0)", "a"]
+    assert df.attrs["failed_tiles"] == [(0.0, 2.0, 2.0, 4.0)]
+    assert df.attrs["saturated_tiles"] == [(2.0, 2.0, 4.0, 4.0)]
+    assert attempts.count((0.0, 2.0)) == 2
+    assert len(record) == 2
+
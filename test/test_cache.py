@@ -0,0 +1,94 @@
+import json
+import numpy as np
+from datetime import date, timedelta
+from PyNaver import LRUCache, Map, NaverCloudPlatform, ResponseCache
+from test_api import fake_session
+
+
+def test_ttl_lookup_order(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), ttls={
+        "sites_summary": None,
+        "geocoding": 60,
+        "/v5/api/search": 30,
+        "maps": 600,
+    })
+
+    assert cache.ttl_for("https://map.naver.com/v5/api/sites/summary/123", endpoint="sites_summary") is None
+    assert cache.ttl_for("https://map.naver.com/v5/api/search", endpoint="search") == 30
+    assert cache.ttl_for("https://naveropenapi.apigw.ntruss.com/map-geocode/v2/geocode",
+                         endpoint="geocoding") == 60
+    assert cache.ttl_for("https://naveropenapi.apigw.ntruss.com/map-reversegeocode/v2/gc",
+                         endpoint="reverse_geocoding") == 600
+    assert cache.ttl_for("https://openapi.naver.com/v1/search/blog.json", endpoint="search_blog") == 600
+
+
+def test_family_names_are_not_endpoint_names(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), ttls={"search": 5})
+
+    assert cache.ttl_for("https://map.naver.com/v5/api/search", endpoint="search") == 86400
+    assert cache.ttl_for("https://openapi.naver.com/v1/search/news.json", endpoint="search_news") == 5
+
+
+def test_past_datalab_ranges_never_expire(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    url = "https://openapi.naver.com/v1/datalab/search"
+    past = json.dumps({"endDate": (date.today() - timedelta(days=1)).isoformat()})
+    today = json.dumps({"endDate": date.today().isoformat()})
+
+    assert cache.ttl_for(url, past, "datalab_search") is None
+    assert cache.ttl_for(url, today, "datalab_search") == 3600
+
+
+def expiries(cache):
+    return sorted(row[0] is None for row in cache.conn.execute("SELECT expires FROM responses"))
+
+
+def test_clients_pass_endpoint_names(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), ttls={"sites_summary": None, "map": 60})
+    session, _ = fake_session(lambda request: (200, {"id": "1"}))
+    api = Map(session=session, cache=cache)
+
+    api.sites_summary("1")
+    api.search("카페")
+    assert expiries(cache) == [False, True]
+
+    ncp_cache = ResponseCache(str(tmp_path / "ncp.sqlite"), ttls={"geocoding": None})
+    session, _ = fake_session(lambda request: (200, {"addresses": [], "results": []}))
+    ncp = NaverCloudPlatform("id", "secret", session=session, cache=ncp_cache)
+
+    ncp.geocoding("서울")
+    ncp.reverse_geocoding("127.1,37.5")
+    assert expiries(ncp_cache) == [False, True]
+
+
+def test_lru_cache_entries_expire(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("PyNaver.cache.time.monotonic", lambda: now[0])
+    cache = LRUCache(ttl=60)
+
+    cache.set("a", 1, cache.ttl_for("https://map.naver.com/v5/api/search"))
+    cache.set("b", 2, None)
+    now[0] += 61
+
+    assert cache.get("a") is None
+    assert cache.get("b") == (2,)
+    assert cache.stats()["size"] == 1
+
+
+def test_transit_results_are_cached_only_when_opted_in(tmp_path):
+    session, adapter = fake_session(lambda request: (200, {"paths": [{"duration": 30}]}))
+
+    api = Map(session=session)
+    api.transit_directions_point_to_point("1,1", "2,2")
+    api.transit_directions_point_to_point("1,1", "2,2")
+    assert len(adapter.calls) == 2
+
+    api = Map(session=session, transit_cache=LRUCache(ttl=600))
+    np.testing.assert_allclose(api.transit_matrix(["1,1"], ["2,2", "1,1"]), [[30, 0]])
+    api.transit_directions_point_to_point("1,1", "2,2")
+    assert len(adapter.calls) == 3
+
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    assert cache.ttl_for("https://map.naver.com/v5/api/transit/directions/point-to-point",
+                         endpoint="transit_directions_point_to_point") == 600
+
@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import PyNaver\n"
+    "elapsed = time.perf_counter() - start\n"
+    "print(elapsed, [m for m in ('pandas', 'numpy', 'httpx') if m in sys.modules])\n"
+)
+
+# benchmarks/import_time.py의 기본 기준과 같은 값
+MAX_MS = 300
+
+
+def import_pynaver():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    out = subprocess.run([sys.executable, "-c", PROBE], env=env, check=True,
+                         capture_output=True, text=True).stdout
+    elapsed, heavy = out.split(" ", 1)
+    return float(elapsed) * 1000, heavy.strip()
+
+
+def test_import_skips_heavy_modules_and_stays_fast():
+    results = [import_pynaver() for _ in range(3)]
+
+    assert {heavy for _, heavy in results} == {"[]"}
+    assert min(ms for ms, _ in results) < MAX_MS
@@ -0,0 +1,131 @@
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from PyNaver import CircuitBreaker, CircuitOpenError, RetryPolicy, Transport
+
+
+class ScriptedAdapter(BaseAdapter):
+    """
+    미리 정한 순서대로 (상태 코드, 헤더) 응답을 돌려주거나 예외를 발생시키는 어댑터
+    """
+
+    def __init__(self, *steps):
+        super().__init__()
+        self.steps = list(steps)
+        self.calls = 0
+
+    def send(self, request, **kwargs):
+        self.calls += 1
+        step = self.steps.pop(0) if len(self.steps) > 1 else self.steps[0]
+        if isinstance(step, BaseException):
+            raise step
+        status, headers = step
+        res = requests.Response()
+        res.status_code = status
+        res.url = request.url
+        res.headers.update(headers)
+        res._content = b"{}"
+        return res
+
+    def close(self):
+        pass
+
+
+URL = "https://openapi.naver.com/v1/search/blog.json"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr("PyNaver.transport.time.sleep", delays.append)
+    return delays
+
+
+def test_retry_after_is_honoured(sleeps):
+    adapter = ScriptedAdapter((429, {"Retry-After": "7"}), (200, {}))
+    transport = Transport(adapter=adapter, retry=RetryPolicy(total=3))
+
+    assert transport.request("GET", URL).status_code == 200
+    assert adapter.calls == 2
+    assert sleeps == [7.0]
+
+
+def test_retry_after_is_capped(sleeps):
+    adapter = ScriptedAdapter((503, {"Retry-After": "120"}), (200, {}))
+    transport = Transport(adapter=adapter, retry=RetryPolicy(max_backoff=5))
+
+    transport.request("GET", URL)
+    assert sleeps == [5]
+
+
+def test_retries_until_success(sleeps):
+    adapter = ScriptedAdapter((429, {}), (503, {}), (200, {}))
+    transport = Transport(adapter=adapter, retry=RetryPolicy(total=3, backoff_factor=0.5))
+
+    assert transport.request("GET", URL).status_code == 200
+    assert adapter.calls == 3
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1.0
+
+
+def test_retries_give_up_after_total(sleeps):
+    adapter = ScriptedAdapter((503, {}))
+    transport = Transport(adapter=adapter, retry=RetryPolicy(total=2))
+
+    assert transport.request("GET", URL).status_code == 503
+    assert adapter.calls == 3
+
+
+def test_connection_errors_are_retried(sleeps):
+    adapter = ScriptedAdapter(requests.ConnectionError("reset"), (200, {}))
+    transport = Transport(adapter=adapter, retry=RetryPolicy())
+
+    assert transport.request("GET", URL).status_code == 200
+    assert adapter.calls == 2
+
+
+def test_breaker_opens_at_threshold():
+    adapter = ScriptedAdapter((500, {}))
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    transport = Transport(adapter=adapter, circuit_breaker=breaker)
+
+    for _ in range(2):
+        transport.request("GET", URL)
+    assert "openapi.naver.com" not in breaker.opened_at
+    transport.request("GET", URL)
+
+    with pytest.raises(CircuitOpenError):
+        transport.request("GET", URL)
+    assert adapter.calls == 3
+
+
+def test_breaker_closes_after_successful_probe():
+    adapter = ScriptedAdapter((500, {}), (200, {}))
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    transport = Transport(adapter=adapter, circuit_breaker=breaker)
+
+    transport.request("GET", URL)
+    assert transport.request("GET", URL).status_code == 200
+    assert not breaker.opened_at and not breaker.probing
+
+
+@pytest.mark.parametrize("error, failed", [
+    (requests.exceptions.ChunkedEncodingError("truncated"), True),
+    (requests.TooManyRedirects("loop"), True),
+    (RuntimeError("unexpected"), False),
+    (KeyboardInterrupt(), False),
+])
+def test_breaker_probe_released_on_unexpected_exception(error, failed):
+    adapter = ScriptedAdapter((500, {}), error, (200, {}))
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    transport = Transport(adapter=adapter, circuit_breaker=breaker)
+    transport.request("GET", URL)
+    opened_at = breaker.opened_at["openapi.naver.com"]
+
+    with pytest.raises(type(error)):
+        transport.request("GET", URL)
+
+    assert not breaker.probing
+    assert (breaker.opened_at["openapi.naver.com"] > opened_at) is failed
+    assert transport.request("GET", URL).status_code == 200
+    assert not breaker.opened_at
@@ -0,0 +1,56 @@
+import json
+from urllib.parse import parse_qs, urlsplit
+import pandas as pd
+import pytest
+import requests
+from PyNaver import CSVSink, JSONLSink, ParquetSink
+from test_api import fake_naver
+
+
+def pages_handler(total, calls, fail=()):
+    # start가 fail에 포함된 페이지는 500으로 응답
+    def handler(request):
+        q = {k: v[-1] for k, v in parse_qs(urlsplit(request.url).query).items()}
+        start, display = int(q["start"]), int(q["display"])
+        calls.append(start)
+        if start in fail:
+            return 500, {}
+        items = [{"title": f"{q['query']} {i}", "link": f"https://blog.naver.com/{i}"}
+                 for i in range(start, min(start + display, total + 1))]
+        return 200, {"total": total, "start": start, "display": display, "items": items}
+    return handler
+
+
+def read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line)["title"] for line in f]
+
+
+SINKS = {
+    "jsonl": (JSONLSink, "out.jsonl", read_jsonl),
+    "csv": (CSVSink, "out.csv", lambda path: pd.read_csv(path)["title"].tolist()),
+    "parquet": (ParquetSink, "out", lambda path: pd.read_parquet(path)["title"].tolist()),
+}
+
+
+@pytest.mark.parametrize("kind", SINKS)
+def test_export_search_resumes_after_interruption(tmp_path, kind):
+    sink_type, name, read = SINKS[kind]
+    path = str(tmp_path / name)
+    calls = []
+    api, _ = fake_naver(pages_handler(250, calls, fail=(201,)))
+
+    with pytest.raises(requests.HTTPError):
+        api.export_search("blog", "q", sink_type(path), prefetch=1, sort="sim")
+    assert sorted(read(path)) == sorted(f"q {i}" for i in range(1, 201))
+
+    calls.clear()
+    api, _ = fake_naver(pages_handler(250, calls))
+    assert api.export_search("blog", "q", sink_type(path), prefetch=1, sort="sim") == 50
+    assert calls == [201]
+    assert sorted(read(path)) == sorted(f"q {i}" for i in range(1, 251))
+
+    calls.clear()
+    api.export_search("blog", "q", sink_type(path), limit=100, prefetch=1, sort="date")
+    api.export_search("blog", "q", sink_type(path), display=50, limit=100, prefetch=1, sort="sim")
+    assert calls == [1, 1, 51]